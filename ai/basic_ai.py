@@ -10,6 +10,8 @@ Simple AI that makes fundamental gameplay decisions:
 
 import random
 
+from engine.playability import evaluate_hand
+
 
 class BasicAI:
     """Basic AI player implementation for MTG Commander.
@@ -62,10 +64,9 @@ class BasicAI:
             game.cast_spell(self.pid, player.commander)
 
         # 4. Cast strongest affordable creature
-        affordable_creatures = [
-            card for card in player.hand 
-            if "Creature" in card.types and card.mana_cost <= player.total_mana
-        ]
+        # One hand evaluation per decision; only a cast changes pool or board
+        affordable = evaluate_hand(player, game).playable()
+        affordable_creatures = [card for card in affordable if "Creature" in card.types]
         if affordable_creatures:
             # Sort by power + toughness (descending)
             affordable_creatures.sort(
@@ -73,11 +74,12 @@ class BasicAI:
                 reverse=True
             )
             game.cast_spell(self.pid, affordable_creatures[0])
+            affordable = evaluate_hand(player, game).playable()
 
         # 5. Cast a random affordable sorcery
         affordable_sorceries = [
-            card for card in player.hand 
-            if "Sorcery" in card.types and card.mana_cost <= player.total_mana
+            card for card in affordable
+            if "Sorcery" in card.types
         ]
         if affordable_sorceries:
             chosen_sorcery = random.choice(affordable_sorceries)
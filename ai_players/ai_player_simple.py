@@ -1,17 +1,10 @@
 import random
-from engine.mana import parse_mana_cost
+from engine.mana import card_cost
+from engine.playability import evaluate_hand
 
 def enhance_ai_controllers(game, ai_controllers):
     def card_total_cost(card):
-        cost_dict = parse_mana_cost(getattr(card, 'mana_cost_str', ''))
-        if not cost_dict:
-            if isinstance(card.mana_cost, int):
-                return card.mana_cost
-            try:
-                return int(card.mana_cost)
-            except Exception:
-                return 0
-        return sum(cost_dict.values())
+        return card_cost(card).mana_value
 
     def available_untapped_lands(player):
         lands = []
@@ -72,7 +65,7 @@ def enhance_ai_controllers(game, ai_controllers):
         progress = True
         while progress and attempts < 20:
             attempts += 1
-            pool = [c for c in list(player.hand)
+            pool = [c for c in evaluate_hand(player, game).playable()
                     if 'Land' not in c.types and any(t in c.types for t in ('Creature','Enchantment','Artifact'))]
             if not pool: break
             pool.sort(key=card_total_cost)
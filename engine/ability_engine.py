@@ -13,7 +13,7 @@ This module implements a complete ability system according to MTG Comprehensive
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Callable, Any, Union
+from typing import Dict, Iterable, List, Set, Optional, Callable, Any, Union
 from enum import Enum
 import re
 from collections import defaultdict, deque
@@ -23,6 +23,7 @@ from .keywords import (
     parse_ability, is_triggered_ability, is_activated_ability, is_static_ability
 )
 from .enhanced_keywords import KeywordProcessor, extract_card_keywords
+from .parse_cache import cached_parse
 
 
 class AbilityType(Enum):
@@ -70,7 +71,7 @@ class TriggerCondition(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class TriggerEvent:
     """Represents a game event that can trigger abilities"""
     condition: TriggerCondition
@@ -81,7 +82,7 @@ class TriggerEvent:
     timestamp: float = 0.0      # When the event occurred
 
 
-@dataclass 
+@dataclass(slots=True)
 class AbilityInstance:
     """A specific instance of an ability on the stack or in effect"""
     source_card: Any = None             # Card that has this ability
@@ -108,9 +109,22 @@ class AbilityEngine:
         self.activated_abilities: Dict[str, List[AbilityInstance]] = defaultdict(list)
         
         # Event system
-        self.trigger_listeners: Dict[TriggerCondition, List[Callable]] = defaultdict(list)
+        # Listeners are indexed by condition, then by the key an event must
+        # carry to match them: ('card', card id) for triggers on their own
+        # source card, ('controller', player) for per-player triggers, None
+        # for listeners that see every event of that condition.
+        self.trigger_listeners: Dict[TriggerCondition, Dict[Any, List[Callable]]] = defaultdict(dict)
+        # id(card) -> [(condition, key, listener)] for that card's triggers,
+        # and the subset currently dormant because the card is off the battlefield
+        self._card_listeners: Dict[int, List[tuple]] = {}
+        self._dormant_cards: Set[int] = set()
         self.pending_events: deque = deque()
-        self.triggered_queue: List[AbilityInstance] = []
+        self.triggered_queue: deque = deque()   # AbilityInstance, in resolution order
+        self._trigger_seq = 0
+        self._staged_triggers: Optional[List[AbilityInstance]] = None
+        # Max triggers resolved per process_triggered_abilities call (None = drain all);
+        # lets a UI interleave long cascades with repaints
+        self.tick_budget: Optional[int] = None
         
         # Stack for triggered/activated abilities (separate from spell stack)
         self.ability_stack: List[AbilityInstance] = []
@@ -125,6 +139,10 @@ class AbilityEngine:
         self.effect_handlers: Dict[str, Callable] = {}
         
         self._register_default_handlers()
+
+        zones = getattr(game_state, 'zones', None)
+        if zones is not None:
+            zones.watch_battlefield(self._on_battlefield_change)
     
     def _register_default_handlers(self):
         """Register default handlers for common abilities"""
@@ -183,7 +201,8 @@ class AbilityEngine:
             return False
         
         # Parse abilities from card text
-        abilities = self._parse_card_abilities(card.text)
+        abilities = cached_parse('abilities', getattr(card, 'name', ''), card.text,
+                                 self._parse_card_abilities)
         
         if not abilities:
             return False
@@ -378,25 +397,69 @@ class AbilityEngine:
         # For now, create a generic static ability
         return Ability(kind='static', raw_text=text)
     
+    # Trigger type -> (condition, event field that must be the source card / controller)
+    _TRIGGER_ROUTES = {
+        'ETB': (TriggerCondition.ENTERS_BATTLEFIELD, 'affected'),
+        'ATTACK': (TriggerCondition.ATTACKS, 'source'),
+        'DEATH': (TriggerCondition.DIES, 'affected'),
+        'UPKEEP': (TriggerCondition.BEGINNING_OF_UPKEEP, 'controller'),
+    }
+
     def _register_trigger_listener(self, instance: AbilityInstance):
         """Register a triggered ability to listen for appropriate events"""
         trigger_type = instance.ability_def.trigger.upper()
+        condition, field_name = self._TRIGGER_ROUTES.get(trigger_type, (TriggerCondition.OTHER, None))
         
-        # Map trigger types to conditions
-        trigger_mapping = {
-            'ETB': TriggerCondition.ENTERS_BATTLEFIELD,
-            'ATTACK': TriggerCondition.ATTACKS,
-            'DEATH': TriggerCondition.DIES,
-            'UPKEEP': TriggerCondition.BEGINNING_OF_UPKEEP,
-        }
-        
-        condition = trigger_mapping.get(trigger_type, TriggerCondition.OTHER)
+        if field_name == 'controller':
+            key = ('controller', instance.controller)
+        elif field_name is not None:
+            key = ('card', getattr(instance.source_card, 'id', None))
+        else:
+            key = None
         
         def listener(event: TriggerEvent):
             if self._should_trigger(instance, event):
                 self._queue_triggered_ability(instance, event)
         
-        self.trigger_listeners[condition].append(listener)
+        card = instance.source_card
+        self._card_listeners.setdefault(id(card), []).append((condition, key, listener))
+        # Triggers only fire while their source is on the battlefield (except LTB)
+        if trigger_type != 'LTB' and self._dormant(card):
+            self._dormant_cards.add(id(card))
+        else:
+            self.trigger_listeners[condition].setdefault(key, []).append(listener)
+
+    def _dormant(self, card) -> bool:
+        zones = getattr(self.game, 'zones', None)
+        return zones is not None and not zones.is_on_battlefield(card)
+
+    def _on_battlefield_change(self, card, entered: bool):
+        """Activate a card's trigger listeners on entering the battlefield, park them on leaving."""
+        registered = self._card_listeners.get(id(card))
+        if not registered:
+            return
+        dormant = id(card) in self._dormant_cards
+        if entered and dormant:
+            self._dormant_cards.discard(id(card))
+            for condition, key, listener in registered:
+                self.trigger_listeners[condition].setdefault(key, []).append(listener)
+        elif not entered and not dormant:
+            self._dormant_cards.add(id(card))
+            for condition, key, listener in registered:
+                self._unregister_listener(condition, key, listener)
+
+    def _unregister_listener(self, condition, key, listener):
+        bucket = self.trigger_listeners[condition].get(key)
+        if bucket and listener in bucket:
+            bucket.remove(listener)
+            if not bucket:
+                del self.trigger_listeners[condition][key]
+
+    def unregister_card(self, card):
+        """Drop every trigger listener belonging to card."""
+        for condition, key, listener in self._card_listeners.pop(id(card), []):
+            self._unregister_listener(condition, key, listener)
+        self._dormant_cards.discard(id(card))
     
     def _should_trigger(self, instance: AbilityInstance, event: TriggerEvent) -> bool:
         """Check if a triggered ability should trigger for an event"""
@@ -433,10 +496,51 @@ class AbilityEngine:
             source_card=instance.source_card,
             ability_def=instance.ability_def,
             controller=instance.controller,
-            timestamp=len(self.triggered_queue)  # Simple timestamp
+            timestamp=self._trigger_seq  # Simple timestamp
         )
+        self._trigger_seq += 1
         
-        self.triggered_queue.append(stack_instance)
+        if self._staged_triggers is not None:
+            self._staged_triggers.append(stack_instance)
+        else:
+            self.triggered_queue.append(stack_instance)
+
+    def queue_simultaneous(self, instances: Iterable[AbilityInstance]):
+        """
+        Queue triggers that fired at the same time. Under APNAP (CR 603.3b)
+        the active player puts theirs on the stack first, so they resolve
+        last: the queue runs from the last player in turn order back to the
+        active player. Each player's triggers keep the order they fired in.
+        """
+        active = getattr(self.game, 'active_player', 0)
+        order = getattr(self.game, 'turn_order', None)
+        if order is not None:
+            ranks = order.rank_from[active]
+            last = len(ranks)
+            key = lambda inst: -(ranks[inst.controller] if 0 <= inst.controller < last else last)
+        else:
+            players = len(getattr(self.game, 'players', ())) or 1
+            key = lambda inst: -((inst.controller - active) % players)
+        self.triggered_queue.extend(sorted(instances, key=key))
+
+    def emit_simultaneous(self, events: Iterable[tuple]):
+        """
+        Emit several events that happen at once (e.g. creatures dying to a
+        board wipe) as (condition, kwargs) pairs; the triggers they cause are
+        queued together in APNAP order (see queue_simultaneous).
+        """
+        outer = self._staged_triggers
+        self._staged_triggers = []
+        try:
+            for condition, kwargs in events:
+                self.emit_event(condition, **kwargs)
+            staged = self._staged_triggers
+        finally:
+            self._staged_triggers = outer
+        if outer is not None:
+            outer.extend(staged)
+        else:
+            self.queue_simultaneous(staged)
     
     def emit_event(self, condition: TriggerCondition, **kwargs):
         """Emit a game event that may trigger abilities"""
@@ -445,18 +549,40 @@ class AbilityEngine:
             **kwargs
         )
         
-        # Notify all listeners for this condition
-        for listener in self.trigger_listeners[condition]:
-            try:
-                listener(event)
-            except Exception as e:
-                print(f"Error in trigger listener: {e}")
-    
-    def process_triggered_abilities(self):
-        """Process all queued triggered abilities"""
-        while self.triggered_queue:
-            instance = self.triggered_queue.pop(0)
-            self._resolve_triggered_ability(instance)
+        # Notify only the listeners whose key this event can match
+        by_key = self.trigger_listeners.get(condition)
+        if not by_key:
+            return
+        keys = [None, ('controller', event.controller)]
+        for obj in (event.affected, event.source):
+            key = ('card', getattr(obj, 'id', None)) if obj is not None else None
+            if key is not None and key not in keys:
+                keys.append(key)
+        for key in keys:
+            for listener in list(by_key.get(key, ())):
+                try:
+                    listener(event)
+                except Exception as e:
+                    print(f"Error in trigger listener: {e}")
+    
+    def process_triggered_abilities(self, budget: Optional[int] = None) -> int:
+        """
+        Resolve queued triggered abilities, at most `budget` of them (default:
+        tick_budget, None meaning all). Returns how many were resolved;
+        anything left stays queued for the next call.
+        """
+        if budget is None:
+            budget = self.tick_budget
+        queue = self.triggered_queue
+        resolved = 0
+        while queue and (budget is None or resolved < budget):
+            self._resolve_triggered_ability(queue.popleft())
+            resolved += 1
+        return resolved
+
+    @property
+    def has_pending_triggers(self) -> bool:
+        return bool(self.triggered_queue)
     
     def _resolve_triggered_ability(self, instance: AbilityInstance):
         """Resolve a triggered ability"""
@@ -547,6 +673,9 @@ class AbilityEngine:
     
     def _is_on_battlefield(self, card) -> bool:
         """Check if a card is on the battlefield"""
+        zones = getattr(self.game, 'zones', None)
+        if zones is not None:
+            return zones.is_on_battlefield(card)
         for player in self.game.players:
             for perm in player.battlefield:
                 if hasattr(perm, 'card') and perm.card == card:
@@ -615,6 +744,9 @@ class AbilityEngine:
     
     def _find_permanent(self, card):
         """Find the permanent for a card"""
+        zones = getattr(self.game, 'zones', None)
+        if zones is not None:
+            return zones.permanent_for(card)
         for player in self.game.players:
             for perm in player.battlefield:
                 if hasattr(perm, 'card') and perm.card == card:
@@ -672,6 +804,12 @@ def emit_game_event(condition: TriggerCondition, **kwargs):
         ability_engine.emit_event(condition, **kwargs)
 
 
+def emit_simultaneous_events(events) -> None:
+    """Emit simultaneous (condition, kwargs) events through the ability engine"""
+    if ability_engine:
+        ability_engine.emit_simultaneous(events)
+
+
 def register_card_abilities(card) -> bool:
     """Register a card's abilities with the ability engine"""
     if ability_engine:
@@ -679,7 +817,8 @@ def register_card_abilities(card) -> bool:
     return False
 
 
-def process_all_triggers():
-    """Process all pending triggered abilities"""
+def process_all_triggers(budget: Optional[int] = None) -> int:
+    """Process pending triggered abilities (up to budget); returns how many resolved"""
     if ability_engine:
-        ability_engine.process_triggered_abilities()
+        return ability_engine.process_triggered_abilities(budget)
+    return 0
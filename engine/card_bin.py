@@ -0,0 +1,217 @@
+"""
+Compact binary card database with mmap-backed lazy record access.
+
+`compile_card_db` converts card_db.json / card_db_full.json into a single
+indexed file (data/cards/card_db.bin). `CardBinDB` maps that file read-only
+and decodes individual card dicts only when they are looked up, so loading
+costs a header read and every simulator worker shares one page-cached copy.
+
+File layout (little endian):
+    header   : magic, version, record count, section offsets / index counts
+    records  : fixed-width entries, 10 x u32 each (offset, length) for
+               id, lower-case name, normalized name, JSON record, display name
+               offsets are relative to the start of the string pool
+    id index : u32 record numbers sorted by UTF-8 id
+    name idx : u32 record numbers sorted by UTF-8 lower-case name
+    norm idx : u32 record numbers sorted by UTF-8 normalized name
+    pool     : UTF-8 strings and compact JSON card records
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+from collections.abc import Mapping
+
+MAGIC = b'MTGCBIN1'
+VERSION = 1
+DEFAULT_BIN_PATH = os.path.join('data', 'cards', 'card_db.bin')
+
+_HEADER = struct.Struct('<8sIIIIIIIIII')   # magic, version, n, rec_off, id_off, n_id, name_off, n_name, norm_off, n_norm, pool_off
+_RECORD = struct.Struct('<10I')
+_U32 = struct.Struct('<I')
+
+# Field positions inside a record entry (offset field; length follows it)
+_F_ID, _F_NAME, _F_NORM, _F_DATA, _F_DISPLAY = 0, 2, 4, 6, 8
+
+_NORMALIZE_RE = re.compile(r'[^a-z0-9]+')
+def _normalize_name(s: str) -> str:
+    return _NORMALIZE_RE.sub(' ', s.lower()).strip()
+
+
+# ---------------- Offline build step ----------------
+def compile_card_db(json_path: str, out_path: str = DEFAULT_BIN_PATH) -> int:
+    """
+    Compile a card JSON file into the binary format. Returns the number of
+    records written. Duplicate keys resolve like the JSON loader's dicts
+    (last card wins).
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+    raw_cards = list(raw.values()) if isinstance(raw, dict) else list(raw)
+    cards = [c for c in raw_cards if isinstance(c, dict) and 'id' in c and 'name' in c]
+
+    pool = bytearray()
+    def _put(b: bytes):
+        off = len(pool)
+        pool.extend(b)
+        return off, len(b)
+
+    records = []
+    id_keys, name_keys, norm_keys = {}, {}, {}
+    for i, c in enumerate(cards):
+        id_b = str(c['id']).encode('utf-8')
+        name_b = c['name'].lower().encode('utf-8')
+        norm_b = _normalize_name(c['name']).encode('utf-8')
+        data_b = json.dumps(c, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        disp_b = c['name'].encode('utf-8')
+        records.append(_put(id_b) + _put(name_b) + _put(norm_b) + _put(data_b) + _put(disp_b))
+        id_keys[id_b] = i
+        name_keys[name_b] = i
+        norm_keys[norm_b] = i
+
+    def _index(keys):
+        return b''.join(_U32.pack(keys[k]) for k in sorted(keys))
+
+    rec_blob = b''.join(_RECORD.pack(*r) for r in records)
+    id_blob, name_blob, norm_blob = _index(id_keys), _index(name_keys), _index(norm_keys)
+    rec_off = _HEADER.size
+    id_off = rec_off + len(rec_blob)
+    name_off = id_off + len(id_blob)
+    norm_off = name_off + len(name_blob)
+    pool_off = norm_off + len(norm_blob)
+    header = _HEADER.pack(MAGIC, VERSION, len(records), rec_off,
+                          id_off, len(id_keys), name_off, len(name_keys),
+                          norm_off, len(norm_keys), pool_off)
+
+    os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+    tmp = out_path + '.tmp'
+    with open(tmp, 'wb') as f:
+        for part in (header, rec_blob, id_blob, name_blob, norm_blob, pool):
+            f.write(part)
+    os.replace(tmp, out_path)
+    return len(records)
+
+
+# ---------------- Loader ----------------
+class CardBinDB:
+    """Read-only view over a compiled card database file."""
+
+    def __init__(self, path: str = DEFAULT_BIN_PATH):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            # The map holds its own handle; nothing else needs the file open
+            self._file.close()
+        if len(self._mm) < _HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: truncated card_db.bin (no header)")
+        (magic, version, self.count, self._rec_off, id_off, n_id, name_off, n_name,
+         norm_off, n_norm, self._pool_off) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a card_db.bin v{VERSION} file")
+        self._cache = {}
+        self.by_id = _IndexView(self, id_off, n_id, _F_ID)
+        self.by_name_lower = _IndexView(self, name_off, n_name, _F_NAME)
+        self.by_norm = _IndexView(self, norm_off, n_norm, _F_NORM)
+
+    def close(self):
+        mm, self._mm = getattr(self, '_mm', None), None
+        if mm is not None:
+            mm.close()
+        self._file.close()
+
+    def _field(self, rec: int, field: int) -> bytes:
+        base = self._rec_off + rec * _RECORD.size + field * 4
+        off, length = struct.unpack_from('<II', self._mm, base)
+        start = self._pool_off + off
+        return self._mm[start:start + length]
+
+    def record(self, rec: int) -> dict:
+        """Materialize (and memoize) the card dict for a record number."""
+        card = self._cache.get(rec)
+        if card is None:
+            card = json.loads(self._field(rec, _F_DATA).decode('utf-8'))
+            self._cache[rec] = card
+        return card
+
+    def names(self):
+        """Sorted distinct card names, decoded without materializing records."""
+        return sorted({self._field(i, _F_DISPLAY).decode('utf-8') for i in range(self.count)})
+
+    def as_tuple(self):
+        """Same shape as card_db.load_card_db(): (by_id, by_name_lower, by_norm, path)."""
+        return self.by_id, self.by_name_lower, self.by_norm, self.path
+
+
+class _IndexView(Mapping):
+    """Mapping over one sorted index; values are decoded on access."""
+
+    def __init__(self, db: CardBinDB, off: int, count: int, field: int):
+        self._db = db
+        self._off = off
+        self._count = count
+        self._field = field
+
+    def _rec_at(self, pos: int) -> int:
+        return _U32.unpack_from(self._db._mm, self._off + pos * 4)[0]
+
+    def _key_at(self, pos: int) -> bytes:
+        return self._db._field(self._rec_at(pos), self._field)
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _find(self, key):
+        kb = str(key).encode('utf-8')
+        pos = self._lower_bound(kb)
+        if pos < self._count and self._key_at(pos) == kb:
+            return self._rec_at(pos)
+        return None
+
+    def __getitem__(self, key):
+        rec = self._find(key)
+        if rec is None:
+            raise KeyError(key)
+        return self._db.record(rec)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for pos in range(self._count):
+            yield self._key_at(pos).decode('utf-8')
+
+    def prefix_items(self, prefix: str):
+        """Yield (key, card) pairs whose key starts with prefix, in key order."""
+        pb = prefix.encode('utf-8')
+        pos = self._lower_bound(pb)
+        while pos < self._count:
+            key = self._key_at(pos)
+            if not key.startswith(pb):
+                break
+            yield key.decode('utf-8'), self._db.record(self._rec_at(pos))
+            pos += 1
+
+
+def bin_is_current(bin_path: str, json_paths) -> bool:
+    """True when bin_path exists and is at least as new as every existing JSON source."""
+    if not os.path.exists(bin_path):
+        return False
+    mtime = os.path.getmtime(bin_path)
+    return all(os.path.getmtime(p) <= mtime for p in json_paths if os.path.exists(p))
+
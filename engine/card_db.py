@@ -3,6 +3,7 @@ import json
 import re
 
 from . import card_sql as _sql
+from . import card_bin as _bin
 
 _NORMALIZE_RE = re.compile(r'[^a-z0-9]+')
 def _normalize_name(s: str) -> str:
@@ -11,11 +12,26 @@ def _normalize_name(s: str) -> str:
 _CARD_DB_CACHE = None   # (by_id, by_name_lower, by_norm, path)
 _CARD_NAME_LIST = None  # cached sorted list of names for deck editor search
 _USE_SQL = False
+_BIN_DB = None         # CardBinDB when data/cards/card_db.bin is in use
 
 def enable_sql():
     global _USE_SQL
     _USE_SQL = True
 
+def _load_bin(json_paths):
+    """Open the compiled binary DB if present and not older than the JSON sources."""
+    global _BIN_DB
+    if not _bin.bin_is_current(_bin.DEFAULT_BIN_PATH, json_paths):
+        return None
+    try:
+        db = _bin.CardBinDB(_bin.DEFAULT_BIN_PATH)
+    except (OSError, ValueError):
+        return None
+    # Views and definitions handed out earlier may still read the old map;
+    # drop our reference and let it close once the last of them is gone.
+    _BIN_DB = db
+    return db
+
 def load_card_db(force: bool = False):  # patched: delegate to SQL if enabled
     global _CARD_DB_CACHE, _CARD_NAME_LIST
     if _USE_SQL and _sql.sql_enabled():
@@ -28,6 +44,12 @@ def load_card_db(force: bool = False):  # patched: delegate to SQL if enabled
         return _CARD_DB_CACHE
     base = os.path.join('data','cards','card_db.json')
     full = os.path.join('data','cards','card_db_full.json')
+    bin_db = _load_bin([full, base])
+    if bin_db is not None:
+        # Lazy mmap-backed views; records are decoded on lookup
+        _CARD_DB_CACHE = bin_db.as_tuple()
+        _CARD_NAME_LIST = None
+        return _CARD_DB_CACHE
     path = full if os.path.exists(full) else base
     with open(path,'r',encoding='utf-8') as f:
         raw = json.load(f)
@@ -49,6 +71,10 @@ def get_card_name_list():
     global _CARD_NAME_LIST
     if _CARD_NAME_LIST is None:
         load_card_db()
+    if _BIN_DB is not None and _CARD_DB_CACHE is not None and _CARD_DB_CACHE[0] is _BIN_DB.by_id:
+        if _CARD_NAME_LIST is None:
+            _CARD_NAME_LIST = _BIN_DB.names()
+        return list(_CARD_NAME_LIST)
     by_id, *_ = load_card_db()
     return sorted({c['name'] for c in by_id.values()})
 
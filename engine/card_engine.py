@@ -1,6 +1,10 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 import re
+import weakref
+from functools import lru_cache
+
+from engine.mana import CostVector, cost_for
 
 # Import layers system for proper power/toughness calculation
 try:
@@ -9,26 +13,168 @@ except ImportError:
     LayersEngine = None
     CharacteristicState = None
 
-@dataclass
+class CardDefinition:
+    """
+    The printed, game-independent characteristics of a card.
+
+    Definitions are immutable and interned: every Forest (or every copy of a
+    card with the same printed values) shares one instance, so a deck of 99
+    cards holds only as many definitions as it has distinct cards. Build them
+    with CardDefinition.intern().
+    """
+
+    __slots__ = ('name', 'types', 'mana_cost', 'power', 'toughness', 'text',
+                 'mana_cost_str', 'color_identity', 'type_set', 'cost', '__weakref__')
+
+    def __init__(self, name, types, mana_cost, power, toughness, text, mana_cost_str, color_identity):
+        setattr_ = object.__setattr__
+        setattr_(self, 'name', name)
+        setattr_(self, 'types', types)
+        setattr_(self, 'mana_cost', mana_cost)
+        setattr_(self, 'power', power)
+        setattr_(self, 'toughness', toughness)
+        setattr_(self, 'text', text)
+        setattr_(self, 'mana_cost_str', mana_cost_str)
+        setattr_(self, 'color_identity', color_identity)
+        setattr_(self, 'type_set', frozenset(types))
+        setattr_(self, 'cost', cost_for(mana_cost_str, mana_cost))   # parsed once per definition
+
+    @classmethod
+    def intern(cls, name: str, types=(), mana_cost: int = 0, power=None, toughness=None,
+               text: str = "", mana_cost_str: str = "", color_identity=()) -> 'CardDefinition':
+        """The shared definition with these values (types/colors may be any iterable)."""
+        key = (name, tuple(types), mana_cost, power, toughness, text or "", mana_cost_str or "",
+               tuple(color_identity or ()))
+        try:
+            definition = _DEFINITIONS.get(key)
+        except TypeError:            # unhashable field value: keep it private to this card
+            return cls(*key)
+        if definition is None:
+            definition = cls(*key)
+            _DEFINITIONS[key] = definition
+        return definition
+
+    def replace(self, **changes) -> 'CardDefinition':
+        """The interned definition equal to this one with some fields changed."""
+        values = {f: getattr(self, f) for f in _DEFINITION_FIELDS}
+        values.update(changes)
+        return CardDefinition.intern(**values)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CardDefinition is immutable; use replace()")
+
+    def __reduce__(self):
+        return (_intern_definition, tuple(getattr(self, f) for f in _DEFINITION_FIELDS))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"CardDefinition(name={self.name!r}, types={self.types!r})"
+
+_DEFINITION_FIELDS = ('name', 'types', 'mana_cost', 'power', 'toughness', 'text',
+                      'mana_cost_str', 'color_identity')
+
+# Live definitions by value; entries go away with the last card using them
+_DEFINITIONS: 'weakref.WeakValueDictionary' = weakref.WeakValueDictionary()
+
+def _intern_definition(*values) -> CardDefinition:
+    return CardDefinition.intern(*values)
+
+class _DefinitionField:
+    """Card attribute stored on its CardDefinition; assigning re-points the card."""
+
+    __slots__ = ('name',)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, card, owner=None):
+        if card is None:
+            return self
+        return getattr(card.definition, self.name)
+
+    def __set__(self, card, value):
+        card.definition = card.definition.replace(**{self.name: value})
+
 class Card:
-    id: str
-    name: str
-    types: List[str]
-    mana_cost: int
-    power: Optional[int] = None
-    toughness: Optional[int] = None
-    text: str = ""
-    mana_cost_str: str = ""  # ADDED: string representation of mana cost
-    is_commander: bool = False
-    color_identity: List[str] = field(default_factory=list)
-    owner_id: int = -1
-    controller_id: int = -1
-    # Note: Only permanents can be tapped per CR 400.3 - tap state moved to Permanent class
-    orientation: int = 0  # UI rotation (0 = untapped, 45 = tapped, 90 = untapped)
-    
-    # Layers system integration
-    _layers_engine: Optional['LayersEngine'] = None
-    
+    """
+    A card object in a game: one physical card (or token) with its owner and
+    controller. Printed characteristics live on a shared CardDefinition and
+    are read through the usual attributes (card.name, card.types, ...).
+    types and color_identity are tuples; assign a new value to change them
+    for this card only. Other attributes (oracle_abilities, keywords, ...)
+    are set per card as before.
+    """
+
+    __slots__ = ('id', 'definition', 'is_commander', 'owner_id', 'controller_id',
+                 'orientation', '_layers_engine', '__dict__')
+
+    name = _DefinitionField()
+    types = _DefinitionField()
+    mana_cost = _DefinitionField()
+    power = _DefinitionField()
+    toughness = _DefinitionField()
+    text = _DefinitionField()
+    mana_cost_str = _DefinitionField()
+    color_identity = _DefinitionField()
+
+    def __init__(self, id: str, name: str, types: List[str], mana_cost: int,
+                 power: Optional[int] = None, toughness: Optional[int] = None,
+                 text: str = "", mana_cost_str: str = "", is_commander: bool = False,
+                 color_identity: Optional[List[str]] = None, owner_id: int = -1,
+                 controller_id: int = -1, orientation: int = 0,
+                 _layers_engine: Optional['LayersEngine'] = None):
+        self.id = id
+        self.definition = CardDefinition.intern(name, types, mana_cost, power, toughness,
+                                                text, mana_cost_str, color_identity)
+        self.is_commander = is_commander
+        self.owner_id = owner_id
+        self.controller_id = controller_id
+        # Note: Only permanents can be tapped per CR 400.3 - tap state moved to Permanent class
+        self.orientation = orientation  # UI rotation (0 = untapped, 45 = tapped, 90 = untapped)
+        # Layers system integration
+        self._layers_engine = _layers_engine
+
+    @classmethod
+    def from_definition(cls, definition: CardDefinition, id: str, owner_id: int = -1,
+                        controller_id: int = -1, is_commander: bool = False) -> 'Card':
+        """A new card object sharing an existing definition."""
+        card = cls.__new__(cls)
+        card.id = id
+        card.definition = definition
+        card.is_commander = is_commander
+        card.owner_id = owner_id
+        card.controller_id = controller_id
+        card.orientation = 0
+        card._layers_engine = None
+        return card
+
+    @property
+    def cost(self) -> CostVector:
+        """Parsed mana cost (engine.mana.CostVector), shared with every copy of this card."""
+        return self.definition.cost
+
+    def _eq_key(self):
+        return (self.id, self.definition, self.is_commander, self.owner_id,
+                self.controller_id, self.orientation, self._layers_engine)
+
+    # Same equality as the former dataclass: field by field, not identity
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._eq_key() == other._eq_key()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (f"Card(id={self.id!r}, name={self.name!r}, types={self.types!r}, "
+                f"mana_cost={self.mana_cost!r}, power={self.power!r}, toughness={self.toughness!r}, "
+                f"owner_id={self.owner_id!r}, controller_id={self.controller_id!r})")
+
     def get_current_power_toughness(self) -> tuple[Optional[int], Optional[int]]:
         """Get current power/toughness after applying all continuous effects"""
         if self._layers_engine and CharacteristicState:
@@ -40,23 +186,46 @@ class Card:
         """Associate this card with a layers engine for proper P/T calculation"""
         self._layers_engine = engine
 
-    #def __hash__(self) -> int:
-        #return hash(self.id)
-
     def is_type(self, t):
-        return t in self.types
+        return t in self.definition.type_set
 
     def set_orientation(self, degrees: int):
         """Set UI orientation for visual feedback only."""
         self.orientation = degrees
 
-@dataclass
+# Permanent attributes whose assignment is reported to the game's ZoneIndex
+_SBA_PERMANENT_FIELDS = frozenset({
+    'card', 'damage', 'damage_marked', 'deathtouch_damage', 'loyalty',
+    'toughness_modifiers', 'attached_to',
+})
+
+@dataclass(slots=True)
 class Permanent:
     """Represents a permanent on the battlefield (CR 110.1)"""
     card: Card
     summoning_sick: bool = True  # CR 302.6 - creatures have summoning sickness
     tapped: bool = False  # CR 106.8 - only permanents can be tapped
     damage_marked: int = 0  # CR 120.3 - damage marked on permanent
+    # Rules state read by state-based actions (CR 704); not part of equality
+    controller_id: Optional[int] = field(default=None, compare=False)  # None: the card's controller
+    damage: int = field(default=0, compare=False)
+    deathtouch_damage: bool = field(default=False, compare=False)
+    loyalty: int = field(default=0, compare=False)
+    toughness_modifiers: int = field(default=0, compare=False)
+    attached_to: Optional['Permanent'] = field(default=None, compare=False, repr=False)
+    # Set by the game's ZoneIndex while this permanent is on the battlefield
+    _zone_index: Optional[object] = field(default=None, init=False, compare=False, repr=False)
+
+    def __setattr__(self, name, value):
+        index = getattr(self, '_zone_index', None)
+        if index is None:
+            object.__setattr__(self, name, value)
+            return
+        index.save_before_write(self)   # snapshot journal (engine/snapshot.py)
+        object.__setattr__(self, name, value)
+        # Report changes that can make a state-based action apply (CR 704)
+        if name in _SBA_PERMANENT_FIELDS:
+            index.notify_change(self, name)
     
     def tap(self):
         """Tap this permanent (CR 701.21a)."""
@@ -110,14 +279,17 @@ def parse_mana_cost_str(cost_str: str) -> Dict[str, int]:
     Parse a mana cost string like '{2}{U}{U/P}{R/W}' into a dict of symbol->count.
     Supports hybrid, phyrexian, snow, X, etc.
     """
+    return dict(_symbol_counts(cost_str)) if cost_str else {}
+
+@lru_cache(maxsize=8192)
+def _symbol_counts(cost_str: str) -> tuple:
     cost = {}
-    if not cost_str:
-        return cost
     for sym in MANA_SYMBOL_RE.findall(cost_str):
         sym = sym.upper()
         cost[sym] = cost.get(sym, 0) + 1
-    return cost
+    return tuple(cost.items())
 
+@lru_cache(maxsize=8192)
 def mana_cost_to_cmc(cost_str: str) -> int:
     """
     Compute converted mana cost (CMC, now called mana value) from a cost string.
@@ -7,8 +7,12 @@ to ensure accurate mana costs, colors, and other properties for proper game mech
 
 import os
 import re
+import copy
+from bisect import bisect_left
 from typing import List, Tuple, Dict, Optional, Any
 from engine.card_engine import Card, mana_cost_to_cmc, parse_mana_cost_str
+from engine import card_db as _card_db
+from engine import card_sql as _card_sql
 from engine.card_db import load_card_db
 from engine.rules_engine import parse_and_attach
 
@@ -213,6 +217,34 @@ def _parse_deck_file(path: str) -> Tuple[List[str], Optional[str]]:
         
     return entries, commander
 
+# Sorted key index for prefix lookups, rebuilt only when the name dict changes
+_NAME_INDEX: Tuple[Optional[dict], List[str]] = (None, [])
+
+def _sorted_names(by_name_lower) -> List[str]:
+    global _NAME_INDEX
+    source, keys = _NAME_INDEX
+    if source is not by_name_lower:
+        keys = sorted(by_name_lower)
+        _NAME_INDEX = (by_name_lower, keys)
+    return keys
+
+def _unique_prefix_match(prefix: str, by_name_lower) -> Optional[Dict[str, Any]]:
+    """Return the card whose lower-case name is the only one starting with prefix."""
+    if hasattr(by_name_lower, 'prefix_items'):   # binary card DB: already sorted on disk
+        matches = []
+        for item in by_name_lower.prefix_items(prefix):
+            matches.append(item)
+            if len(matches) > 1:
+                return None
+        return matches[0][1] if matches else None
+    keys = _sorted_names(by_name_lower)
+    i = bisect_left(keys, prefix)
+    if i >= len(keys) or not keys[i].startswith(prefix):
+        return None
+    if i + 1 < len(keys) and keys[i + 1].startswith(prefix):
+        return None
+    return by_name_lower[keys[i]]
+
 def _resolve_card_data(card_name: str, local_db: Tuple) -> Dict[str, Any]:
     """Resolve card data from local database with optional API enhancement."""
     by_id, by_name_lower, by_norm, _ = local_db
@@ -234,12 +266,11 @@ def _resolve_card_data(card_name: str, local_db: Tuple) -> Dict[str, Any]:
         if normalized in by_norm:
             card_data = by_norm[normalized].copy()
     
-    # 3. Partial name matching
+    # 3. Partial name matching (unique prefix)
     if not card_data:
-        name_lower = card_name.lower()
-        candidates = [card for name, card in by_name_lower.items() if name.startswith(name_lower)]
-        if len(candidates) == 1:
-            card_data = candidates[0].copy()
+        candidate = _unique_prefix_match(card_name.lower(), by_name_lower)
+        if candidate is not None:
+            card_data = candidate.copy()
     
     # 4. If still not found and SDK enabled, try API
     if not card_data and _SDK_ENABLED:
@@ -258,45 +289,86 @@ def _resolve_card_data(card_name: str, local_db: Tuple) -> Dict[str, Any]:
     
     return card_data
 
+def _sql_deck_db(names: List[str]) -> Tuple:
+    """Resolve a deck's names from SQLite in one batch and wrap them as a local_db tuple."""
+    found = _card_sql.fetch_many_by_name(names)
+    by_name_lower = {name.lower(): data for name, data in found.items()}
+    by_id = {data['id']: data for data in found.values() if 'id' in data}
+    return by_id, by_name_lower, {}, 'cards.db'
+
+def _resolve_many(names: List[str], local_db: Tuple) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Resolve each distinct name once; unknown names map to None."""
+    resolved = {}
+    for card_name in dict.fromkeys(names):
+        try:
+            resolved[card_name] = _resolve_card_data(card_name, local_db)
+        except KeyError as e:
+            print(f"⚠️  Skipping unknown card: {e}")
+            resolved[card_name] = None
+    return resolved
+
+def _new_enhancement_engine():
+    """One EnhancedCardEngine shared by every card of a deck load (None if unavailable)."""
+    try:
+        from engine.enhanced_integration import EnhancedCardEngine
+    except ImportError:
+        return None
+    return EnhancedCardEngine()
+
+def _clone_card(prototype: Card) -> Card:
+    """Stamp out another copy of an already-built card (duplicate basics etc.)."""
+    card = copy.copy(prototype)
+    for attr in ('types', 'color_identity', 'oracle_abilities', 'keywords'):
+        value = getattr(card, attr, None)
+        if isinstance(value, (list, dict, set)):
+            setattr(card, attr, type(value)(value))
+    return card
+
 def _build_card_objects(entries: List[str], commander_name: Optional[str], 
                        local_db: Tuple, owner_id: int) -> Tuple[List[Card], Optional[Card]]:
-    """Build Card objects from card names."""
+    """
+    Build Card objects from card names.
+    Names are deduped and resolved once each; every card of the deck shares one
+    enhancement engine, and repeated entries are cloned from the first copy.
+    """
     library_cards = []
     commander_card = None
     
-    # Resolve commander first if specified
-    commander_data = None
-    if commander_name:
-        try:
-            commander_data = _resolve_card_data(commander_name, local_db)
-        except KeyError as e:
-            print(f"⚠️  Commander not found: {e}")
+    resolved = _resolve_many(([commander_name] if commander_name else []) + entries, local_db)
+    commander_data = resolved.get(commander_name) if commander_name else None
+    if commander_name and commander_data is None:
+        print(f"⚠️  Commander not found: {commander_name}")
     
-    # Process library cards
+    enhanced_engine = _new_enhancement_engine()
+    prototypes: Dict[str, Card] = {}
     for card_name in entries:
-        try:
-            card_data = _resolve_card_data(card_name, local_db)
-            
-            # Skip if this is the commander
-            if commander_data and card_data.get('id') == commander_data.get('id'):
-                continue
-            
-            # Create Card object
-            card = _create_card_from_data(card_data, owner_id, is_commander=False)
-            library_cards.append(card)
-            
-        except KeyError as e:
-            print(f"⚠️  Skipping unknown card: {e}")
+        card_data = resolved.get(card_name)
+        if card_data is None:
+            continue
+        
+        # Skip if this is the commander
+        if commander_data and card_data.get('id') == commander_data.get('id'):
             continue
+        
+        prototype = prototypes.get(card_name)
+        if prototype is None:
+            card = _create_card_from_data(card_data, owner_id, is_commander=False,
+                                          enhanced_engine=enhanced_engine)
+            prototypes[card_name] = card
+        else:
+            card = _clone_card(prototype)
+        library_cards.append(card)
     
     # Create commander card object
     if commander_data:
-        commander_card = _create_card_from_data(commander_data, owner_id, is_commander=True)
+        commander_card = _create_card_from_data(commander_data, owner_id, is_commander=True,
+                                                enhanced_engine=enhanced_engine)
     
     return library_cards, commander_card
 
-def _create_card_from_data(card_data: Dict[str, Any], owner_id: int, is_commander: bool = False) -> Card:
-    """Create a Card object from resolved card data."""
+def _create_card_from_data(card_data: Dict[str, Any], owner_id: int, is_commander: bool = False,
+                           enhanced_engine=None) -> Card:
+    """Create a Card object from resolved card data (optionally reusing an EnhancedCardEngine)."""
     # Ensure we have required fields with sensible defaults
     card_id = card_data.get('id', card_data['name'].lower().replace(' ', '_'))
     name = card_data['name']
@@ -317,8 +389,9 @@ def _create_card_from_data(card_data: Dict[str, Any], owner_id: int, is_commande
     # Create the Card object with enhanced validation
     try:
         # Use enhanced card creation if available
-        from engine.enhanced_integration import EnhancedCardEngine
-        enhanced_engine = EnhancedCardEngine()
+        if enhanced_engine is None:
+            from engine.enhanced_integration import EnhancedCardEngine
+            enhanced_engine = EnhancedCardEngine()
         
         # Prepare card data for enhanced creation
         enhanced_card_data = {
@@ -381,6 +454,10 @@ def load_deck(deck_path: str, owner_id: int) -> Tuple[List[Card], Optional[Card]
         print(f"❌ Error parsing deck file: {e}")
         raise
     
+    # SQL backend: one batched query instead of a lookup per card
+    if _card_db._USE_SQL and _card_sql.sql_enabled():
+        local_db = _sql_deck_db(entries + ([commander_name] if commander_name else []))
+
     # Build card objects
     try:
         library_cards, commander_card = _build_card_objects(entries, commander_name, local_db, owner_id)
@@ -6,12 +6,44 @@ _NORMALIZE_RE = re.compile(r'[^a-z0-9]+')
 def normalize(name: str) -> str:
     return _NORMALIZE_RE.sub(' ', name.lower()).strip()
 
+# Read path: one read-only connection per thread (and per process, so forked
+# simulator workers never share a handle). sqlite3 keeps a per-connection
+# statement cache, so the constant queries below are prepared once per thread.
+_MMAP_SIZE = 256 * 1024 * 1024
+_BATCH = 400   # names per IN (...) list, under SQLite's host-parameter limit
+_SQL_BY_ID = "SELECT data FROM cards WHERE id=?"
+_SQL_BY_LOWER = "SELECT data FROM cards WHERE name_lower=?"
+_SQL_BY_NORM = "SELECT data FROM cards WHERE norm=?"
+_SQL_BY_PREFIX = "SELECT data FROM cards WHERE name_lower LIKE ? LIMIT 2"
+_LOCAL = threading.local()
+
 def get_conn():
     os.makedirs(os.path.dirname(_DB_PATH), exist_ok=True)
     conn = sqlite3.connect(_DB_PATH)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+def _read_conn():
+    """Pooled read-only connection for the calling thread."""
+    key = (os.getpid(), _DB_PATH)
+    conn = getattr(_LOCAL, 'conn', None)
+    if conn is not None and getattr(_LOCAL, 'key', None) == key:
+        return conn
+    conn = sqlite3.connect(f"file:{_DB_PATH}?mode=ro", uri=True, cached_statements=64)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only=1")
+    conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+    _LOCAL.conn, _LOCAL.key = conn, key
     return conn
 
+def close_pool():
+    """Close the calling thread's pooled read connection (if any)."""
+    conn = getattr(_LOCAL, 'conn', None)
+    if conn is not None:
+        conn.close()
+    _LOCAL.conn = _LOCAL.key = None
+
 def ensure_schema():
     with _LOCK:
         with get_conn() as c:
@@ -63,36 +95,77 @@ def enable_or_bootstrap(json_fallback_paths):
 
 def fetch_by_id(cid: str):
     if not sql_enabled(): return None
-    with _LOCK, get_conn() as c:
-        r = c.execute("SELECT data FROM cards WHERE id=?", (cid,)).fetchone()
-        return json.loads(r['data']) if r else None
+    r = _read_conn().execute(_SQL_BY_ID, (cid,)).fetchone()
+    return json.loads(r['data']) if r else None
 
 def fetch_by_exact(name: str):
     if not sql_enabled(): return None
-    low = name.lower()
-    with _LOCK, get_conn() as c:
-        r = c.execute("SELECT data FROM cards WHERE name_lower=?", (low,)).fetchone()
-        return json.loads(r['data']) if r else None
+    r = _read_conn().execute(_SQL_BY_LOWER, (name.lower(),)).fetchone()
+    return json.loads(r['data']) if r else None
 
 def fetch_by_norm_or_prefix(name: str):
     if not sql_enabled(): return None
-    norm = normalize(name)
-    with _LOCK, get_conn() as c:
-        r = c.execute("SELECT data FROM cards WHERE norm=?", (norm,)).fetchone()
-        if r: return json.loads(r['data'])
-        # unique prefix
-        rows = c.execute("SELECT data FROM cards WHERE name_lower LIKE ? LIMIT 2",
-                         (name.lower()+'%',)).fetchall()
-        if len(rows) == 1:
-            return json.loads(rows[0]['data'])
+    c = _read_conn()
+    r = c.execute(_SQL_BY_NORM, (normalize(name),)).fetchone()
+    if r: return json.loads(r['data'])
+    # unique prefix
+    rows = c.execute(_SQL_BY_PREFIX, (name.lower()+'%',)).fetchall()
+    if len(rows) == 1:
+        return json.loads(rows[0]['data'])
     return None
 
+def fetch_many_by_id(ids):
+    """Resolve many ids at once; returns {id: card_dict} for the ids found."""
+    if not sql_enabled(): return {}
+    wanted = list(dict.fromkeys(str(i) for i in ids))
+    out = {}
+    c = _read_conn()
+    for i in range(0, len(wanted), _BATCH):
+        chunk = wanted[i:i+_BATCH]
+        q = f"SELECT id, data FROM cards WHERE id IN ({','.join('?'*len(chunk))})"
+        for r in c.execute(q, chunk):
+            out[r['id']] = json.loads(r['data'])
+    return out
+
+def fetch_many_by_name(names):
+    """
+    Resolve a whole deck list in one query per chunk of names.
+    Matches like fetch_by_exact, then fetch_by_norm_or_prefix, for each name.
+    Returns {requested_name: card_dict}; unresolved names are omitted.
+    """
+    if not sql_enabled(): return {}
+    wanted = list(dict.fromkeys(names))
+    lows = list(dict.fromkeys(n.lower() for n in wanted))
+    norms = list(dict.fromkeys(normalize(n) for n in wanted))
+    by_lower, by_norm = {}, {}
+    c = _read_conn()
+    for i in range(0, max(len(lows), len(norms)), _BATCH):
+        lc, nc = lows[i:i+_BATCH], norms[i:i+_BATCH]
+        q = (f"SELECT name_lower, norm, data FROM cards "
+             f"WHERE name_lower IN ({','.join('?'*len(lc)) or 'NULL'}) "
+             f"OR norm IN ({','.join('?'*len(nc)) or 'NULL'})")
+        for r in c.execute(q, lc + nc):
+            by_lower.setdefault(r['name_lower'], r['data'])
+            by_norm.setdefault(r['norm'], r['data'])
+    out = {}
+    decoded = {}
+    for n in wanted:
+        raw = by_lower.get(n.lower()) or by_norm.get(normalize(n))
+        if raw is not None:
+            if raw not in decoded:
+                decoded[raw] = json.loads(raw)
+            out[n] = decoded[raw]
+            continue
+        card = fetch_by_norm_or_prefix(n)   # rare: unique-prefix fallback
+        if card is not None:
+            out[n] = card
+    return out
+
 def list_all_names(limit=None):
     if not sql_enabled(): return []
     q = "SELECT name FROM cards ORDER BY name_lower"
     if limit: q += f" LIMIT {int(limit)}"
-    with _LOCK, get_conn() as c:
-        return [r['name'] for r in c.execute(q)]
+    return [r['name'] for r in _read_conn().execute(q)]
 
 def upsert_card(card_dict: dict):
     """Persist newly fetched (SDK) card."""
@@ -165,7 +165,7 @@ class CardValidator:
             return
         
         types = card_data["types"]
-        if not isinstance(types, list):
+        if not isinstance(types, (list, tuple)):
             result.errors.append("Types must be a list")
             return
         
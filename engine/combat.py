@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Dict, List
-from .keywords import card_keywords
+from .keywords import KW, has_kw, keyword_mask
 
-@dataclass
+@dataclass(slots=True)
 class CombatState:
     attackers: List[object] = field(default_factory=list)              # list of attacking permanents
     blockers: Dict[str, List[object]] = field(default_factory=dict)    # attacker card.id -> list of blockers
@@ -28,8 +28,7 @@ class CombatManager:
         # Check for summoning sickness (CR 302.6 and CR 508.1c)
         if perm.summoning_sick:
             # Check if creature has haste (CR 508.1c)
-            creature_keywords = card_keywords(perm.card)
-            if 'haste' not in creature_keywords:
+            if not has_kw(perm.card, KW.HASTE):
                 return  # Creature with summoning sickness can't attack unless it has haste
         
         # Check for other attack restrictions
@@ -63,23 +62,22 @@ class CombatManager:
     
     def _can_block(self, blocker_perm, attacker_perm) -> bool:
         """Check if a blocker can block an attacker according to MTG CR 509.1"""
-        atk_kws = card_keywords(attacker_perm.card)
-        blk_kws = card_keywords(blocker_perm.card)
+        atk_kws = keyword_mask(attacker_perm.card)
         
         # CR 509.1b: Creature with flying can only be blocked by creatures with flying or reach
-        if 'flying' in atk_kws and not (('flying' in blk_kws) or ('reach' in blk_kws)):
+        if atk_kws & KW.FLYING and not has_kw(blocker_perm.card, KW.FLYING | KW.REACH):
             return False
         
         # CR 509.1c: Landwalk abilities (simplified - would need to check land types)
         # This would require more complex land type checking
         
         # CR 509.1d: Creature with fear can only be blocked by artifact or black creatures
-        if 'fear' in atk_kws:
+        if atk_kws & KW.FEAR:
             if 'Artifact' not in blocker_perm.card.types and 'Black' not in getattr(blocker_perm.card, 'colors', []):
                 return False
         
         # CR 509.1e: Creature with intimidate can only be blocked by artifact creatures or creatures that share a color
-        if 'intimidate' in atk_kws:
+        if atk_kws & KW.INTIMIDATE:
             blocker_colors = getattr(blocker_perm.card, 'colors', [])
             attacker_colors = getattr(attacker_perm.card, 'colors', [])
             if 'Artifact' not in blocker_perm.card.types and not any(c in blocker_colors for c in attacker_colors):
@@ -131,37 +129,39 @@ class CombatManager:
             atk_power = _safe_int(getattr(atk_card, 'eff_power', atk_card.power))
             if atk_power <= 0:
                 continue
-            atk_kws = card_keywords(atk_card)
+            atk_kws = keyword_mask(atk_card)
+            lifelink = bool(atk_kws & KW.LIFELINK)
             block_list = self.state.blockers.get(atk_card.id, [])
             # Menace enforcement: if attacker has menace and <2 blockers -> treat as unblocked
-            if 'menace' in atk_kws and len(block_list) < 2:
+            if atk_kws & KW.MENACE and len(block_list) < 2:
                 block_list = []
             if not block_list:
                 defending_id = _next_player(self.game, self.game.active_player)
-                self._deal_damage_to_player(atk, defending_id, atk_power, lifelink=('lifelink' in atk_kws))
+                self._deal_damage_to_player(atk, defending_id, atk_power, lifelink=lifelink)
             else:
                 first_blocker = block_list[0]
-                lethal_needed = 1 if 'deathtouch' in atk_kws else _safe_int(getattr(first_blocker.card,'eff_toughness', first_blocker.card.toughness))
+                lethal_needed = 1 if atk_kws & KW.DEATHTOUCH else _safe_int(getattr(first_blocker.card,'eff_toughness', first_blocker.card.toughness))
                 assign_to_blocker = min(atk_power, lethal_needed)
                 spill = 0
-                if 'trample' in atk_kws:
+                if atk_kws & KW.TRAMPLE:
                     spill = max(0, atk_power - lethal_needed)
                 # Damage to blocker
                 _mark_damage(first_blocker, assign_to_blocker)
-                if 'lifelink' in atk_kws:
+                if lifelink:
                     self._gain_life(atk_card.controller_id, assign_to_blocker)
                 if spill > 0:
                     defending_id = _next_player(self.game, self.game.active_player)
-                    self._deal_damage_to_player(atk, defending_id, spill, lifelink=('lifelink' in atk_kws))
+                    self._deal_damage_to_player(atk, defending_id, spill, lifelink=lifelink)
                 # Blockers deal damage back
                 total_block_power = 0
                 for b in block_list:
                     bp = _safe_int(getattr(b.card,'eff_power', b.card.power))
                     if bp > 0:
                         total_block_power += bp
-                        if 'lifelink' in card_keywords(b.card):
+                        blk_kws = keyword_mask(b.card)
+                        if blk_kws & KW.LIFELINK:
                             self._gain_life(b.card.controller_id, bp)
-                        if 'deathtouch' in card_keywords(b.card):
+                        if blk_kws & KW.DEATHTOUCH:
                             # Mark lethal
                             _mark_damage(atk, max(_safe_int(getattr(atk_card,'eff_toughness', atk_card.toughness)),1))
                 _mark_damage(atk, total_block_power)
@@ -184,22 +184,26 @@ class CombatManager:
                 tou = _safe_int(perm.card.toughness)
                 if tou > 0 and dmg >= tou:
                     deaths.append(perm)
+        death_events = []
         for perm in deaths:
             owner = self.game.players[perm.card.owner_id]
             if perm in owner.battlefield:
                 owner.battlefield.remove(perm)
             owner.graveyard.append(perm.card)
+            death_events.append((perm.card, perm.card.controller_id))
             
-            # Emit death event for triggered abilities
+            if hasattr(self.game, 'rules_engine'):
+                self.game.rules_engine.on_card_dies(perm.card)
+        
+        # Combat deaths are simultaneous: emit together so triggers queue in APNAP order
+        if death_events:
             try:
-                from engine.ability_engine import emit_game_event, TriggerCondition
-                emit_game_event(TriggerCondition.DIES, 
-                              affected=perm.card, controller=perm.card.controller_id)
+                from engine.ability_engine import emit_simultaneous_events, TriggerCondition
+                emit_simultaneous_events(
+                    (TriggerCondition.DIES, {'affected': card, 'controller': controller})
+                    for card, controller in death_events)
             except ImportError:
                 pass
-            
-            if hasattr(self.game, 'rules_engine'):
-                self.game.rules_engine.on_card_dies(perm.card)
 
 def _mark_damage(perm, amount: int):
     if amount <= 0:
@@ -214,7 +218,8 @@ def _safe_int(v):
         return 0
 
 def _next_player(game, pid):
-    return (pid + 1) % len(game.players)
+    """Defending player: the next remaining player in turn order."""
+    return game.turn_order.next(pid)
 
 # ---- Integration helper ----
 def attach_combat(game):
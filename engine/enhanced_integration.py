@@ -13,7 +13,8 @@ from typing import Dict, List, Optional, Any
 from engine.card_engine import Card, Permanent
 from engine.card_fetch import load_deck, enhance_existing_card
 from engine.card_validation import validate_card_data, normalize_card_data
-from engine.enhanced_keywords import extract_card_keywords, get_combat_keywords, has_keyword
+from engine.enhanced_keywords import extract_card_keywords, get_combat_keywords, has_keyword, attach_keywords
+from engine.parse_cache import cached_parse
 from engine.layers import LayersEngine, create_static_buff_effect, create_set_pt_effect
 
 class EnhancedCardEngine:
@@ -68,10 +69,10 @@ class EnhancedCardEngine:
         
         # Step 4: Parse and cache keywords
         if card.text:
-            keywords = extract_card_keywords(card.text)
+            keywords = cached_parse('keywords', card.name, card.text, extract_card_keywords)
             self.keyword_cache[card.id] = keywords
-            # Store keywords on the card for easy access
-            card.keywords = keywords
+            # Store keywords (and their frozenset view) on the card for easy access
+            attach_keywords(card, keywords)
         
         # Step 5: Apply rules engine parsing (existing functionality)
         try:
@@ -4,7 +4,7 @@ Provides comprehensive support for all MTG keywords and their interactions
 """
 
 from dataclasses import dataclass
-from typing import Set, Dict, List, Optional, Tuple, Callable
+from typing import Set, Dict, FrozenSet, List, Optional, Tuple, Callable
 from enum import Enum
 import re
 
@@ -248,6 +248,8 @@ class KeywordProcessor:
     
     def __init__(self):
         self.keyword_patterns = self._build_keyword_patterns()
+        (self._word_re, self._simple_words, self._leading_words,
+         self._param_names, self._param_lengths) = self._build_keyword_scanner()
         self.interaction_handlers = self._build_interaction_handlers()
     
     def _build_keyword_patterns(self) -> Dict[str, re.Pattern]:
@@ -270,6 +272,25 @@ class KeywordProcessor:
         
         return patterns
     
+    def _build_keyword_scanner(self) -> Tuple[re.Pattern, Dict[str, str], Dict[str, str], Dict[str, str], Tuple[int, ...]]:
+        """
+        Build the word-level tables used by extract_keywords' single pass.
+        Returns (word pattern, {word: keyword} for one-word simple keywords,
+        {first word: keyword} for two-word keywords, {name: keyword} for
+        parameterized keywords, distinct parameterized name lengths).
+        """
+        simple, leading, params = {}, {}, {}
+        for keyword, definition in MTG_KEYWORDS.items():
+            name = definition.name.lower()
+            if definition.parameter_type:
+                params[name] = keyword
+            elif ' ' in name:
+                leading[name.split(' ', 1)[0]] = keyword
+            else:
+                simple[name] = keyword
+        lengths = tuple(sorted({len(name) for name in params}))
+        return re.compile(r'\w+'), simple, leading, params, lengths
+    
     def _build_interaction_handlers(self) -> Dict[str, Callable]:
         """Build handlers for keyword interactions"""
         handlers = {}
@@ -316,28 +337,71 @@ class KeywordProcessor:
     def extract_keywords(self, card_text: str) -> Dict[str, Optional[str]]:
         """Extract all keywords from card text with their parameters"""
         found_keywords = {}
+        if not card_text:
+            return found_keywords
+        lowered = card_text.lower()
+        if len(lowered) != len(card_text):
+            # Lower-casing changed offsets (rare non-ASCII text): scan per pattern
+            for keyword, pattern in self.keyword_patterns.items():
+                match = pattern.search(card_text)
+                if match:
+                    found_keywords[keyword] = match.group(1) if MTG_KEYWORDS[keyword].parameter_type else None
+            return found_keywords
         
-        for keyword, pattern in self.keyword_patterns.items():
-            matches = pattern.findall(card_text)
-            if matches:
-                if MTG_KEYWORDS[keyword].parameter_type:
-                    # Store parameter value
-                    found_keywords[keyword] = matches[0] if matches else None
-                else:
-                    # Simple presence
+        # Single pass over the words of the text. Simple keywords must be whole
+        # words; parameterized keywords (matched without a leading word
+        # boundary) end a word that is followed by whitespace and a parameter.
+        for match in self._word_re.finditer(lowered):
+            word, end = match.group(), match.end()
+            keyword = self._simple_words.get(word)
+            if keyword is not None:
+                found_keywords.setdefault(keyword, None)
+                continue
+            keyword = self._leading_words.get(word)
+            if keyword is not None and keyword not in found_keywords:
+                start = match.start()
+                after = start + len(keyword)
+                if lowered.startswith(keyword, start) and not (after < len(lowered) and self._is_word_char(lowered[after])):
                     found_keywords[keyword] = None
+            if end < len(lowered) and lowered[end].isspace():
+                for length in self._param_lengths:
+                    if length > len(word):
+                        break
+                    keyword = self._param_names.get(word[-length:])
+                    if keyword is None or keyword in found_keywords:
+                        continue
+                    # Store parameter value (first full match wins)
+                    param = self.keyword_patterns[keyword].match(card_text, end - length)
+                    if param:
+                        found_keywords[keyword] = param.group(1)
         
-        return found_keywords
+        # Keep MTG_KEYWORDS order so callers see the same dict as before
+        return {k: found_keywords[k] for k in self.keyword_patterns if k in found_keywords}
+    
+    @staticmethod
+    def _is_word_char(ch: str) -> bool:
+        return ch.isalnum() or ch == '_'
+    
+    def keyword_set(self, card) -> FrozenSet[str]:
+        """Lower-case keyword names for a card, cached on the card as `keyword_set`."""
+        keywords = getattr(card, 'keywords', None)
+        cached = getattr(card, 'keyword_set', None)
+        if cached is not None and getattr(card, '_keyword_source', None) is keywords:
+            return cached
+        if keywords is None:
+            # Fallback: search in card text (not cached - text may still change)
+            return frozenset(self.extract_keywords(getattr(card, 'text', '') or ''))
+        result = frozenset(k.lower() for k in keywords)
+        try:
+            card.keyword_set = result
+            card._keyword_source = getattr(card, 'keywords', None)
+        except AttributeError:
+            pass
+        return result
     
     def has_keyword(self, card, keyword: str) -> bool:
         """Check if a card has a specific keyword"""
-        if hasattr(card, 'keywords'):
-            return keyword.lower() in [k.lower() for k in card.keywords.keys()]
-        
-        # Fallback: search in card text
-        card_text = getattr(card, 'text', '')
-        keywords = self.extract_keywords(card_text)
-        return keyword.lower() in [k.lower() for k in keywords.keys()]
+        return keyword.lower() in self.keyword_set(card)
     
     def get_keyword_parameter(self, card, keyword: str) -> Optional[str]:
         """Get the parameter value for a parameterized keyword"""
@@ -397,6 +461,12 @@ def extract_card_keywords(card_text: str) -> Dict[str, Optional[str]]:
     """Extract keywords from card text"""
     return keyword_processor.extract_keywords(card_text)
 
+def attach_keywords(card, keywords: Dict[str, Optional[str]]):
+    """Store extracted keywords on a card along with their frozenset view."""
+    card.keywords = keywords
+    card.keyword_set = frozenset(k.lower() for k in keywords)
+    card._keyword_source = keywords
+
 def has_keyword(card, keyword: str) -> bool:
     """Check if card has keyword"""
     return keyword_processor.has_keyword(card, keyword)
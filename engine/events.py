@@ -1,13 +1,15 @@
 from __future__ import annotations
-from collections import defaultdict
-from typing import Callable, Dict, List, Tuple, Any, TYPE_CHECKING
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from .game_state import GameState
 
 class EventBus:
-    def __init__(self):
+    def __init__(self, tick_budget: int = 256):
         self._subs: Dict[str, List[Callable[..., None]]] = defaultdict(list)
-        self._queue: List[Tuple[str, dict]] = []
+        self._queue: Deque[Tuple[str, dict]] = deque()
+        # Default number of events handled per process() call
+        self.tick_budget = tick_budget
 
     def subscribe(self, event: str, cb: Callable[..., None]):
         self._subs[event].append(cb)
@@ -15,16 +17,39 @@ class EventBus:
     def emit(self, event: str, **payload):
         self._queue.append((event, payload))
 
-    def process(self, limit: int = 256):
+    def emit_many(self, events: Iterable[Tuple[str, dict]]):
+        """Queue several (event, payload) pairs at once, in order."""
+        self._queue.extend(events)
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def process(self, limit: Optional[int] = None) -> int:
+        """Dispatch up to `limit` queued events (default tick_budget); returns how many ran."""
+        if limit is None:
+            limit = self.tick_budget
+        queue = self._queue
+        subs = self._subs
         count = 0
-        while self._queue and count < limit:
-            evt, data = self._queue.pop(0)
-            for cb in list(self._subs.get(evt, [])):
+        while queue and count < limit:
+            evt, data = queue.popleft()
+            for cb in list(subs.get(evt, ())):
                 try:
                     cb(**data)
-                except Exception as ex:
+                except Exception:
                     # Event handler error (debug print removed)
+                    pass
             count += 1
+        return count
+
+    def drain(self, max_events: Optional[int] = None) -> int:
+        """Process tick after tick until the queue is empty (or max_events ran)."""
+        total = 0
+        while self._queue and (max_events is None or total < max_events):
+            step = self.tick_budget if max_events is None else min(self.tick_budget, max_events - total)
+            total += self.process(step)
+        return total
 
     # --- Advanced event helpers ---
 
@@ -16,7 +16,8 @@ from engine.stack import StackEngine
 
 # Enhanced systems imports
 from engine.layers import LayersEngine
-from engine.enhanced_keywords import KeywordProcessor, extract_card_keywords
+from engine.enhanced_keywords import KeywordProcessor, extract_card_keywords, attach_keywords
+from engine.parse_cache import cached_parse
 from engine.card_validation import CardValidator
 from engine.tokens_and_copies import TokenAndCopyEngine, set_token_engine
 from engine.enhanced_integration import EnhancedCardEngine
@@ -49,6 +50,8 @@ class GameController:
         
         # Initialize enhanced systems
         self.layers_engine = LayersEngine()
+        self.game.layers_engine = self.layers_engine   # snapshot restores and eliminations invalidate it
+        self.layers_engine.watch_zones(self.game.zones)
         self.keyword_processor = KeywordProcessor()
         self.card_validator = CardValidator()
         self.token_engine = TokenAndCopyEngine(layers_engine=self.layers_engine)
@@ -112,8 +115,8 @@ class GameController:
                         
                         # Extract and cache keywords
                         if hasattr(card, 'text') and card.text:
-                            keywords = extract_card_keywords(card.text)
-                            card.keywords = keywords
+                            keywords = cached_parse('keywords', card.name, card.text, extract_card_keywords)
+                            attach_keywords(card, keywords)
                         
                         # Register abilities with ability engine
                         self.ability_engine.register_card(card)
@@ -170,6 +173,20 @@ class GameController:
         """Process all pending triggered abilities"""
         self.ability_engine.process_triggered_abilities()
 
+    def process_triggers_incrementally(self, schedule, budget: int = 32, on_done=None):
+        """
+        Resolve pending triggers `budget` at a time, handing the next slice to
+        schedule(callback) so a UI loop can repaint in between
+        (e.g. schedule=lambda cb: QTimer.singleShot(0, cb)).
+        """
+        def step():
+            self.ability_engine.process_triggered_abilities(budget)
+            if self.ability_engine.has_pending_triggers:
+                schedule(step)
+            elif on_done is not None:
+                on_done()
+        step()
+
     def log_phase(self):
         """Log phase changes for debugging purposes."""
         if not self.logging_enabled:
@@ -384,13 +401,11 @@ class GameController:
             from engine.mana import ManaPool
             ps.mana_pool = ManaPool()
         pool = ps.mana_pool
-        from engine.mana import parse_mana_cost
-        cost_dict = parse_mana_cost(getattr(card, 'mana_cost_str', None))
-        if not cost_dict:
-            generic_need = card.mana_cost if isinstance(card.mana_cost, int) else 0
-            if generic_need:
-                cost_dict = {'G': generic_need}
-        colored_needs = {c: n for c, n in cost_dict.items() if c in ('W', 'U', 'B', 'R', 'G') and n > 0}
+        from engine.mana import GENERIC_KEY, card_cost
+        cost = card_cost(card)   # cached vector, shared by every copy of the card
+        if not cost.mana_value and isinstance(card.mana_cost, int):
+            cost = cost.with_generic(card.mana_cost)
+        colored_needs = {c: cost.get(c) for c in ('W', 'U', 'B', 'R', 'G') if cost.get(c) > 0}
         def land_color(perm):
             n = perm.card.name.lower()
             for t, c in [('plains', 'W'), ('island', 'U'), ('swamp', 'B'), ('mountain', 'R'), ('forest', 'G')]:
@@ -408,7 +423,7 @@ class GameController:
                 untapped.remove(found)
                 need -= 1
             colored_needs[color] = need
-        remaining = cost_dict.get('G', 0) + sum(rem for rem in colored_needs.values() if rem > 0)
+        remaining = cost.get(GENERIC_KEY) + sum(rem for rem in colored_needs.values() if rem > 0)
         for land in list(untapped):
             if remaining <= 0:
                 break
@@ -416,12 +431,15 @@ class GameController:
             self.game.tap_for_mana(0, land)
             pool.add(sym, 1)
             remaining -= 1
-        if not pool.can_pay(cost_dict):
+        if not pool.can_pay(cost):
             return
-        pool.pay(cost_dict)
+        pool.pay(cost)
         self.game.cast_spell(0, card)
 
     def _find_perm(self, card_id):
+        zones = getattr(self.game, 'zones', None)
+        if zones is not None:
+            return zones.find_permanent(card_id)
         for p in self.game.players:
             for perm in p.battlefield:
                 if getattr(perm.card, 'id', None) == card_id:
@@ -3,6 +3,7 @@ import argparse
 from engine.game_state import GameState, PlayerState
 from engine.rules_engine import init_rules
 from engine.card_db import load_card_db, maybe_bootstrap_sql  # ADDED
+from engine.parse_cache import ensure_parse_cache_loaded
 from engine.game_ids import generate_game_id, register_game_id  # ADDED
 
 try:
@@ -109,6 +110,7 @@ def new_game(deck_specs=None, ai_enabled=True):
     Construct a fresh GameState and return (game, ai_player_ids).
     """
     load_card_db()
+    ensure_parse_cache_loaded()
     decks_dir = os.path.join('data', 'decks')
     os.makedirs(decks_dir, exist_ok=True)
     player_deck, ai_deck = _auto_decks(decks_dir)
@@ -5,7 +5,13 @@ from typing import List, Dict, Optional
 from .card_engine import Card, Permanent, ActionResult
 from .stack import Stack, StackItem
 from .rules_engine import CommanderTracker
-from .mana import ManaPool
+from .mana import ManaPool, card_cost
+from .playability import evaluate_hand
+from .turn_order import TurnOrder
+from .zones import ZONE_NAMES, ZoneIndex, ZoneList, bind_player_zones
+from .snapshot import (
+    GameSnapshot, restore as _restore_snapshot, release as _release_snapshot, fork as _fork_game
+)
 
 # MTG Comprehensive Rules 500 - Turn Structure
 # Proper phases and steps according to CR 500.1
@@ -29,6 +35,10 @@ _PRIORITY_STEPS = {"UPKEEP", "DRAW", "PRECOMBAT_MAIN", "BEGIN_COMBAT", "DECLARE_
                    "DECLARE_BLOCKERS", "COMBAT_DAMAGE", "END_COMBAT", "POSTCOMBAT_MAIN", "END"}
 
 
+# PlayerState attributes whose assignment is reported to the game's ZoneIndex
+_SBA_PLAYER_FIELDS = frozenset({'life', 'poison_counters'})
+
+
 # ---------------- Player State ----------------
 @dataclass
 class PlayerState:
@@ -45,6 +55,37 @@ class PlayerState:
     commander: Optional[Card] = None
     commander_tracker: CommanderTracker = field(default_factory=CommanderTracker)
     mana_pool: ManaPool = field(default_factory=ManaPool)
+    has_lost: bool = False
+
+    def __setattr__(self, name, value):
+        index = self.__dict__.get('_zone_index')
+        if index is not None:
+            index.save_before_write(self)   # snapshot journal (engine/snapshot.py)
+        # Zones stay ZoneLists so the owning game's ZoneIndex sees every change
+        if name in ZONE_NAMES and not isinstance(value, ZoneList):
+            value = ZoneList(value)
+        if name in ZONE_NAMES:
+            old = self.__dict__.get(name)
+            if index is not None and old is not None and old is not value:
+                old._bind(None, None, None)
+                for item in old:
+                    index._removed(old, item)
+            object.__setattr__(self, name, value)
+            if index is not None:
+                value._bind(index, self.player_id, name)
+            return
+        object.__setattr__(self, name, value)
+        if name in _SBA_PLAYER_FIELDS and index is not None:
+            index.notify_change(self, name)
+
+    def __setstate__(self, state):
+        # Copied zones are detached; the GameState that owns this player re-binds them
+        state = dict(state)
+        state.pop('_zone_index', None)
+        for zone in ZONE_NAMES:
+            if zone in state:
+                state[zone] = ZoneList(state[zone])
+        self.__dict__.update(state)
 
     def draw(self, n: int = 1):
         # Debug: Track if hands are unexpectedly empty
@@ -72,18 +113,8 @@ class PlayerState:
         return sum(self.mana_pool.pool.values())
 
     def find_playable(self) -> List[Card]:
-        playable: List[Card] = []
-        for c in self.hand:
-            if "Land" in c.types:
-                playable.append(c)
-            else:
-                cost = c.mana_cost
-                if c.is_commander:
-                    cost += self.commander_tracker.tax_for(c.id)
-                # Use mana pool total instead of simple mana counter
-                if cost <= self.total_mana:
-                    playable.append(c)
-        return playable
+        """Hand cards payable from the pool plus untapped lands (lands always listed)."""
+        return evaluate_hand(self).playable()
 
 
 # ---------------- Game State ----------------
@@ -99,10 +130,102 @@ class GameState:
     def __post_init__(self):
         if getattr(self.stack, "game", None) is None:
             self.stack.game = self
+        self.zones = ZoneIndex()
+        self._bind_zones()
+        self.turn_order = self._build_turn_order()
+
+    def __setattr__(self, name, value):
+        zones = self.__dict__.get('zones')
+        if zones is not None:
+            zones.save_before_write(self)   # snapshot journal (engine/snapshot.py)
+        object.__setattr__(self, name, value)
+        if name == 'players' and zones is not None:
+            self._bind_zones()
+            self.turn_order = self._build_turn_order()
+
+    def __setstate__(self, state):
+        # Copies get their own ZoneIndex over the copied zone lists
+        self.__dict__.update(state)
+        self.zones = ZoneIndex()
+        self._bind_zones()
+        if 'turn_order' not in state:
+            self.turn_order = self._build_turn_order()
+
+    # ---- Snapshots (see engine/snapshot.py) ----
+    def snapshot(self) -> GameSnapshot:
+        """Capture the mutable game state for undo / lookahead."""
+        return GameSnapshot(self)
+
+    def restore(self, snap: GameSnapshot):
+        """Return to a snapshot taken from this game."""
+        _restore_snapshot(self, snap)
+
+    def release(self, snap: GameSnapshot):
+        """Drop a snapshot (and newer ones) that will not be restored."""
+        _release_snapshot(self, snap)
+
+    def fork(self) -> "GameState":
+        """Independent copy for AI search; Card objects are shared, not copied."""
+        return _fork_game(self)
+
+    def _bind_zones(self):
+        self.zones.clear()
+        for ps in self.players:
+            ps.__dict__['_zone_index'] = self.zones
+            bind_player_zones(ps, self.zones)
+
+    def _has_card(self, pid: int, zone: str, card: Card) -> bool:
+        """card in players[pid].<zone>, answered from the zone index when possible."""
+        if self.zones.in_zone(card, pid, zone):
+            return True
+        return card in getattr(self.players[pid], zone)
+
+    def move_card(self, card: Card, to_zone: str, player_id: Optional[int] = None,
+                  summoning_sick: bool = False):
+        """
+        Move a card from wherever it is to to_zone of player_id (default: its
+        owner). Returns the new Permanent for the battlefield, else the card.
+        """
+        entry = self.zones.locate(card)
+        if entry is not None:
+            source = getattr(self.players[entry.player_id], entry.zone)
+            for i, item in enumerate(source):
+                if item is entry.item:
+                    del source[i]
+                    break
+            card = entry.card
+        if player_id is None:
+            player_id = card.owner_id if card.owner_id >= 0 else (entry.player_id if entry else 0)
+        if to_zone == 'battlefield':
+            item = Permanent(card=card, summoning_sick=summoning_sick)
+        else:
+            item = card
+        getattr(self.players[player_id], to_zone).append(item)
+        return item
 
     # ---- Setup / Helpers ----
+    def _build_turn_order(self) -> TurnOrder:
+        return TurnOrder.build((p.player_id for p in self.players),
+                               (p.player_id for p in self.players if p.has_lost))
+
     def other_player(self, pid: int) -> int:
-        return 1 - pid  # two-player assumption
+        """The next remaining player after pid (the opponent in a two-player game)."""
+        return self.turn_order.next(pid)
+
+    def eliminate_player(self, pid: int):
+        """Mark pid as having lost; turn order, priority and combat skip them from now on."""
+        self.players[pid].has_lost = True
+        self.turn_order = self.turn_order.without(pid)
+        self._invalidate_layers(*(getattr(p, 'card', p) for p in self.players[pid].battlefield))
+
+    def _invalidate_layers(self, *cards):
+        # Which permanents a continuous effect touches can change with seats,
+        # and the layer engines do not memoize on them (zone moves reach the
+        # engines through LayersEngine.watch_zones)
+        engines = {id(e): e for e in [getattr(self, 'layers_engine', None)]
+                   + [getattr(c, '_layers_engine', None) for c in cards] if e is not None}
+        for layers in engines.values():
+            layers.invalidate(abilities=True)
 
     def setup(self):
         for p in self.players:
@@ -121,7 +244,7 @@ class GameState:
     def _start_new_turn(self):
         self.turn += 1
         # Switch to the new active player first
-        self.active_player = self.other_player(self.active_player)
+        self.active_player = self.turn_order.next(self.active_player)
         
         # CR 302.6: Remove summoning sickness from permanents controlled by the (now) active player
         active_player_obj = self.players[self.active_player]
@@ -166,6 +289,8 @@ class GameState:
         """
         # Empty mana pools at end of current step/phase (CR 106.4)
         self._empty_all_mana_pools()
+        # Players who lost since the last step leave before anyone else acts
+        self.eliminate_losers()
         
         while True:
             self.phase_index = (self.phase_index + 1) % len(PHASES)
@@ -194,7 +319,7 @@ class GameState:
         if "Land" not in card.types:
             return ActionResult.ILLEGAL
         ps = self.players[pid]
-        if card not in ps.hand:
+        if not self._has_card(pid, 'hand', card):
             return ActionResult.ILLEGAL
         ps.hand.remove(card)
         # CR 302.6: Lands don't have summoning sickness
@@ -231,7 +356,7 @@ class GameState:
         if not ps.mana_pool.can_pay(cost_dict):
             return ActionResult.ILLEGAL
         ps.mana_pool.pay(cost_dict)
-        if card in ps.hand:
+        if self._has_card(ps.player_id, 'hand', card):
             ps.hand.remove(card)
         # CR 302.6: Creatures have summoning sickness when they enter battlefield
         has_summoning_sickness = 'Creature' in card.types
@@ -242,16 +367,12 @@ class GameState:
         ps = self.players[pid]
 
         # Commander from command zone
-        if card.is_commander and card in ps.command:
+        if card.is_commander and self._has_card(pid, 'command', card):
             total_cost = card.mana_cost + ps.commander_tracker.tax_for(card.id)
             # Try using mana pool first, then fall back to simple system
             if hasattr(card, 'mana_cost_str') and card.mana_cost_str:
-                from .mana import parse_mana_cost
-                cost_dict = parse_mana_cost(card.mana_cost_str)
                 # Add commander tax as generic mana
-                tax = ps.commander_tracker.tax_for(card.id)
-                if tax > 0:
-                    cost_dict['C'] = cost_dict.get('C', 0) + tax
+                cost_dict = card_cost(card).with_generic(ps.commander_tracker.tax_for(card.id))
                 if ps.mana_pool.cast_with_pool_and_lands(cost_dict, ps.battlefield):
                     ps.command.remove(card)
                     # CR 302.6: Creatures have summoning sickness when they enter battlefield
@@ -267,14 +388,13 @@ class GameState:
                     ps.commander_tracker.note_cast(card.id)
                 return res
 
-        if card not in ps.hand or "Land" in card.types:
+        if "Land" in card.types or not self._has_card(pid, 'hand', card):
             return ActionResult.ILLEGAL
 
         if "Creature" in card.types:
             # Try using proper mana pool system first
             if hasattr(card, 'mana_cost_str') and card.mana_cost_str:
-                from .mana import parse_mana_cost
-                cost_dict = parse_mana_cost(card.mana_cost_str)
+                cost_dict = card_cost(card)
                 if ps.mana_pool.cast_with_pool_and_lands(cost_dict, ps.battlefield):
                     ps.hand.remove(card)
                     # CR 302.6: Creatures have summoning sickness when they enter battlefield
@@ -325,8 +445,7 @@ class GameState:
         if "Artifact" in card.types:
             # Try using proper mana pool system first
             if hasattr(card, 'mana_cost_str') and card.mana_cost_str:
-                from .mana import parse_mana_cost
-                cost_dict = parse_mana_cost(card.mana_cost_str)
+                cost_dict = card_cost(card)
                 if ps.mana_pool.cast_with_pool_and_lands(cost_dict, ps.battlefield):
                     ps.hand.remove(card)
                     # CR 302.6: Non-creature artifacts/enchantments don't have summoning sickness
@@ -348,8 +467,7 @@ class GameState:
         if "Enchantment" in card.types:
             # Try using proper mana pool system first
             if hasattr(card, 'mana_cost_str') and card.mana_cost_str:
-                from .mana import parse_mana_cost
-                cost_dict = parse_mana_cost(card.mana_cost_str)
+                cost_dict = card_cost(card)
                 if ps.mana_pool.cast_with_pool_and_lands(cost_dict, ps.battlefield):
                     ps.hand.remove(card)
                     # CR 302.6: Non-creature enchantments don't have summoning sickness
@@ -392,10 +510,26 @@ class GameState:
         defender.life -= total
 
     def check_game_over(self) -> bool:
-        if any(p.life <= 0 for p in self.players):
-            return True
+        """
+        True once at most one player remains. Players who have lost to life or
+        commander damage are eliminated here first, so the turn order skips them.
+        """
+        self.eliminate_losers()
+        return len(self.turn_order.alive) <= 1
+
+    def eliminate_losers(self) -> List[int]:
+        """
+        Eliminate every remaining player at 0 or less life (CR 704.5a) or with
+        21 combat damage from one commander (CR 704.6c); returns their ids.
+        """
+        lost = []
         for defender in self.players:
-            attacker_owner = self.other_player(defender.player_id)
-            if self.players[attacker_owner].commander_tracker.lethal_from(defender.player_id, attacker_owner):
-                return True
-        return False
+            pid = defender.player_id
+            if not self.turn_order.is_alive(pid):
+                continue
+            if defender.life <= 0 or any(self.players[owner].commander_tracker.lethal_from(pid, owner)
+                                         for owner in self.turn_order.seats if owner != pid):
+                lost.append(pid)
+        for pid in lost:
+            self.eliminate_player(pid)
+        return lost
@@ -1,5 +1,6 @@
 from typing import Set
 from dataclasses import dataclass
+from enum import IntFlag
 import re
 
 # --- Canonical MTG ability keywords (static/keyword abilities) ---
@@ -46,6 +47,63 @@ def card_keywords(card) -> Set[str]:
     
     return kws
 
+# --- Keyword bitmask (combat hot paths) ---
+class KW(IntFlag):
+    """Bit flags for combat keywords; see keyword_mask / has_kw."""
+    NONE = 0
+    FLYING = 1 << 0
+    REACH = 1 << 1
+    TRAMPLE = 1 << 2
+    DEATHTOUCH = 1 << 3
+    LIFELINK = 1 << 4
+    VIGILANCE = 1 << 5
+    HASTE = 1 << 6
+    MENACE = 1 << 7
+    FIRST_STRIKE = 1 << 8
+    DOUBLE_STRIKE = 1 << 9
+    FEAR = 1 << 10
+    INTIMIDATE = 1 << 11
+
+KW_BY_NAME = {
+    'flying': KW.FLYING, 'reach': KW.REACH, 'trample': KW.TRAMPLE,
+    'deathtouch': KW.DEATHTOUCH, 'lifelink': KW.LIFELINK, 'vigilance': KW.VIGILANCE,
+    'haste': KW.HASTE, 'menace': KW.MENACE, 'first strike': KW.FIRST_STRIKE,
+    'double strike': KW.DOUBLE_STRIKE, 'fear': KW.FEAR, 'intimidate': KW.INTIMIDATE,
+}
+
+def keywords_to_mask(names) -> int:
+    mask = 0
+    for name in names:
+        mask |= KW_BY_NAME.get(name.lower(), 0)
+    return mask
+
+def keyword_mask(card) -> int:
+    """
+    Integer bitmask of card_keywords(card) plus keywords granted by layer 6
+    effects. Cached on the card and recomputed only when its oracle abilities
+    or text are replaced, or its LayersEngine's ability effects change.
+    """
+    engine = getattr(card, '_layers_engine', None)
+    version = getattr(engine, 'ability_version', 0) if engine is not None else 0
+    abilities = getattr(card, 'oracle_abilities', None)
+    text = getattr(card, 'text', None)
+    cached = getattr(card, '_kw_mask_cache', None)
+    if (cached is not None and cached[0] is engine and cached[1] == version
+            and cached[2] is abilities and cached[3] is text):
+        return cached[4]
+    mask = keywords_to_mask(card_keywords(card))
+    if engine is not None and version:
+        mask |= keywords_to_mask(engine.granted_abilities(card))
+    try:
+        card._kw_mask_cache = (engine, version, abilities, text, mask)
+    except AttributeError:
+        pass
+    return mask
+
+def has_kw(card, kw: int) -> bool:
+    """True if the card has any of the keyword bits in kw (e.g. KW.FLYING)."""
+    return bool(keyword_mask(card) & kw)
+
 @dataclass
 class Ability:
     kind: str          # 'triggered' | 'static'
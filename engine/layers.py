@@ -33,7 +33,7 @@ class PTLayer(Enum):
     COUNTERS = 7.4                  # 7d: Changes from counters
     SWITCH_PT = 7.5                 # 7e: Effects that switch power/toughness
 
-@dataclass
+@dataclass(slots=True)
 class ContinuousEffect:
     """
     Represents a single continuous effect that can modify characteristics
@@ -95,6 +95,18 @@ class LayersEngine:
         self.effects: List[ContinuousEffect] = []
         self.characteristic_states: Dict[str, CharacteristicState] = {}
         self.timestamp_counter: float = 0.0
+        # Effects bucketed by layer, each bucket kept in (sublayer, timestamp) order
+        self._effects_by_layer: Dict[Layer, List[ContinuousEffect]] = {}
+        # Bumped on any effect or counter change; memoized states are only
+        # valid for the epoch they were computed in
+        self.epoch: int = 0
+        self._state_cache: Dict[int, Tuple[Any, tuple, CharacteristicState]] = {}
+        self._cache_epoch: int = 0
+        # Bumped whenever ability-changing (layer 6) effects come or go, so
+        # cached keyword masks (keywords.keyword_mask) know to recompute
+        self.ability_version: int = 0
+        # ZoneIndex passed to watch_zones; P/T changes are reported through it
+        self._zones = None
         
     def add_effect(self, effect: ContinuousEffect) -> None:
         """Add a continuous effect to the engine"""
@@ -102,21 +114,91 @@ class LayersEngine:
             self.timestamp_counter += 1.0
             effect.timestamp = self.timestamp_counter
         self.effects.append(effect)
+        bucket = self._effects_by_layer.setdefault(effect.layer, [])
+        bucket.append(effect)
+        bucket.sort(key=_effect_order)
+        if _changes_abilities(effect):
+            self.ability_version += 1
+        self.invalidate()
+        self._report_pt_change()
         
     def remove_effect(self, source_id: str) -> None:
         """Remove all effects from a given source"""
+        removed = [e for e in self.effects if e.source_id == source_id]
+        if not removed:
+            return
         self.effects = [e for e in self.effects if e.source_id != source_id]
+        for layer in {e.layer for e in removed}:
+            self._effects_by_layer[layer] = [e for e in self._effects_by_layer.get(layer, [])
+                                             if e.source_id != source_id]
+        if any(_changes_abilities(e) for e in removed):
+            self.ability_version += 1
+        self.invalidate()
+        self._report_pt_change()
+    
+    def watch_zones(self, zones) -> None:
+        """
+        Invalidate whenever a card changes zone in zones (a ZoneIndex), however
+        it was moved; effects' affects_card often depends on where cards are.
+        Counter and effect changes are reported back to its change watchers
+        (state-based actions), as 'counters' on the permanent and 'layers'.
+        """
+        self._zones = zones
+        zones.watch_changes(self._on_zone_change)
+        zones.watch_battlefield(self._on_battlefield_change)
+
+    def _on_zone_change(self, obj, change: str) -> None:
+        if change == 'zone':
+            self.invalidate()
+            if self._effects_by_layer.get(Layer.POWER_TOUGHNESS):
+                self._report_pt_change()
+
+    def _on_battlefield_change(self, card, entered: bool) -> None:
+        # Entering or leaving the battlefield can move granted keywords too
+        self.invalidate(abilities=True)
+
+    def _report_pt_change(self) -> None:
+        # Any creature's toughness may have changed
+        if self._zones is not None:
+            self._zones.notify_change(self, 'layers')
+
+    def invalidate(self, abilities: bool = False) -> None:
+        """
+        Drop all memoized characteristic states. Called on every effect and
+        counter change; call it too when something an effect's affects_card
+        depends on changes (see watch_zones; eliminate_player does too).
+        Pass abilities=True when that change can also move granted keywords
+        between cards, so cached keyword masks are recomputed.
+        """
+        self.epoch += 1
+        if abilities and any(_changes_abilities(e) for e in self._effects_by_layer.get(Layer.ABILITY_EFFECTS, ())):
+            self.ability_version += 1
+    
+    def granted_abilities(self, card) -> Set[str]:
+        """Lower-case abilities granted to a card by layer 6 effects."""
+        if not self._effects_by_layer.get(Layer.ABILITY_EFFECTS) and not any(
+                e.ability_grants for e in self.effects):
+            return set()
+        return {a.lower() for a in self.get_characteristic_state(card).abilities}
         
     def get_characteristic_state(self, card) -> CharacteristicState:
         """
         Calculate the current characteristic state of a card after applying
-        all continuous effects through the layers system
+        all continuous effects through the layers system.
+        Results are memoized per card until the epoch changes or the card's
+        own base characteristics change; treat the returned state as read-only.
         """
-        card_id = card.id
+        if self._cache_epoch != self.epoch:
+            self._state_cache.clear()
+            self._cache_epoch = self.epoch
+        signature = _base_signature(card)
+        cached = self._state_cache.get(id(card))
+        if cached is not None and cached[0] is card and cached[1] == signature:
+            return cached[2]
         
         # Initialize base state from card
         state = CharacteristicState(
-            card_id=card_id,
+            card_id=card.id,
             base_power=card.power,
             base_toughness=card.toughness,
             current_power=card.power,
@@ -124,29 +206,26 @@ class LayersEngine:
             types=set(card.types) if hasattr(card, 'types') else set(),
             colors=set(card.color_identity) if hasattr(card, 'color_identity') else set()
         )
+        counters = self.characteristic_states.get(card.id)
+        if counters is not None:
+            state.plus_one_counters = counters.plus_one_counters
+            state.minus_one_counters = counters.minus_one_counters
         
         # Apply effects layer by layer
         self._apply_layer_effects(state, card)
         
+        self._state_cache[id(card)] = (card, signature, state)
         return state
     
     def _apply_layer_effects(self, state: CharacteristicState, card) -> None:
         """Apply all continuous effects in proper layer order"""
-        
-        # Get effects that apply to this card
-        applicable_effects = [e for e in self.effects 
-                            if self._effect_applies_to_card(e, card)]
-        
-        # Sort effects by layer, then sublayer, then timestamp
-        applicable_effects.sort(key=lambda e: (
-            e.layer.value,
-            e.sublayer or 0,
-            e.timestamp
-        ))
-        
-        # Apply each layer in order
+        has_counters = bool(state.plus_one_counters or state.minus_one_counters)
         for layer in Layer:
-            layer_effects = [e for e in applicable_effects if e.layer == layer]
+            bucket = self._effects_by_layer.get(layer)
+            if not bucket and not (has_counters and layer == Layer.POWER_TOUGHNESS):
+                continue
+            # Buckets are already in (sublayer, timestamp) order
+            layer_effects = [e for e in bucket or () if self._effect_applies_to_card(e, card)]
             
             if layer == Layer.POWER_TOUGHNESS:
                 self._apply_power_toughness_layer(state, layer_effects, card)
@@ -164,6 +243,9 @@ class LayersEngine:
             if sublayer not in sublayer_effects:
                 sublayer_effects[sublayer] = []
             sublayer_effects[sublayer].append(effect)
+        # Counters apply in 7d whether or not any effect does
+        if state.plus_one_counters or state.minus_one_counters:
+            sublayer_effects.setdefault(PTLayer.COUNTERS.value, [])
         
         # Apply sublayers in order
         for sublayer_value in sorted(sublayer_effects.keys()):
@@ -239,6 +321,8 @@ class LayersEngine:
         effects.sort(key=lambda e: e.timestamp)
         
         for effect in effects:
+            if layer == Layer.ABILITY_EFFECTS and effect.ability_grants:
+                state.abilities.update(effect.ability_grants)
             if effect.apply_to_card:
                 effect.apply_to_card(state, card)
     
@@ -256,6 +340,11 @@ class LayersEngine:
         state = self.characteristic_states[card_id]
         state.plus_one_counters += plus_one_delta
         state.minus_one_counters += minus_one_delta
+        self.invalidate()
+        if self._zones is not None:
+            for entry in self._zones.entries_for_id(card_id):
+                if entry.zone == 'battlefield':
+                    self._zones.notify_change(entry.item, 'counters')
         
         # Handle +1/+1 and -1/-1 counter annihilation (CR 121.3)
         if state.plus_one_counters > 0 and state.minus_one_counters > 0:
@@ -263,6 +352,21 @@ class LayersEngine:
             state.plus_one_counters -= annihilate
             state.minus_one_counters -= annihilate
 
+def _effect_order(effect: ContinuousEffect):
+    return (effect.sublayer or 0, effect.timestamp)
+
+def _base_signature(card) -> tuple:
+    """Card-side inputs to the layer pipeline; a change here invalidates its cached state."""
+    definition = getattr(card, 'definition', None)
+    if definition is not None:
+        # Interned and immutable: identity covers power, toughness, types and colors
+        return (definition, getattr(card, 'controller_id', None))
+    return (card.power, card.toughness, tuple(getattr(card, 'types', ())),
+            tuple(getattr(card, 'color_identity', ())), getattr(card, 'controller_id', None))
+
+def _changes_abilities(effect: ContinuousEffect) -> bool:
+    return effect.layer == Layer.ABILITY_EFFECTS or bool(effect.ability_grants)
+
 # Helper functions for creating common effects
 
 def create_static_buff_effect(source_id: str, power: int, toughness: int,
@@ -276,6 +380,16 @@ def create_static_buff_effect(source_id: str, power: int, toughness: int,
         affects_card=affects_card_func
     )
 
+def create_ability_grant_effect(source_id: str, abilities: List[str],
+                                affects_card_func: callable = None) -> ContinuousEffect:
+    """Create a layer 6 effect that grants keyword abilities (e.g. ["flying"])"""
+    return ContinuousEffect(
+        source_id=source_id,
+        layer=Layer.ABILITY_EFFECTS,
+        ability_grants=list(abilities),
+        affects_card=affects_card_func
+    )
+
 def create_set_pt_effect(source_id: str, power: Optional[int], toughness: Optional[int],
                         affects_card_func: callable = None) -> ContinuousEffect:
     """Create an effect that sets power/toughness to specific values"""
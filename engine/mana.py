@@ -1,6 +1,7 @@
 import re
 from collections import defaultdict
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 MANA_SYMBOL_RE = re.compile(r'\{([^}]+)\}')
 
@@ -8,30 +9,222 @@ COLOR_SYMBOLS = {'W','U','B','R','G'}
 GENERIC_KEY = 'C'   # use 'C' bucket for generic/colorless pool
 ALL_KEYS = COLOR_SYMBOLS | {GENERIC_KEY}
 
-def parse_mana_cost(cost_str: str | None) -> Dict[str,int]:
+class CostVector(NamedTuple):
     """
-    Parse a Scryfall style mana cost string like '{2}{G}{G}' into a dict:
-      {'generic':2,'G':2}  (we store generic under key GENERIC_KEY)
-    Hybrid / phyrexian are simplified: each symbol counts as 1 of either involved color
-    and is returned under a tuple-key placeholder we treat as generic fallback.
-    If cost_str is None/empty returns {}.
+    A parsed mana cost as fixed slots: colored pips, generic (GENERIC_KEY,
+    including simplified hybrid/phyrexian symbols), how many of those were
+    hybrid/phyrexian, and how many X/Y/Z symbols. Immutable and shared; read
+    it like the dict from parse_mana_cost (cost.get('G', 0)).
     """
+    W: int = 0
+    U: int = 0
+    B: int = 0
+    R: int = 0
+    G: int = 0
+    C: int = 0
+    hybrid: int = 0
+    x: int = 0
+
+    def get(self, key: str, default: int = 0) -> int:
+        return getattr(self, key, default) if key in _COST_KEYS else default
+
+    @property
+    def mana_value(self) -> int:
+        return self.W + self.U + self.B + self.R + self.G + self.C
+
+    def with_generic(self, amount: int) -> 'CostVector':
+        """This cost plus amount generic (commander tax, cost increases)."""
+        return self._replace(C=self.C + amount) if amount else self
+
+    def as_dict(self) -> Dict[str, int]:
+        return {k: v for k, v in zip(_COST_KEYS, self) if v}
+
+_COST_KEYS = ('W', 'U', 'B', 'R', 'G', GENERIC_KEY)
+EMPTY_COST = CostVector()
+
+@lru_cache(maxsize=8192)
+def cost_vector(cost_str: str | None) -> CostVector:
+    """Parse a mana cost string once; repeated strings are served from a cache."""
     if not cost_str:
-        return {}
-    result: Dict[str,int] = defaultdict(int)
+        return EMPTY_COST
+    counts = dict.fromkeys(_COST_KEYS, 0)
+    hybrid = x = 0
     for sym in MANA_SYMBOL_RE.findall(cost_str):
         up = sym.upper()
         if up.isdigit():
-            result[GENERIC_KEY] += int(up)
+            counts[GENERIC_KEY] += int(up)
         elif up in COLOR_SYMBOLS:
-            result[up] += 1
+            counts[up] += 1
         elif up in ('X','Y','Z'):
             # variable cost: ignore (player pays 0 by default in this prototype)
-            pass
+            x += 1
         else:
             # Hybrid / phyrexian / snow etc -> treat as generic 1 for now
-            result[GENERIC_KEY] += 1
-    return dict(result)
+            counts[GENERIC_KEY] += 1
+            hybrid += 1
+    return CostVector(*(counts[k] for k in _COST_KEYS), hybrid, x)
+
+def card_cost(card) -> CostVector:
+    """
+    The cost vector of a card: its definition's cached vector, else parsed
+    from mana_cost_str, else the integer mana_cost as generic.
+    """
+    definition = getattr(card, 'definition', None)
+    vector = getattr(definition, 'cost', None)
+    if vector is not None:
+        return vector
+    return cost_for(getattr(card, 'mana_cost_str', None), getattr(card, 'mana_cost', 0))
+
+def cost_for(cost_str: str | None, mana_cost=0) -> CostVector:
+    if cost_str:
+        return cost_vector(cost_str)
+    try:
+        generic = int(mana_cost or 0)
+    except (TypeError, ValueError):
+        generic = 0
+    return CostVector(C=generic) if generic > 0 else EMPTY_COST
+
+def parse_mana_cost(cost_str: str | None) -> Dict[str,int]:
+    """
+    Parse a Scryfall style mana cost string like '{2}{G}{G}' into a dict:
+      {'generic':2,'G':2}  (we store generic under key GENERIC_KEY)
+    Hybrid / phyrexian are simplified: each symbol counts as 1 of either involved color
+    and is returned under a tuple-key placeholder we treat as generic fallback.
+    If cost_str is None/empty returns {}.
+    Returns a fresh dict built from the cached cost_vector.
+    """
+    return cost_vector(cost_str).as_dict()
+
+# ---- Mana sources ----
+
+BASIC_LAND_COLORS = {'Plains': 'W', 'Island': 'U', 'Swamp': 'B', 'Mountain': 'R', 'Forest': 'G'}
+ADD_CLAUSE_RE = re.compile(r'\badd\b([^.]*)', re.IGNORECASE)
+ANY_COLOR_RE = re.compile(r'mana of any (?:one )?color', re.IGNORECASE)
+
+_LAND_COLORS: Dict[tuple, FrozenSet[str]] = {}
+
+def land_colors(card) -> FrozenSet[str]:
+    """
+    Symbols a land can be tapped for: colors from its "Add ..." clauses and
+    basic land types, GENERIC_KEY for colorless. A land whose text names no
+    mana is treated as producing colorless. Cached per card definition.
+    """
+    definition = getattr(card, 'definition', None)
+    key = definition if definition is not None else (getattr(card, 'name', ''), getattr(card, 'text', '') or '',
+                                                     tuple(getattr(card, 'types', ())))
+    colors = _LAND_COLORS.get(key)
+    if colors is None:
+        colors = _parse_land_colors(card)
+        if len(_LAND_COLORS) > 4096:
+            _LAND_COLORS.clear()
+        _LAND_COLORS[key] = colors
+    return colors
+
+def _parse_land_colors(card) -> FrozenSet[str]:
+    found = set()
+    text = getattr(card, 'text', '') or ''
+    for clause in ADD_CLAUSE_RE.findall(text):
+        if ANY_COLOR_RE.search(clause):
+            found |= COLOR_SYMBOLS
+        for sym in MANA_SYMBOL_RE.findall(clause):
+            up = sym.upper()
+            if up in COLOR_SYMBOLS or up == GENERIC_KEY:
+                found.add(up)
+            elif up.isdigit():
+                found.add(GENERIC_KEY)
+    for land_type, color in BASIC_LAND_COLORS.items():
+        if land_type in getattr(card, 'types', ()) or getattr(card, 'name', None) == land_type:
+            found.add(color)
+    return frozenset(found or (GENERIC_KEY,))
+
+class ManaSourceIndex:
+    """
+    A player's lands and the symbols each can produce, rebuilt only when the
+    battlefield list changes (ZoneList.version). Tapped state is read at
+    solve time, so tapping and untapping never invalidate it.
+    """
+
+    def __init__(self, battlefield):
+        self.battlefield = battlefield
+        self.version = getattr(battlefield, 'version', None)
+        self.sources: List[Tuple[object, FrozenSet[str]]] = [
+            (perm, land_colors(perm.card)) for perm in battlefield
+            if hasattr(perm, 'card') and 'Land' in getattr(perm.card, 'types', ())]
+
+    def is_current(self, battlefield) -> bool:
+        return (battlefield is self.battlefield and self.version is not None
+                and self.version == getattr(battlefield, 'version', None))
+
+    def untapped(self) -> List[Tuple[object, FrozenSet[str]]]:
+        return [(perm, colors) for perm, colors in self.sources if not getattr(perm, 'tapped', False)]
+
+    def solve(self, cost: Dict[str, int], pool: Optional[Dict[str, int]] = None):
+        """See solve_payment; uses this player's untapped lands."""
+        return solve_payment(self.untapped(), cost, pool)
+
+def solve_payment(sources, cost: Dict[str, int],
+                  pool: Optional[Dict[str, int]] = None) -> Optional[List[Tuple[object, str]]]:
+    """
+    Choose lands to tap for cost, after spending what is already in pool.
+
+    sources is a list of (permanent, producible symbols). Colored pips are
+    assigned by bipartite matching (augmenting paths), so a dual land is
+    never spent on a pip a basic could cover when that would strand another
+    pip. Generic is paid last, from the least flexible remaining lands and,
+    among equals, from the colors with the most spare supply. Returns a list
+    of (permanent, symbol to tap it for), or None if the cost cannot be paid.
+    Nothing is mutated.
+    """
+    pool = pool or {}
+    # Mana already floating pays first: colored pips, then generic from the leftovers
+    pips: List[str] = []
+    floating = 0
+    for color in COLOR_SYMBOLS:
+        have, need = pool.get(color, 0), cost.get(color, 0)
+        pips.extend([color] * max(0, need - have))
+        floating += max(0, have - need)
+    floating += pool.get(GENERIC_KEY, 0)
+    generic = max(0, cost.get(GENERIC_KEY, 0) - floating)
+    if len(pips) + generic > len(sources):
+        return None
+
+    supply = defaultdict(int)
+    for _, colors in sources:
+        for color in colors:
+            supply[color] += 1
+    # Least flexible first; then lands whose colors are plentiful
+    order = sorted(range(len(sources)), key=lambda i: (
+        len(sources[i][1]), -min(supply[c] for c in sources[i][1])))
+    # Scarcest colors choose first, which keeps augmenting paths short
+    pips.sort(key=lambda c: supply[c])
+
+    match_of_source: Dict[int, int] = {}     # source position -> pip position
+
+    def augment(pip: int, seen: set) -> bool:
+        color = pips[pip]
+        for i in order:
+            if i in seen or color not in sources[i][1]:
+                continue
+            seen.add(i)
+            if i not in match_of_source or augment(match_of_source[i], seen):
+                match_of_source[i] = pip
+                return True
+        return False
+
+    for pip in range(len(pips)):
+        if not augment(pip, set()):
+            return None
+
+    plan = [(sources[i][0], pips[pip]) for i, pip in match_of_source.items()]
+    if generic:
+        spare = [i for i in order if i not in match_of_source][:generic]
+        if len(spare) < generic:
+            return None
+        for i in spare:
+            colors = sources[i][1]
+            symbol = GENERIC_KEY if GENERIC_KEY in colors else max(colors, key=lambda c: (supply[c], c))
+            plan.append((sources[i][0], symbol))
+    return plan
 
 class ManaPool:
     """
@@ -42,6 +235,7 @@ class ManaPool:
     def __init__(self):
         self.pool: Dict[str,int] = {k:0 for k in ALL_KEYS}
         self.sources: Dict[str, list] = {k: [] for k in ALL_KEYS}  # Track which permanents produced mana
+        self._source_index: Optional[ManaSourceIndex] = None   # cache for source_index()
 
     def add(self, symbol: str, amount: int = 1, source=None):
         symbol = symbol.upper()
@@ -154,42 +348,33 @@ class ManaPool:
         self.add(symbol, 1, source=land_perm)
         return True
 
+    def source_index(self, battlefield) -> ManaSourceIndex:
+        """This player's ManaSourceIndex, rebuilt only when the battlefield changed."""
+        index = self._source_index
+        if index is None or not index.is_current(battlefield):
+            index = ManaSourceIndex(battlefield)
+            self._source_index = index
+        return index
+
+    def payment_plan(self, battlefield, cost: Dict[str,int]) -> Optional[List[Tuple[object, str]]]:
+        """Lands to tap (and for what) to pay cost with the pool's help, or None. Read-only."""
+        return self.source_index(battlefield).solve(cost, self.pool)
+
+    def can_pay_with_lands(self, battlefield, cost: Dict[str,int]) -> bool:
+        """Whether cost is payable from the pool plus untapped lands, without tapping anything."""
+        return self.can_pay(cost) or self.payment_plan(battlefield, cost) is not None
+
     def autotap_for_cost(self, battlefield, cost: Dict[str,int]) -> bool:
         """
         Attempt to tap lands on the battlefield to produce the required mana for cost.
-        Returns True if successful, False if not.
+        Lands are chosen by solve_payment in one pass; nothing is tapped when the
+        cost cannot be paid. Returns True if successful, False if not.
         """
-        needed = cost.copy()
-        # Tap colored first
-        for color in COLOR_SYMBOLS:
-            n = needed.get(color, 0)
-            while n > 0:
-                found = next((perm for perm in battlefield if hasattr(perm, "card") and
-                              "Land" in getattr(perm.card, "types", []) and not getattr(perm, "tapped", False)
-                              and color in perm.card.text), None)
-                if not found:
-                    break
-                self.tap_land_for_mana(found, color)
-                n -= 1
-            needed[color] = n
-        # Tap for generic
-        generic = needed.get(GENERIC_KEY, 0)
-        while generic > 0:
-            found = next((perm for perm in battlefield if hasattr(perm, "card") and
-                          "Land" in getattr(perm.card, "types", []) and not getattr(perm, "tapped", False)), None)
-            if not found:
-                break
-            # Heuristic: try to tap for any color, prefer generic
-            produced = None
-            for color in COLOR_SYMBOLS:
-                if color in found.card.text:
-                    produced = color
-                    break
-            if not produced:
-                produced = GENERIC_KEY
-            self.tap_land_for_mana(found, produced)
-            generic -= 1
-        # After autotap, check if pool can pay
+        plan = self.payment_plan(battlefield, cost)
+        if plan is None:
+            return False
+        for perm, symbol in plan:
+            self.tap_land_for_mana(perm, symbol)
         return self.can_pay(cost)
 
     def cast_with_pool_and_lands(self, cost: Dict[str,int], battlefield) -> bool:
@@ -0,0 +1,156 @@
+"""
+Shared Parse Cache for Oracle Text
+
+Regex parsing of card text (rules_engine.parse_oracle_text, keyword extraction,
+AbilityEngine ability parsing) depends only on the card's text, so every copy
+of a card - and every new game - can reuse the first result. Entries are keyed
+by (kind, card name, text) and evicted least-recently-used past `maxsize`.
+
+The cache can be saved to / loaded from disk so parsed abilities survive
+restarts. The file is tagged with a fingerprint of the parser sources and is
+ignored when any of them changes.
+"""
+
+import atexit
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+DEFAULT_CACHE_PATH = os.path.join('data', 'cards', 'parse_cache.pkl')
+DEFAULT_MAXSIZE = 20000
+_FORMAT_VERSION = 1
+
+# Modules whose code determines the parse results
+_PARSER_SOURCES = ('rules_engine.py', 'keywords.py', 'enhanced_keywords.py', 'ability_engine.py')
+
+
+def _parser_fingerprint() -> str:
+    h = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in _PARSER_SOURCES:
+        try:
+            with open(os.path.join(here, name), 'rb') as f:
+                h.update(f.read())
+        except OSError:
+            h.update(name.encode())
+    return h.hexdigest()
+
+
+class ParseCache:
+    """Bounded LRU cache of parse results keyed by (kind, name, text)."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_parse(self, kind: str, name: str, text: str, parser: Callable[[str], Any]):
+        """
+        Return the cached result for (kind, name, text), running parser(text)
+        on a miss. Lists and dicts are returned as fresh shallow copies so
+        callers may extend them without touching the shared entry.
+        """
+        key = (kind, name or '', text or '')
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _fresh(self._entries[key])
+        value = parser(text)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self.dirty = True
+        return _fresh(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            self.dirty = False
+
+    def stats(self) -> dict:
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    # ---- Persistence ----
+    def save(self, path: str = DEFAULT_CACHE_PATH) -> bool:
+        """Write the cache to disk atomically. Returns False on I/O errors."""
+        with self._lock:
+            payload = {'version': _FORMAT_VERSION, 'fingerprint': _parser_fingerprint(),
+                       'entries': list(self._entries.items())}
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            return False
+        self.dirty = False
+        return True
+
+    def load(self, path: str = DEFAULT_CACHE_PATH) -> int:
+        """Merge entries from disk; returns how many were loaded (0 if stale/missing)."""
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return 0
+        if (not isinstance(payload, dict) or payload.get('version') != _FORMAT_VERSION
+                or payload.get('fingerprint') != _parser_fingerprint()):
+            return 0
+        entries = payload.get('entries', [])
+        with self._lock:
+            for key, value in entries:
+                self._entries.setdefault(key, value)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return len(entries)
+
+
+def _fresh(value):
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+# Process-wide cache shared by the card loaders and rules engines
+PARSE_CACHE = ParseCache()
+_LOADED_FROM: Optional[str] = None
+
+
+def cached_parse(kind: str, name: str, text: str, parser: Callable[[str], Any]):
+    """Shorthand for PARSE_CACHE.get_or_parse."""
+    return PARSE_CACHE.get_or_parse(kind, name, text, parser)
+
+
+def ensure_parse_cache_loaded(path: str = DEFAULT_CACHE_PATH, save_at_exit: bool = True) -> int:
+    """Load the on-disk cache once per process and (optionally) save it again at exit."""
+    global _LOADED_FROM
+    if _LOADED_FROM is not None:
+        return 0
+    _LOADED_FROM = path
+    if save_at_exit:
+        atexit.register(save_parse_cache)
+    return PARSE_CACHE.load(path)
+
+
+def save_parse_cache(path: Optional[str] = None) -> bool:
+    """Persist the shared cache if it has new entries."""
+    if not PARSE_CACHE.dirty:
+        return True
+    return PARSE_CACHE.save(path or _LOADED_FROM or DEFAULT_CACHE_PATH)
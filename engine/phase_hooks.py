@@ -1,4 +1,3 @@
-from PySide6.QtCore import QTimer
 import time
 
 # Canonical phase order and display names
@@ -0,0 +1,167 @@
+"""
+Hand Playability
+
+Evaluates a whole hand against the player's mana pool plus untapped lands in
+one pass, for UI highlighting and AI move generation:
+
+    result = evaluate_hand(player, game, phase='main1')
+    result.mask        # one bool per card (a NumPy array when NumPy is installed)
+    result.reasons     # one short reason per card
+    result.playable()  # the playable cards
+
+Costs come from the cached per-definition cost vectors (engine.mana.CostVector)
+and are checked with array arithmetic: per-color shortfall against floating
+mana plus the lands able to make that color, and total mana value against
+everything available. With only single-color lands those checks are exact;
+when dual lands are present, cards that pass are confirmed with
+solve_payment, once per distinct cost. NumPy is optional; without it the same
+arithmetic runs over plain tuples.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from .mana import COLOR_SYMBOLS, ManaPool, card_cost, solve_payment
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+_COLORS = ('W', 'U', 'B', 'R', 'G')
+MAIN_PHASES = ('main1', 'main2')
+
+# Reasons, in the words GameAppAPI.can_play_card already uses
+CAN_PLAY = "Card can be played"
+CAN_PLAY_LAND = "Can play land"
+LAND_PLAYED = "Already played a land this turn"
+NO_MANA = "Insufficient mana"
+SORCERY_SPEED = "Sorceries can only be played during main phases"
+
+
+class HandPlayability(NamedTuple):
+    """Result of evaluate_hand; mask and reasons line up with cards."""
+    cards: List[Any]
+    mask: Sequence[bool]
+    reasons: List[str]
+
+    def playable(self) -> List[Any]:
+        return [card for card, ok in zip(self.cards, self.mask) if ok]
+
+    def reason_for(self, card) -> Optional[str]:
+        for i, candidate in enumerate(self.cards):
+            if candidate is card:
+                return self.reasons[i]
+        return None
+
+
+def _has_flash(card) -> bool:
+    keyword_set = getattr(card, 'keyword_set', None)
+    if keyword_set is None:
+        keyword_set = {k.lower() for k in (getattr(card, 'keywords', None) or {})}
+    return 'flash' in keyword_set
+
+
+def _available(player):
+    """(pool vector, per-color land counts, untapped sources, any multicolor land)."""
+    mana_pool = getattr(player, 'mana_pool', None)
+    pool = dict(getattr(mana_pool, 'pool', {}) or {})
+    battlefield = getattr(player, 'battlefield', [])
+    if isinstance(mana_pool, ManaPool):
+        sources = mana_pool.source_index(battlefield).untapped()
+    else:
+        sources = ManaPool().source_index(battlefield).untapped()
+    producible = dict.fromkeys(_COLORS, 0)
+    multicolor = False
+    for _, colors in sources:
+        colored = colors & COLOR_SYMBOLS
+        multicolor = multicolor or len(colored) > 1
+        for color in colored:
+            producible[color] += 1
+    return pool, producible, sources, multicolor
+
+
+def _costs(player, cards) -> List[tuple]:
+    tracker = getattr(player, 'commander_tracker', None)
+    rows = []
+    for card in cards:
+        vector = card_cost(card)
+        if getattr(card, 'is_commander', False) and tracker is not None:
+            vector = vector.with_generic(tracker.tax_for(card.id))
+        rows.append(vector)
+    return rows
+
+
+def _affordable(costs: List[tuple], pool: Dict[str, int], producible: Dict[str, int],
+                total_available: int) -> List[bool]:
+    """Necessary (and, with single-color lands, sufficient) mana checks for every cost row."""
+    if not costs:
+        return []
+    pool_colors = [pool.get(c, 0) for c in _COLORS]
+    can_make = [producible[c] for c in _COLORS]
+    if np is not None:
+        matrix = np.asarray([row[:6] for row in costs], dtype=np.int32)
+        short = np.maximum(matrix[:, :5] - np.asarray(pool_colors, dtype=np.int32), 0)
+        colors_ok = (short <= np.asarray(can_make, dtype=np.int32)).all(axis=1)
+        return colors_ok & (matrix.sum(axis=1) <= total_available)
+    result = []
+    for row in costs:
+        ok = sum(row[:6]) <= total_available
+        for need, have, make in zip(row[:5], pool_colors, can_make):
+            if need - have > make:
+                ok = False
+                break
+        result.append(ok)
+    return result
+
+
+def evaluate_hand(player, game=None, phase: Optional[str] = None,
+                  cards: Optional[Sequence[Any]] = None) -> HandPlayability:
+    """
+    Which cards of player's hand (or of cards) can be played now.
+
+    Lands need an unused land drop (known only when game is given). Spells
+    need their cost, including commander tax, to be payable from the pool
+    plus untapped lands. When phase is given, sorceries without flash need a
+    main phase. Nothing is tapped or spent.
+    """
+    cards = list(player.hand if cards is None else cards)
+    pool, producible, sources, multicolor = _available(player)
+    total_available = sum(pool.values()) + len(sources)
+
+    is_land = ['Land' in getattr(card, 'types', ()) for card in cards]
+    spells = [i for i, land in enumerate(is_land) if not land]
+    costs = _costs(player, [cards[i] for i in spells])
+    affordable = list(_affordable(costs, pool, producible, total_available))
+
+    if multicolor:
+        # Dual lands: confirm survivors exactly, once per distinct cost
+        solved: Dict[tuple, bool] = {}
+        for k, ok in enumerate(affordable):
+            if ok:
+                key = tuple(costs[k])
+                if key not in solved:
+                    solved[key] = solve_payment(sources, costs[k], pool) is not None
+                affordable[k] = solved[key]
+
+    land_played = False
+    if game is not None:
+        land_played = bool(getattr(game, 'land_played_this_turn', {}).get(player.player_id, False))
+    sorcery_ok = phase is None or phase in MAIN_PHASES
+
+    mask = [False] * len(cards)
+    reasons = [CAN_PLAY] * len(cards)
+    for i, land in enumerate(is_land):
+        if land:
+            mask[i] = not land_played
+            reasons[i] = LAND_PLAYED if land_played else CAN_PLAY_LAND
+    for k, i in enumerate(spells):
+        card = cards[i]
+        if not affordable[k]:
+            reasons[i] = NO_MANA
+        elif not sorcery_ok and 'Sorcery' in getattr(card, 'types', ()) and not _has_flash(card):
+            reasons[i] = SORCERY_SPEED
+        else:
+            mask[i] = True
+    if np is not None:
+        mask = np.asarray(mask, dtype=bool)
+    return HandPlayability(cards, mask, reasons)
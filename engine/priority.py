@@ -127,26 +127,12 @@ class PriorityManager:
         """Get next player in APNAP (Active Player, Non-Active Player) order"""
         if not self.game.players:
             return 0
-            
-        # For 2-player games: simple alternation
-        if len(self.game.players) == 2:
-            return 1 - current_player
-            
-        # For multiplayer: clockwise from active player
-        active = self.game.active_player
-        player_count = len(self.game.players)
-        
-        # Find current player's position relative to active player
-        if current_player == active:
-            # Active player passes to next non-active player
-            return (active + 1) % player_count
-        else:
-            # Non-active players pass in turn order
-            return (current_player + 1) % player_count
+        # Next remaining player clockwise; eliminated players are skipped
+        return self.game.turn_order.next(current_player)
     
     def _all_players_passed(self) -> bool:
-        """Check if all players have passed priority this round"""
-        return len(self.players_passed) >= len(self.game.players)
+        """Check if all remaining players have passed priority this round"""
+        return len(self.players_passed) >= len(self.game.turn_order.alive)
     
     def _stack_empty(self) -> bool:
         """Check if the stack is empty"""
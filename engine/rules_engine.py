@@ -1,10 +1,12 @@
 import re
+from collections import deque
 from typing import List
 from engine.keywords import (
     Ability, TriggeredAbility, StaticKeywordAbility,
     TriggerEvent, ActivatedAbility, StaticBuffAbility
 )
 from engine.mana import ManaPool, parse_mana_cost  # already correct import for mana/mana pool
+from engine.parse_cache import cached_parse
 # Phase hooks imports removed - not used in rules engine core logic
 
 # Regex patterns (very small subset)
@@ -141,7 +143,7 @@ class RulesEngine:
     def __init__(self, game):
         self.game = game
         self.card_abilities = {}  # card.id -> list[Ability]
-        self.trigger_queue: list[TriggerEvent] = []
+        self.trigger_queue: deque[TriggerEvent] = deque()
         self.processing = False
         self.pending_activation = None  # (card, ability) while selecting target
 
@@ -198,7 +200,7 @@ class RulesEngine:
         try:
             count = 0
             while self.trigger_queue and count < limit:
-                evt = self.trigger_queue.pop(0)
+                evt = self.trigger_queue.popleft()
                 card = self._find_card(evt.source_card_id)
                 if getattr(self.game, 'debug_rules', False):
                     # Trigger resolving (debug print removed)
@@ -271,6 +273,9 @@ class RulesEngine:
 
     # --- Internal helper stubs ---
     def _find_card(self, cid):
+        zones = getattr(self.game, 'zones', None)
+        if zones is not None:
+            return zones.find_card(cid, ('battlefield', 'hand', 'graveyard', 'exile'))
         # Linear search across zones (prototype)
         for p in self.game.players:
             for zone in (p.battlefield, p.hand, p.graveyard, getattr(p,'exile',[])):
@@ -281,6 +286,9 @@ class RulesEngine:
         return None
 
     def _find_permanent(self, cid):
+        zones = getattr(self.game, 'zones', None)
+        if zones is not None:
+            return zones.find_permanent(cid)
         for p in self.game.players:
             for perm in p.battlefield:
                 if getattr(perm.card,'id',None)==cid:
@@ -331,7 +339,7 @@ def init_rules(game):
 
 def parse_and_attach(card):
     text = getattr(card, 'text', '') or ''
-    abilities = parse_oracle_text(text)
+    abilities = cached_parse('oracle', getattr(card, 'name', ''), text, parse_oracle_text)
     card.oracle_abilities = abilities
     return abilities
 
@@ -0,0 +1,237 @@
+"""
+Headless AI-vs-AI Game Simulator
+
+Runs complete Commander games without the Qt front end so decks can be tuned
+over thousands of games. Games are built with engine.game_init.new_game and
+advanced directly through GameState.next_phase, with every seat driven by
+BasicAI.take_turn. Batches are fanned out across a ProcessPoolExecutor; each
+worker receives its own seed so a batch is reproducible for a given base seed.
+
+Usage:
+    python -m engine.simulate --deck "A=data/decks/a.txt" --deck "B=data/decks/b.txt" \\
+        --games 1000 --workers 8 --seed 42
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ai.basic_ai import BasicAI
+from engine.parse_cache import save_parse_cache
+
+DEFAULT_MAX_TURNS = 60
+OPENING_HAND_SIZE = 7
+
+DeckSpec = Tuple[str, str]  # (player name, deck path)
+
+
+@dataclass
+class GameResult:
+    """Outcome of a single simulated game."""
+    seed: int
+    winner: Optional[str]           # None on a draw / turn limit
+    turns: int
+    life_totals: Dict[str, int] = field(default_factory=dict)
+    hit_turn_limit: bool = False
+
+
+@dataclass
+class BatchReport:
+    """Aggregated statistics for a batch of simulated games."""
+    games: int = 0
+    elapsed: float = 0.0
+    wins: Dict[str, int] = field(default_factory=dict)
+    draws: int = 0
+    total_turns: int = 0
+    min_turns: Optional[int] = None
+    max_turns: Optional[int] = None
+    turn_limit_hits: int = 0
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def avg_turns(self) -> float:
+        return self.total_turns / self.games if self.games else 0.0
+
+    def win_rate(self, name: str) -> float:
+        return self.wins.get(name, 0) / self.games if self.games else 0.0
+
+    def add(self, result: GameResult):
+        """Fold a single game result into the report."""
+        self.games += 1
+        self.total_turns += result.turns
+        self.min_turns = result.turns if self.min_turns is None else min(self.min_turns, result.turns)
+        self.max_turns = result.turns if self.max_turns is None else max(self.max_turns, result.turns)
+        if result.hit_turn_limit:
+            self.turn_limit_hits += 1
+        if result.winner is None:
+            self.draws += 1
+        else:
+            self.wins[result.winner] = self.wins.get(result.winner, 0) + 1
+
+    def summary(self) -> str:
+        lines = [
+            f"Games: {self.games} in {self.elapsed:.2f}s ({self.games_per_sec:.1f} games/sec)",
+            f"Turns: avg {self.avg_turns:.1f}, min {self.min_turns}, max {self.max_turns}",
+        ]
+        for name, count in sorted(self.wins.items(), key=lambda kv: -kv[1]):
+            lines.append(f"  {name}: {count} wins ({self.win_rate(name) * 100:.1f}%)")
+        lines.append(f"  Draws: {self.draws} (turn limit reached {self.turn_limit_hits}x)")
+        return "\n".join(lines)
+
+
+def _build_game(deck_specs: Sequence[DeckSpec]):
+    """Create a fresh all-AI game and return (game, ai_controllers)."""
+    from engine.game_init import new_game
+    specs = [(name, path, True) for name, path in deck_specs]
+    game, ai_ids = new_game(specs, ai_enabled=True)
+    for player in game.players:
+        player.draw(OPENING_HAND_SIZE)
+    game.ensure_progress()
+    return game, {pid: BasicAI(pid=pid) for pid in ai_ids}
+
+
+def _pick_winner(game) -> Optional[str]:
+    """Return the surviving player's name, or None when the game is a draw."""
+    survivors = [p for p in game.players if p.life > 0]
+    if not survivors:
+        return None
+    best = max(p.life for p in survivors)
+    leaders = [p for p in survivors if p.life == best]
+    return leaders[0].name if len(leaders) == 1 else None
+
+
+def play_game(game, ai_controllers: Dict[int, BasicAI], max_turns: int = DEFAULT_MAX_TURNS) -> Tuple[int, bool]:
+    """
+    Drive a prepared game to completion in a tight loop.
+    The active player's AI acts once in its precombat main phase; the stack is
+    drained after every action. Returns (turns_played, hit_turn_limit).
+    """
+    while not game.check_game_over():
+        if game.turn > max_turns:
+            return game.turn - 1, True
+        if game.phase == "PRECOMBAT_MAIN":
+            ai = ai_controllers.get(game.active_player)
+            if ai is not None:
+                ai.take_turn(game)
+        while game.stack.can_resolve():
+            game.stack.resolve_top(game)
+        if game.check_game_over():
+            break
+        game.next_phase()
+    return game.turn, False
+
+
+def run_game(deck_specs: Sequence[DeckSpec], seed: int, max_turns: int = DEFAULT_MAX_TURNS) -> GameResult:
+    """Build and play one game with the given seed."""
+    random.seed(seed)
+    game, ai_controllers = _build_game(deck_specs)
+    turns, hit_limit = play_game(game, ai_controllers, max_turns)
+    return GameResult(
+        seed=seed,
+        winner=None if hit_limit else _pick_winner(game),
+        turns=turns,
+        life_totals={p.name: p.life for p in game.players},
+        hit_turn_limit=hit_limit,
+    )
+
+
+def _run_chunk(deck_specs: Sequence[DeckSpec], worker_seed: int, games: int,
+               max_turns: int, quiet: bool) -> List[GameResult]:
+    """Worker entry point: play `games` games from a single worker seed."""
+    rng = random.Random(worker_seed)
+    results = []
+    sink = io.StringIO() if quiet else None
+    for _ in range(games):
+        seed = rng.getrandbits(32)
+        if sink is not None:
+            with contextlib.redirect_stdout(sink):
+                results.append(run_game(deck_specs, seed, max_turns))
+            sink.seek(0)
+            sink.truncate()
+        else:
+            results.append(run_game(deck_specs, seed, max_turns))
+    # Pool workers exit without running atexit hooks, so persist parses here
+    save_parse_cache()
+    return results
+
+
+def _split(total: int, parts: int) -> List[int]:
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+def run_batch(deck_specs: Sequence[DeckSpec], games: int, workers: int = None,
+              base_seed: int = 0, max_turns: int = DEFAULT_MAX_TURNS,
+              quiet: bool = True) -> BatchReport:
+    """
+    Simulate `games` games across a process pool and aggregate the results.
+    Worker i plays its share of games from seed base_seed + i, so a batch is
+    reproducible for the same (games, workers, base_seed).
+    With workers=1 the games run in-process (useful for profiling).
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, games)) if games > 0 else 1
+    report = BatchReport()
+    start = time.perf_counter()
+    chunks = [(base_seed + i, n) for i, n in enumerate(_split(games, workers)) if n > 0]
+    if workers == 1:
+        for worker_seed, n in chunks:
+            for result in _run_chunk(deck_specs, worker_seed, n, max_turns, quiet):
+                report.add(result)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_chunk, list(deck_specs), worker_seed, n, max_turns, quiet)
+                       for worker_seed, n in chunks]
+            for fut in futures:
+                for result in fut.result():
+                    report.add(result)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def _parse_deck_args(values: Optional[List[str]]) -> List[DeckSpec]:
+    specs = []
+    for spec in values or []:
+        if '=' not in spec:
+            continue
+        name, path = spec.split('=', 1)
+        specs.append((name, path.rsplit(':AI', 1)[0]))
+    return specs
+
+
+def _default_specs() -> List[DeckSpec]:
+    decks_dir = os.path.join('data', 'decks')
+    files = sorted(f for f in os.listdir(decks_dir) if f.lower().endswith('.txt'))[:2]
+    return [(os.path.splitext(f)[0], os.path.join(decks_dir, f)) for f in files]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Headless AI-vs-AI Commander batch simulator")
+    ap.add_argument('--deck', action='append', metavar='NAME=PATH',
+                    help='Seat a deck (repeat for each player); defaults to the first two decks in data/decks')
+    ap.add_argument('--games', type=int, default=100, help='Number of games to simulate')
+    ap.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    ap.add_argument('--seed', type=int, default=0, help='Base seed; worker i uses seed+i')
+    ap.add_argument('--max-turns', type=int, default=DEFAULT_MAX_TURNS, help='Turn limit before a game is a draw')
+    ap.add_argument('--verbose', action='store_true', help='Show deck loading output from workers')
+    args = ap.parse_args(argv)
+
+    specs = _parse_deck_args(args.deck) or _default_specs()
+    if len(specs) < 2:
+        ap.error("at least two decks are required")
+    report = run_batch(specs, args.games, workers=args.workers, base_seed=args.seed,
+                       max_turns=args.max_turns, quiet=not args.verbose)
+    print(report.summary())
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Game State Snapshots
+
+Copy-on-write snapshot / restore / fork of a GameState for AI lookahead and
+undo.
+
+Taking a snapshot copies almost nothing: it starts an undo journal on the
+game's ZoneIndex. The first write to a zone list, a Permanent, a PlayerState
+or the GameState itself after a snapshot records that object's previous
+contents (see ZoneList._touch and the __setattr__ hooks), so restoring costs
+in proportion to what changed, not to the size of the board. Mana pools,
+commander tracking, land drops and the stack are mutated in place without a
+hook; they are small and are copied with every snapshot.
+
+    snap = game.snapshot()      # mark
+    ...                         # try a line of play
+    game.restore(snap)          # undo in place; snap stays usable
+    game.release(snap)          # done with it - stop journaling
+    child = game.fork()         # independent GameState sharing Card objects
+
+Snapshots nest like a stack: restoring or releasing one discards the ones
+taken after it.
+
+Card objects are treated as immutable definitions and shared by reference;
+neither snapshots nor forks protect Card attributes, so change the Permanent
+or player overlay instead. Forks carry no engines (rules, abilities, SBA,
+layers); attach whatever the search needs with the usual init_* helpers.
+"""
+
+from typing import Any, Dict, List
+
+from .zones import ZONE_NAMES, ZoneIndex, ZoneList, object_state, set_object_state
+
+# Immutable values that a fork can share with its parent
+_PLAIN = (int, float, str, bool, bytes, tuple, frozenset, type(None))
+
+# Mutable containers copied (two levels deep) instead of shared
+_CONTAINERS = (dict, list, set)
+
+
+def _copy_container(value):
+    """Copy a dict/list/set and any dict/list/set directly inside it."""
+    if type(value) is dict:
+        return {k: (v.copy() if type(v) in _CONTAINERS else v) for k, v in value.items()}
+    if type(value) is list:
+        return [v.copy() if type(v) in _CONTAINERS else v for v in value]
+    return value.copy()
+
+
+def _copy_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an attribute dict; containers in it are copied two levels deep, the rest shared."""
+    out = state.copy()
+    for key, value in state.items():
+        if type(value) in _CONTAINERS:
+            out[key] = _copy_container(value)
+    return out
+
+
+def _zones_replaced(current: Dict[str, Any], saved: Dict[str, Any]) -> bool:
+    """True if restoring saved over current swaps zone lists (or the players list)."""
+    for key in ZONE_NAMES + ('players',):
+        if current.get(key) is not saved.get(key):
+            return True
+    return False
+
+
+class GameSnapshot:
+    """A point a GameState can be restored to; see module docstring."""
+
+    __slots__ = ('game', 'mark', 'land_played', 'mana', 'trackers', 'stack')
+
+    def __init__(self, game):
+        index: ZoneIndex = game.zones
+        self.game = game
+        if index._journal is None:
+            index._journal = []
+        self.mark = len(index._journal)
+        index._generation += 1
+        index._snapshots.append(self)
+
+        self.land_played = dict(game.land_played_this_turn)
+        self.mana = tuple((ps.mana_pool, _copy_state(vars(ps.mana_pool))) for ps in game.players)
+        self.trackers = tuple((ps.commander_tracker, _copy_state(vars(ps.commander_tracker)))
+                              for ps in game.players)
+        items = getattr(game.stack, '_items', None)
+        self.stack = (tuple((item, _copy_state(object_state(item))) for item in items)
+                      if items is not None else None)
+
+    @property
+    def live(self) -> bool:
+        return any(s is self for s in self.game.zones._snapshots)
+
+    def restore(self):
+        """Put the game back exactly as it was when this snapshot was taken (same objects)."""
+        game = self.game
+        index: ZoneIndex = game.zones
+        self._drop_newer(index)
+
+        journal = index._journal
+        index._journal = None          # replay without journaling the replay
+        rebind = False
+        try:
+            for obj, state in reversed(journal[self.mark:]):
+                if isinstance(obj, ZoneList):
+                    if obj._index is index:
+                        obj._replace(state)        # keeps the index current
+                    else:
+                        list.__setitem__(obj, slice(None), state)
+                        obj.version += 1
+                else:
+                    rebind = rebind or _zones_replaced(object_state(obj), state)
+                    set_object_state(obj, state)
+        finally:
+            del journal[self.mark:]
+            index._journal = journal
+            index._saved.clear()
+            index._generation += 1
+        if rebind:
+            game._bind_zones()
+
+        game.land_played_this_turn.clear()
+        game.land_played_this_turn.update(self.land_played)
+        for pool, state in self.mana:
+            set_object_state(pool, _copy_state(state))
+        for tracker, state in self.trackers:
+            set_object_state(tracker, _copy_state(state))
+        if self.stack is not None:
+            game.stack._items[:] = [item for item, _ in self.stack]
+            for item, state in self.stack:
+                set_object_state(item, _copy_state(state))
+
+        # Replayed writes bypass change tracking; have the engines recompute
+        sba = getattr(game, 'state_based_actions', None)
+        if sba is not None and hasattr(sba, 'mark_all_dirty'):
+            sba.mark_all_dirty()
+        layers = getattr(game, 'layers_engine', None)
+        if layers is not None and hasattr(layers, 'invalidate'):
+            layers.invalidate(abilities=True)
+
+    def release(self):
+        """Forget this snapshot and every newer one; journaling stops when none are left."""
+        index: ZoneIndex = self.game.zones
+        self._drop_newer(index)
+        index._snapshots.pop()
+        if not index._snapshots:
+            index._journal = None
+            index._saved.clear()
+
+    def _drop_newer(self, index: ZoneIndex):
+        if not self.live:
+            raise ValueError("snapshot was already released or discarded")
+        while index._snapshots[-1] is not self:
+            index._snapshots.pop()
+
+
+def snapshot(game) -> GameSnapshot:
+    """Mark game's current state for a later restore()."""
+    return GameSnapshot(game)
+
+
+def restore(game, snap: GameSnapshot):
+    """Restore game to snap (taken from the same game)."""
+    if snap.game is not game:
+        raise ValueError("snapshot belongs to a different game")
+    snap.restore()
+
+
+def release(game, snap: GameSnapshot):
+    """Drop snap (and newer snapshots) of game."""
+    if snap.game is not game:
+        raise ValueError("snapshot belongs to a different game")
+    snap.release()
+
+
+def fork(game):
+    """An independent copy of game for lookahead; Card objects are shared."""
+    perm_map: Dict[int, Any] = {}
+    for ps in game.players:
+        for perm in ps.battlefield:
+            clone = object.__new__(type(perm))
+            state = _copy_state(object_state(perm))
+            state['_zone_index'] = None
+            set_object_state(clone, state)
+            perm_map[id(perm)] = clone
+
+    def remap(obj):
+        return perm_map.get(id(obj), obj)
+
+    for clone in perm_map.values():
+        if getattr(clone, 'attached_to', None) is not None:
+            object.__setattr__(clone, 'attached_to', remap(clone.attached_to))
+
+    players: List[Any] = []
+    for src in game.players:
+        ps = object.__new__(type(src))
+        for key, value in vars(src).items():
+            if key == '_zone_index':
+                continue
+            if key in ZONE_NAMES:
+                value = ZoneList(remap(item) for item in value)
+            elif key in ('mana_pool', 'commander_tracker'):
+                helper = object.__new__(type(value))
+                helper.__dict__.update(_copy_state(vars(value)))
+                value = helper
+            elif type(value) in _CONTAINERS:
+                value = _copy_container(value)
+            ps.__dict__[key] = value
+        for sources in ps.mana_pool.__dict__.get('sources', {}).values():
+            sources[:] = [remap(s) for s in sources]
+        players.append(ps)
+
+    clone = object.__new__(type(game))
+    # Engines and UI callbacks point at the parent; a fork gets only plain state
+    clone.__dict__.update({k: v for k, v in vars(game).items() if isinstance(v, _PLAIN)})
+    clone.__dict__['players'] = players
+    clone.__dict__['land_played_this_turn'] = dict(game.land_played_this_turn)
+    stack = object.__new__(type(game.stack))
+    stack.__dict__.update({k: v for k, v in vars(game.stack).items() if k != '_items'})
+    stack.__dict__['game'] = clone
+    stack.__dict__['_items'] = [_clone_item(item) for item in getattr(game.stack, '_items', ())]
+    clone.__dict__['stack'] = stack
+    clone.__dict__['zones'] = ZoneIndex()
+    clone._bind_zones()
+    return clone
+
+
+def _clone_item(item):
+    copy_item = object.__new__(type(item))
+    set_object_state(copy_item, _copy_state(object_state(item)))
+    return copy_item
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Optional, List, Dict, Any
 from enum import Enum
 
 if TYPE_CHECKING:
+    from .mana import CostVector
     from .game_state import GameState
     from .card_engine import Card
 
@@ -271,20 +272,17 @@ class CastingProcessor:
         # Handle cards that distribute effects among targets
         return True
     
-    def _determine_total_cost(self, card: 'Card', player_id: int) -> Dict[str, int]:
+    def _determine_total_cost(self, card: 'Card', player_id: int) -> 'CostVector':
         """CR 601.2e: Determine total cost including additional costs"""
-        base_cost = getattr(card, 'mana_cost_str', '') or ''
-        
-        # Parse base cost
-        from .mana import parse_mana_cost
-        total_cost = parse_mana_cost(base_cost)
+        # Base cost, parsed once per card definition
+        from .mana import card_cost
+        total_cost = card_cost(card)
         
         # Add commander tax if applicable
         if getattr(card, 'is_commander', False):
             player = self.game.players[player_id]
             if hasattr(player, 'commander_tracker'):
-                tax = player.commander_tracker.tax_for(card.id)
-                total_cost['C'] = total_cost.get('C', 0) + tax
+                total_cost = total_cost.with_generic(player.commander_tracker.tax_for(card.id))
         
         # Additional costs would be added here
         # (kicker, X costs, etc.)
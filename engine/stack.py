@@ -4,7 +4,7 @@ from typing import Callable, Any, List, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from .game_state import GameState
 
-@dataclass
+@dataclass(slots=True)
 class StackItem:
     # Unified / compatible fields
     source: Any = None
@@ -5,14 +5,26 @@ Magic: The Gathering Comprehensive Rules 704.
 
 State-based actions are checked continuously and performed automatically
 whenever a player would receive priority.
+
+By default checks are incremental: the engine watches the game's ZoneIndex
+for zone changes and for assignments to the permanent / player attributes
+that SBAs depend on (damage, loyalty, attachments, life, poison), and only
+re-examines those objects. A LayersEngine watching the same ZoneIndex (see
+LayersEngine.watch_zones) reports counter changes per permanent and effect
+changes as 'layers', which re-checks the whole battlefield. The full sweep over every battlefield remains
+available through full_sweep=True, mark_all_dirty() and validate=True (which
+runs both and falls back to the sweep's result on a mismatch).
 """
 
-from typing import List, Tuple, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 from dataclasses import dataclass
 
 if TYPE_CHECKING:
     from .game_state import GameState
 
+# Zones checked by CR 704.5p (tokens outside the battlefield)
+_TOKEN_ZONES = ('hand', 'graveyard', 'library', 'exile')
+
 @dataclass
 class StateBasedAction:
     """Represents a state-based action to be performed"""
@@ -24,21 +36,52 @@ class StateBasedAction:
 class StateBasedActionEngine:
     """Implements comprehensive state-based actions per CR 704"""
     
-    def __init__(self, game: 'GameState'):
+    def __init__(self, game: 'GameState', incremental: bool = True, validate: bool = False):
         self.game = game
         self.actions_this_check = []
+        zones = getattr(game, 'zones', None)
+        # Incremental checking needs the zone index's change feed
+        self.incremental = incremental and zones is not None
+        self.validate = validate
+        self.mismatches = 0
+        self._dirty: Dict[int, Any] = {}
+        self._zone_moved = False
+        self._needs_full_sweep = True
+        self._attachers: Dict[int, Any] = {}   # id(perm) -> Aura/Equipment on the battlefield
+        if zones is not None:
+            zones.watch_changes(self._on_change)
+
+    # ---- Dirty tracking ----
+    def _on_change(self, obj, change: str):
+        if change == 'layers':
+            # Continuous effects changed: any creature's toughness may differ
+            self._needs_full_sweep = True
+            return
+        self._dirty[id(obj)] = obj
+        if change == 'zone':
+            self._zone_moved = True
+
+    def mark_dirty(self, obj):
+        """Re-check obj (a Permanent, Card or PlayerState) at the next check."""
+        self._on_change(obj, 'manual')
+
+    def mark_all_dirty(self):
+        """Make the next check a full sweep (after untracked changes, e.g. counters dicts)."""
+        self._needs_full_sweep = True
         
-    def check_and_perform_all(self) -> bool:
+    def check_and_perform_all(self, full_sweep: bool = False) -> bool:
         """Check and perform all applicable state-based actions (CR 704.3)
         
         Returns True if any actions were performed, False otherwise.
         Per CR 704.4, if any actions are performed, SBAs are checked again.
         """
         actions_performed = False
+        if full_sweep:
+            self._needs_full_sweep = True
         
         # CR 704.4: Keep checking until no actions are performed
         while True:
-            current_actions = self._collect_all_actions()
+            current_actions = self._collect_actions()
             
             if not current_actions:
                 break
@@ -49,6 +92,92 @@ class StateBasedActionEngine:
             
         return actions_performed
     
+    def _collect_actions(self) -> List[StateBasedAction]:
+        """Full sweep when required, otherwise only the dirty objects."""
+        if not self.incremental or self._needs_full_sweep:
+            self._needs_full_sweep = False
+            self._dirty.clear()
+            self._zone_moved = False
+            actions = self._collect_all_actions()
+            if self.incremental:
+                self._attachers = {id(perm): perm for player in self.game.players
+                                   for perm in player.battlefield if self._is_attacher(perm)}
+            return actions
+        actions = self._collect_dirty_actions()
+        if self.validate:
+            full = self._collect_all_actions()
+            if _action_keys(full) != _action_keys(actions):
+                self.mismatches += 1
+                return full
+        return actions
+
+    def _collect_dirty_actions(self) -> List[StateBasedAction]:
+        """Collect the actions that apply to objects changed since the last check."""
+        if not self._dirty:
+            return []
+        dirty = list(self._dirty.values())
+        self._dirty.clear()
+        zone_moved, self._zone_moved = self._zone_moved, False
+        zones = self.game.zones
+
+        players = []
+        perms: Dict[int, Any] = {}        # id(perm) -> perm, battlefield only
+        perm_owner: Dict[int, int] = {}   # id(perm) -> player index
+        tokens = []                       # (zone name, card)
+        for obj in dirty:
+            if hasattr(obj, 'battlefield') and hasattr(obj, 'life'):
+                players.append(obj)
+                continue
+            entry = zones.locate(obj)
+            if entry is None:
+                continue
+            if entry.zone == 'battlefield':
+                perms[id(entry.item)] = entry.item
+                perm_owner[id(entry.item)] = entry.player_id
+                if self._is_attacher(entry.item):
+                    self._attachers[id(entry.item)] = entry.item
+            elif entry.zone in _TOKEN_ZONES and getattr(entry.card, 'is_token', False):
+                tokens.append((entry.zone, entry.card))
+
+        # Attachment legality depends on other objects; re-check all attachers after any move
+        for key, perm in list(self._attachers.items()):
+            entry = zones.locate(perm)
+            if entry is None or entry.item is not perm or entry.zone != 'battlefield':
+                del self._attachers[key]
+            elif zone_moved:
+                perms.setdefault(key, perm)
+                perm_owner.setdefault(key, entry.player_id)
+
+        actions = []
+        for check in (self._life_loss_action, self._poison_counters_action):
+            actions.extend(a for a in map(check, players) if a)
+        for check in (self._zero_toughness_action, self._lethal_damage_action,
+                      self._deathtouch_damage_action, self._planeswalker_loyalty_action):
+            actions.extend(a for a in map(check, perms.values()) if a)
+        legend_players = {perm_owner[key] for key, perm in perms.items()
+                          if 'Legendary' in getattr(perm.card, 'types', [])}
+        for pid in sorted(legend_players):
+            actions.extend(self._legendary_actions(self.game.players[pid]))
+        for check in (self._aura_attachment_action, self._equipment_attachment_action):
+            actions.extend(a for a in map(check, perms.values()) if a)
+        actions.extend(self._token_action(card, zone) for zone, card in tokens)
+        return actions
+
+    @staticmethod
+    def _is_attacher(perm) -> bool:
+        types = getattr(perm.card, 'types', [])
+        return 'Aura' in types or 'Equipment' in types
+
+    def _sweep(self, check, copy: bool = True) -> List[StateBasedAction]:
+        """Run a per-permanent check over every battlefield."""
+        actions = []
+        for player in self.game.players:
+            for perm in (player.battlefield[:] if copy else player.battlefield):
+                action = check(perm)
+                if action:
+                    actions.append(action)
+        return actions
+
     def _collect_all_actions(self) -> List[StateBasedAction]:
         """Collect all applicable state-based actions (CR 704.5)"""
         actions = []
@@ -96,18 +225,17 @@ class StateBasedActionEngine:
     
     def _check_life_loss(self) -> List[StateBasedAction]:
         """CR 704.5a: Player with 0 or less life loses the game"""
-        actions = []
-        
-        for player in self.game.players:
-            if player.life <= 0:
-                actions.append(StateBasedAction(
-                    action_type="lose_game",
-                    target=player,
-                    reason=f"Life total is {player.life}",
-                    rule_reference="CR 704.5a"
-                ))
-                
-        return actions
+        return [a for a in map(self._life_loss_action, self.game.players) if a]
+
+    def _life_loss_action(self, player) -> Optional[StateBasedAction]:
+        if player.life <= 0 and not getattr(player, 'has_lost', False):
+            return StateBasedAction(
+                action_type="lose_game",
+                target=player,
+                reason=f"Life total is {player.life}",
+                rule_reference="CR 704.5a"
+            )
+        return None
     
     def _check_empty_library_draw(self) -> List[StateBasedAction]:
         """CR 704.5b: Player who would draw from empty library loses"""
@@ -120,123 +248,117 @@ class StateBasedActionEngine:
     
     def _check_poison_counters(self) -> List[StateBasedAction]:
         """CR 704.5c: Player with 10+ poison counters loses"""
-        actions = []
-        
-        for player in self.game.players:
-            poison_counters = getattr(player, 'poison_counters', 0)
-            if poison_counters >= 10:
-                actions.append(StateBasedAction(
-                    action_type="lose_game",
-                    target=player,
-                    reason=f"Has {poison_counters} poison counters",
-                    rule_reference="CR 704.5c"
-                ))
-                
-        return actions
+        return [a for a in map(self._poison_counters_action, self.game.players) if a]
+
+    def _poison_counters_action(self, player) -> Optional[StateBasedAction]:
+        poison_counters = getattr(player, 'poison_counters', 0)
+        if poison_counters >= 10 and not getattr(player, 'has_lost', False):
+            return StateBasedAction(
+                action_type="lose_game",
+                target=player,
+                reason=f"Has {poison_counters} poison counters",
+                rule_reference="CR 704.5c"
+            )
+        return None
     
     def _check_zero_toughness(self) -> List[StateBasedAction]:
         """CR 704.5f: Creatures with 0 or less toughness are destroyed"""
-        actions = []
-        
-        for player in self.game.players:
-            for perm in player.battlefield[:]:  # Copy list to avoid modification issues
-                if 'Creature' in getattr(perm.card, 'types', []):
-                    toughness = self._get_current_toughness(perm)
-                    if toughness <= 0:
-                        actions.append(StateBasedAction(
-                            action_type="destroy",
-                            target=perm,
-                            reason=f"Toughness is {toughness}",
-                            rule_reference="CR 704.5f"
-                        ))
-                        
-        return actions
+        return self._sweep(self._zero_toughness_action)
+
+    def _zero_toughness_action(self, perm) -> Optional[StateBasedAction]:
+        if 'Creature' in getattr(perm.card, 'types', []):
+            toughness = self._get_current_toughness(perm)
+            if toughness <= 0:
+                return StateBasedAction(
+                    action_type="destroy",
+                    target=perm,
+                    reason=f"Toughness is {toughness}",
+                    rule_reference="CR 704.5f"
+                )
+        return None
     
     def _check_lethal_damage(self) -> List[StateBasedAction]:
         """CR 704.5g: Creatures with lethal damage are destroyed"""
-        actions = []
-        
-        for player in self.game.players:
-            for perm in player.battlefield[:]:
-                if 'Creature' in getattr(perm.card, 'types', []):
-                    damage = getattr(perm, 'damage', 0)
-                    toughness = self._get_current_toughness(perm)
-                    
-                    if damage >= toughness and toughness > 0:
-                        actions.append(StateBasedAction(
-                            action_type="destroy",
-                            target=perm,
-                            reason=f"Has {damage} damage, toughness is {toughness}",
-                            rule_reference="CR 704.5g"
-                        ))
-                        
-        return actions
+        return self._sweep(self._lethal_damage_action)
+
+    def _lethal_damage_action(self, perm) -> Optional[StateBasedAction]:
+        if 'Creature' in getattr(perm.card, 'types', []):
+            damage = getattr(perm, 'damage', 0)
+            toughness = self._get_current_toughness(perm)
+            
+            if damage >= toughness and toughness > 0:
+                return StateBasedAction(
+                    action_type="destroy",
+                    target=perm,
+                    reason=f"Has {damage} damage, toughness is {toughness}",
+                    rule_reference="CR 704.5g"
+                )
+        return None
     
     def _check_deathtouch_damage(self) -> List[StateBasedAction]:
         """CR 704.5h: Creatures with deathtouch damage are destroyed"""
-        actions = []
-        
-        for player in self.game.players:
-            for perm in player.battlefield[:]:
-                if 'Creature' in getattr(perm.card, 'types', []):
-                    # Check if creature has been damaged by deathtouch source
-                    if getattr(perm, 'deathtouch_damage', False):
-                        actions.append(StateBasedAction(
-                            action_type="destroy",
-                            target=perm,
-                            reason="Has damage from deathtouch source",
-                            rule_reference="CR 704.5h"
-                        ))
-                        
-        return actions
+        return self._sweep(self._deathtouch_damage_action)
+
+    def _deathtouch_damage_action(self, perm) -> Optional[StateBasedAction]:
+        # Check if creature has been damaged by deathtouch source
+        if 'Creature' in getattr(perm.card, 'types', []) and getattr(perm, 'deathtouch_damage', False):
+            return StateBasedAction(
+                action_type="destroy",
+                target=perm,
+                reason="Has damage from deathtouch source",
+                rule_reference="CR 704.5h"
+            )
+        return None
     
     def _check_planeswalker_loyalty(self) -> List[StateBasedAction]:
         """CR 704.5i: Planeswalkers with 0 loyalty are destroyed"""
-        actions = []
-        
-        for player in self.game.players:
-            for perm in player.battlefield[:]:
-                if 'Planeswalker' in getattr(perm.card, 'types', []):
-                    loyalty = getattr(perm, 'loyalty', 0)
-                    if loyalty <= 0:
-                        actions.append(StateBasedAction(
-                            action_type="destroy",
-                            target=perm,
-                            reason=f"Has {loyalty} loyalty",
-                            rule_reference="CR 704.5i"
-                        ))
-                        
-        return actions
+        return self._sweep(self._planeswalker_loyalty_action)
+
+    def _planeswalker_loyalty_action(self, perm) -> Optional[StateBasedAction]:
+        if 'Planeswalker' in getattr(perm.card, 'types', []):
+            loyalty = getattr(perm, 'loyalty', 0)
+            if loyalty <= 0:
+                return StateBasedAction(
+                    action_type="destroy",
+                    target=perm,
+                    reason=f"Has {loyalty} loyalty",
+                    rule_reference="CR 704.5i"
+                )
+        return None
     
     def _check_legendary_rule(self) -> List[StateBasedAction]:
         """CR 704.5j: Legendary rule - player chooses which to keep"""
         actions = []
-        
         for player in self.game.players:
-            legendary_permanents = {}
-            
-            # Group legendary permanents by name
-            for perm in player.battlefield:
-                if 'Legendary' in getattr(perm.card, 'types', []):
-                    name = perm.card.name
-                    if name not in legendary_permanents:
-                        legendary_permanents[name] = []
-                    legendary_permanents[name].append(perm)
-            
-            # If multiple copies exist, all but one must be destroyed
-            for name, perms in legendary_permanents.items():
-                if len(perms) > 1:
-                    # For AI or automatic resolution, keep the newest one
-                    perms_to_destroy = perms[:-1]  # All but the last one
+            actions.extend(self._legendary_actions(player))
+        return actions
+
+    def _legendary_actions(self, player) -> List[StateBasedAction]:
+        actions = []
+        legendary_permanents = {}
+        
+        # Group legendary permanents by name
+        for perm in player.battlefield:
+            if 'Legendary' in getattr(perm.card, 'types', []):
+                name = perm.card.name
+                if name not in legendary_permanents:
+                    legendary_permanents[name] = []
+                legendary_permanents[name].append(perm)
+        
+        # If multiple copies exist, all but one must be destroyed
+        for name, perms in legendary_permanents.items():
+            if len(perms) > 1:
+                # For AI or automatic resolution, keep the newest one
+                perms_to_destroy = perms[:-1]  # All but the last one
+                
+                for perm in perms_to_destroy:
+                    actions.append(StateBasedAction(
+                        action_type="destroy",
+                        target=perm,
+                        reason=f"Legendary rule violation - multiple {name}",
+                        rule_reference="CR 704.5j"
+                    ))
                     
-                    for perm in perms_to_destroy:
-                        actions.append(StateBasedAction(
-                            action_type="destroy",
-                            target=perm,
-                            reason=f"Legendary rule violation - multiple {name}",
-                            rule_reference="CR 704.5j"
-                        ))
-                        
         return actions
     
     def _check_world_rule(self) -> List[StateBasedAction]:
@@ -246,39 +368,35 @@ class StateBasedActionEngine:
     
     def _check_aura_attachments(self) -> List[StateBasedAction]:
         """CR 704.5m: Auras not attached to legal objects are destroyed"""
-        actions = []
-        
-        for player in self.game.players:
-            for perm in player.battlefield[:]:
-                if 'Aura' in getattr(perm.card, 'types', []):
-                    attached_to = getattr(perm, 'attached_to', None)
-                    if not attached_to or not self._is_legal_attachment_target(perm, attached_to):
-                        actions.append(StateBasedAction(
-                            action_type="destroy",
-                            target=perm,
-                            reason="Not attached to legal object",
-                            rule_reference="CR 704.5m"
-                        ))
-                        
-        return actions
+        return self._sweep(self._aura_attachment_action)
+
+    def _aura_attachment_action(self, perm) -> Optional[StateBasedAction]:
+        if 'Aura' in getattr(perm.card, 'types', []):
+            attached_to = getattr(perm, 'attached_to', None)
+            if not attached_to or not self._is_legal_attachment_target(perm, attached_to):
+                return StateBasedAction(
+                    action_type="destroy",
+                    target=perm,
+                    reason="Not attached to legal object",
+                    rule_reference="CR 704.5m"
+                )
+        return None
     
     def _check_equipment_attachments(self) -> List[StateBasedAction]:
         """CR 704.5n: Equipment not attached to creatures become unattached"""
-        actions = []
-        
-        for player in self.game.players:
-            for perm in player.battlefield:
-                if 'Equipment' in getattr(perm.card, 'types', []):
-                    attached_to = getattr(perm, 'attached_to', None)
-                    if attached_to and 'Creature' not in getattr(attached_to.card, 'types', []):
-                        actions.append(StateBasedAction(
-                            action_type="unattach",
-                            target=perm,
-                            reason="Attached to non-creature",
-                            rule_reference="CR 704.5n"
-                        ))
-                        
-        return actions
+        return self._sweep(self._equipment_attachment_action, copy=False)
+
+    def _equipment_attachment_action(self, perm) -> Optional[StateBasedAction]:
+        if 'Equipment' in getattr(perm.card, 'types', []):
+            attached_to = getattr(perm, 'attached_to', None)
+            if attached_to and 'Creature' not in getattr(attached_to.card, 'types', []):
+                return StateBasedAction(
+                    action_type="unattach",
+                    target=perm,
+                    reason="Attached to non-creature",
+                    rule_reference="CR 704.5n"
+                )
+        return None
     
     def _check_tokens_in_wrong_zones(self) -> List[StateBasedAction]:
         """CR 704.5p: Tokens not on battlefield cease to exist"""
@@ -296,14 +414,17 @@ class StateBasedActionEngine:
             for zone_name, zone in zones_to_check:
                 for card in zone[:]:
                     if getattr(card, 'is_token', False):
-                        actions.append(StateBasedAction(
-                            action_type="cease_to_exist",
-                            target=card,
-                            reason=f"Token in {zone_name}",
-                            rule_reference="CR 704.5p"
-                        ))
+                        actions.append(self._token_action(card, zone_name))
                         
         return actions
+
+    def _token_action(self, card, zone_name: str) -> StateBasedAction:
+        return StateBasedAction(
+            action_type="cease_to_exist",
+            target=card,
+            reason=f"Token in {zone_name}",
+            rule_reference="CR 704.5p"
+        )
     
     def _check_copy_effects(self) -> List[StateBasedAction]:
         """CR 704.5q: Copy effects that should end"""
@@ -336,8 +457,11 @@ class StateBasedActionEngine:
         """Destroy all marked permanents"""
         for action in actions:
             perm = action.target
-            if hasattr(perm, 'controller_id'):
-                controller = self.game.players[perm.controller_id]
+            controller_id = getattr(perm, 'controller_id', None)
+            if controller_id is None:
+                controller_id = getattr(perm.card, 'controller_id', None)
+            if controller_id is not None and 0 <= controller_id < len(self.game.players):
+                controller = self.game.players[controller_id]
                 if perm in controller.battlefield:
                     controller.battlefield.remove(perm)
                     controller.graveyard.append(perm.card)
@@ -346,8 +470,11 @@ class StateBasedActionEngine:
         """Handle players losing the game"""
         for action in actions:
             player = action.target
-            # Mark player as having lost
-            setattr(player, 'has_lost', True)
+            # Mark player as having lost; the turn-order ring skips them from now on
+            if hasattr(self.game, 'eliminate_player'):
+                self.game.eliminate_player(player.player_id)
+            else:
+                setattr(player, 'has_lost', True)
             # In a complete implementation, this would trigger game end checks
     
     def _perform_unattach_actions(self, actions: List[StateBasedAction]) -> None:
@@ -371,7 +498,11 @@ class StateBasedActionEngine:
     
     def _get_current_toughness(self, permanent) -> int:
         """Get the current toughness of a permanent, including modifiers"""
-        base_toughness = getattr(permanent.card, 'toughness', 0)
+        card = permanent.card
+        if getattr(card, '_layers_engine', None) is not None:
+            base_toughness = card.get_current_power_toughness()[1] or 0   # effects and counters
+        else:
+            base_toughness = getattr(card, 'toughness', 0)
         toughness_modifiers = getattr(permanent, 'toughness_modifiers', 0)
         return base_toughness + toughness_modifiers
     
@@ -379,19 +510,27 @@ class StateBasedActionEngine:
         """Check if the target is legal for the aura to be attached to"""
         # This would need to check the aura's enchant ability
         # For now, just check if target still exists on battlefield
+        zones = getattr(self.game, 'zones', None)
+        if zones is not None:
+            return zones.permanent_for(target) is target
         for player in self.game.players:
             if target in player.battlefield:
                 return True
         return False
 
-def init_state_based_actions(game: 'GameState') -> StateBasedActionEngine:
+def _action_keys(actions: List[StateBasedAction]) -> set:
+    return {(a.action_type, id(a.target), a.rule_reference) for a in actions}
+
+
+def init_state_based_actions(game: 'GameState', incremental: bool = True,
+                             validate: bool = False) -> StateBasedActionEngine:
     """Initialize state-based actions system for a game"""
-    sba_engine = StateBasedActionEngine(game)
+    sba_engine = StateBasedActionEngine(game, incremental=incremental, validate=validate)
     game.state_based_actions = sba_engine
     
     # Add method to game for easy access
-    def check_state_based_actions():
-        return game.state_based_actions.check_and_perform_all()
+    def check_state_based_actions(full_sweep: bool = False):
+        return game.state_based_actions.check_and_perform_all(full_sweep)
     
     game.check_state_based_actions = check_state_based_actions
     
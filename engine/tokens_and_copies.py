@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Set, Callable
 import copy as python_copy
 from engine.card_engine import Card, Permanent
+from engine.enhanced_keywords import attach_keywords
 from enum import Enum
 
 class CopyType(Enum):
@@ -269,7 +270,7 @@ class TokenAndCopyEngine:
         # Make it a token
         token_copy.is_token = True
         if "Token" not in token_copy.types:
-            token_copy.types.append("Token")
+            token_copy.types = token_copy.types + ("Token",)
         
         # Apply modifications
         if modifications:
@@ -314,13 +315,13 @@ class TokenAndCopyEngine:
         copy_card = Card(
             id=new_id,
             name=original.name,
-            types=original.types.copy(),
+            types=original.types,
             mana_cost=original.mana_cost,
             mana_cost_str=original.mana_cost_str,
             power=original.power,
             toughness=original.toughness,
             text=original.text,
-            color_identity=original.color_identity.copy(),
+            color_identity=original.color_identity,
             owner_id=controller_id,  # Owner becomes the controller
             controller_id=controller_id
         )
@@ -329,7 +330,7 @@ class TokenAndCopyEngine:
         if hasattr(original, 'subtypes'):
             copy_card.subtypes = original.subtypes.copy()
         if hasattr(original, 'keywords'):
-            copy_card.keywords = python_copy.deepcopy(original.keywords)
+            attach_keywords(copy_card, python_copy.deepcopy(original.keywords))
         if hasattr(original, 'loyalty'):
             copy_card.loyalty = original.loyalty
         
@@ -368,7 +369,7 @@ class TokenAndCopyEngine:
             elif key == "name":
                 token.name = str(value)
             elif key == "add_types" and isinstance(value, list):
-                token.types.extend(t for t in value if t not in token.types)
+                token.types = token.types + tuple(t for t in value if t not in token.types)
             elif key == "add_keywords" and isinstance(value, list):
                 keyword_text = ", ".join(value)
                 if token.text:
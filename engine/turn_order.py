@@ -0,0 +1,80 @@
+"""
+Turn Order
+
+The seating ring of a game: who plays next, who is next in APNAP order
+(CR 101.4) and who is still in it. Everything is precomputed when the ring is
+built, so priority passing, trigger ordering and picking a defender are tuple
+lookups instead of rescans of the player list:
+
+    order = TurnOrder.build([0, 1, 2, 3])
+    order.next(3)              # 0 - next remaining player after 3
+    order.apnap(2)             # (2, 3, 0, 1)
+    order = order.without(3)   # player 3 lost; the ring now skips them
+    order.next(2)              # 0
+
+TurnOrder is an immutable tuple. Eliminating a player builds a new ring, which
+GameState assigns to game.turn_order, so snapshots restore it and forks share it
+like any other plain attribute.
+"""
+
+from typing import Iterable, NamedTuple, Tuple
+
+
+class TurnOrder(NamedTuple):
+    seats: Tuple[int, ...]                  # every player id, in turn order
+    alive: Tuple[int, ...]                  # players still in the game, in turn order
+    next_alive: Tuple[int, ...]             # [pid] -> next remaining player after pid
+    apnap_from: Tuple[Tuple[int, ...], ...]  # [pid] -> remaining players in APNAP order from pid
+    rank_from: Tuple[Tuple[int, ...], ...]   # [active][pid] -> pid's place in active's APNAP order
+
+    @classmethod
+    def build(cls, seats: Iterable[int], eliminated: Iterable[int] = ()) -> 'TurnOrder':
+        seats = tuple(seats)
+        out = frozenset(eliminated)
+        alive = tuple(pid for pid in seats if pid not in out)
+        size = max(seats, default=-1) + 1
+        next_alive = [-1] * size
+        apnap_from = [()] * size
+        rank_from = [()] * size
+        count = len(seats)
+        for i, pid in enumerate(seats):
+            # Walk the ring once from each seat; eliminated seats still get an answer
+            ring = [seats[(i + step) % count] for step in range(count)]
+            order = tuple(p for p in ring if p not in out)
+            after = [p for p in ring[1:] if p not in out]
+            next_alive[pid] = after[0] if after else (pid if pid not in out else -1)
+            apnap_from[pid] = order
+            ranks = [len(seats)] * size
+            for place, p in enumerate(order):
+                ranks[p] = place
+            rank_from[pid] = tuple(ranks)
+        return cls(seats, alive, tuple(next_alive), tuple(apnap_from), tuple(rank_from))
+
+    @property
+    def eliminated(self) -> frozenset:
+        return frozenset(self.seats) - frozenset(self.alive)
+
+    def is_alive(self, pid: int) -> bool:
+        return pid in self.alive
+
+    def next(self, pid: int) -> int:
+        """The next remaining player after pid (pid itself when they are the last one)."""
+        return self.next_alive[pid]
+
+    def apnap(self, active: int) -> Tuple[int, ...]:
+        """Remaining players in APNAP order: active first (if still in), then turn order."""
+        return self.apnap_from[active]
+
+    def opponents(self, pid: int) -> Tuple[int, ...]:
+        """pid's remaining opponents, starting with the next player."""
+        return tuple(p for p in self.apnap_from[pid] if p != pid)
+
+    def rank(self, active: int, pid: int) -> int:
+        """Sort key placing pid in active's APNAP order; eliminated players sort last."""
+        return self.rank_from[active][pid]
+
+    def without(self, pid: int) -> 'TurnOrder':
+        """The ring after pid leaves the game."""
+        if pid not in self.alive:
+            return self
+        return TurnOrder.build(self.seats, self.eliminated | {pid})
@@ -0,0 +1,403 @@
+"""
+Zone Index
+
+Maps every card object in a game to where it currently is - (player, zone,
+permanent) - so "is this on the battlefield?" and "find the permanent for this
+card" are dictionary lookups instead of scans over every player's zones.
+
+Player zones are ZoneList instances: ordinary lists that report additions and
+removals to the game's ZoneIndex. Every existing `ps.hand.remove(card)` /
+`ps.battlefield.append(perm)` therefore keeps the index current without going
+through a special API; GameState.move_card is the central helper for moving a
+card between zones.
+"""
+
+import weakref
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+ZONE_NAMES = ('library', 'hand', 'battlefield', 'graveyard', 'exile', 'command')
+
+
+class ZoneEntry(NamedTuple):
+    """Where a card currently is. `item` is the Permanent on the battlefield, else the Card."""
+    player_id: int
+    zone: str
+    item: object
+
+    @property
+    def card(self):
+        return getattr(self.item, 'card', self.item)
+
+
+def _card_of(item):
+    return getattr(item, 'card', item)
+
+
+class ZoneList(list):
+    """A player's zone; forwards membership changes to the bound ZoneIndex."""
+
+    __slots__ = ('_index', '_player_id', '_zone', 'version')
+
+    def __init__(self, iterable=(), index=None, player_id=None, zone=None):
+        super().__init__(iterable)
+        self._index = index
+        self._player_id = player_id
+        self._zone = zone
+        self.version = 0    # bumped on every change; lets callers cache derived data
+
+    def __reduce_ex__(self, protocol):
+        # Copies / pickles are plain lists; the owning GameState re-binds them
+        return (list, (list(self),))
+
+    def _bind(self, index, player_id, zone):
+        rebind = index is not None and index is self._index
+        self._index, self._player_id, self._zone = index, player_id, zone
+        if index is not None and not rebind:
+            index._added_all(self)
+
+    def _touch(self):
+        self.version += 1
+        # Record the contents before the first write after a snapshot
+        index = self._index
+        if index is not None and index._journal is not None:
+            index._save(self)
+
+    def _add(self, item):
+        if self._index is not None:
+            self._index._added(self, item)
+
+    def _drop(self, item):
+        if self._index is not None:
+            self._index._removed(self, item)
+
+    def append(self, item):
+        self._touch()
+        super().append(item)
+        self._add(item)
+
+    def insert(self, i, item):
+        self._touch()
+        super().insert(i, item)
+        self._add(item)
+
+    def extend(self, items):
+        items = list(items)
+        self._touch()
+        super().extend(items)
+        for item in items:
+            self._add(item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def remove(self, item):
+        self._touch()
+        # Prefer the identical object: equal clones (same id and fields) share a zone
+        for i, existing in enumerate(self):
+            if existing is item:
+                break
+        else:
+            i = self.index(item)
+        removed = super().pop(i)
+        self._drop(removed)
+
+    def pop(self, i=-1):
+        self._touch()
+        item = super().pop(i)
+        self._drop(item)
+        return item
+
+    def clear(self):
+        self._touch()
+        items = list(self)
+        super().clear()
+        for item in items:
+            self._drop(item)
+
+    def __setitem__(self, key, value):
+        self._touch()
+        old = self[key] if isinstance(key, slice) else [self[key]]
+        if isinstance(key, slice):
+            value = list(value)
+        super().__setitem__(key, value)
+        for item in (value if isinstance(key, slice) else [value]):
+            self._add(item)
+        for item in old:
+            self._drop(item)
+
+    def _replace(self, items):
+        """Set the contents to items, re-indexing only the objects that differ (snapshot undo)."""
+        self.version += 1
+        delta: Dict[int, list] = {}
+        for item in self:
+            delta.setdefault(id(item), [item, 0])[1] -= 1
+        for item in items:
+            delta.setdefault(id(item), [item, 0])[1] += 1
+        super().__setitem__(slice(None), items)
+        for item, change in delta.values():
+            for _ in range(change):
+                self._add(item)
+            for _ in range(-change):
+                self._drop(item)
+
+    def sort(self, *args, **kwargs):
+        self._touch()
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._touch()
+        super().reverse()
+
+    def __delitem__(self, key):
+        self._touch()
+        old = self[key] if isinstance(key, slice) else [self[key]]
+        super().__delitem__(key)
+        for item in old:
+            self._drop(item)
+
+
+class ZoneIndex:
+    """card object -> ZoneEntry, plus card id -> entries for id-based lookups."""
+
+    def __init__(self):
+        self._by_obj: Dict[int, ZoneEntry] = {}
+        self._by_card_id: Dict[str, Dict[int, ZoneEntry]] = {}
+        self._lists: Dict[int, tuple] = {}   # id(card) -> (list holding it, count)
+        self._battlefield_watchers: List[weakref.WeakMethod] = []
+        self._change_watchers: List[weakref.WeakMethod] = []
+        # Copy-on-write undo journal for engine/snapshot.py: (object, state before
+        # its first write since the newest snapshot). None while no snapshot is live.
+        self._journal: Optional[list] = None
+        self._saved: Dict[int, int] = {}    # id(obj) -> generation it was saved in
+        self._generation = 0
+        self._snapshots: list = []
+
+    # Entries are keyed by object identity, so a copy starts empty and is
+    # re-populated when the copied GameState binds its zones.
+    def __reduce__(self):
+        return (ZoneIndex, ())
+
+    def __deepcopy__(self, memo):
+        return ZoneIndex()
+
+    # ---- maintenance (called by ZoneList) ----
+    # _lists tracks how many times the card sits in its list, so element
+    # swaps (random.shuffle, x[i], x[j] = x[j], x[i]) never drop a card that
+    # is still present.
+    def _added(self, zone_list: ZoneList, item):
+        card = _card_of(item)
+        key = id(card)
+        held = self._lists.get(key)
+        count = held[1] + 1 if held is not None and held[0] is zone_list else 1
+        before = self._by_obj.get(key)
+        entry = ZoneEntry(zone_list._player_id, zone_list._zone, item)
+        self._by_obj[key] = entry
+        self._lists[key] = (zone_list, count)
+        self._by_card_id.setdefault(getattr(card, 'id', None), {})[key] = entry
+        on_battlefield = entry.zone == 'battlefield'
+        if on_battlefield and item is not card:
+            _set_zone_index(item, self)   # lets the Permanent report changes
+        was_on = before is not None and before.zone == 'battlefield'
+        if was_on != on_battlefield:
+            self._notify_battlefield(card, on_battlefield)
+        if self._change_watchers and (before is None or before.zone != entry.zone
+                                      or before.player_id != entry.player_id):
+            self.notify_change(item, 'zone')
+
+    def _added_all(self, zone_list: ZoneList):
+        """_added for every item of a list being bound (tight loop when nobody is watching)."""
+        if self._battlefield_watchers or self._change_watchers:
+            for item in zone_list:
+                self._added(zone_list, item)
+            return
+        by_obj, lists, by_card_id = self._by_obj, self._lists, self._by_card_id
+        player_id, zone = zone_list._player_id, zone_list._zone
+        on_battlefield = zone == 'battlefield'
+        for item in zone_list:
+            card = _card_of(item)
+            key = id(card)
+            held = lists.get(key)
+            entry = ZoneEntry(player_id, zone, item)
+            by_obj[key] = entry
+            lists[key] = (zone_list, held[1] + 1 if held is not None and held[0] is zone_list else 1)
+            by_card_id.setdefault(getattr(card, 'id', None), {})[key] = entry
+            if on_battlefield and item is not card:
+                _set_zone_index(item, self)
+
+    def _removed(self, zone_list: ZoneList, item):
+        card = _card_of(item)
+        key = id(card)
+        held = self._lists.get(key)
+        if held is None or held[0] is not zone_list:
+            return  # already moved elsewhere
+        if held[1] > 1:
+            self._lists[key] = (zone_list, held[1] - 1)
+            return
+        entry = self._by_obj.pop(key, None)
+        self._lists.pop(key, None)
+        bucket = self._by_card_id.get(getattr(card, 'id', None))
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._by_card_id[getattr(card, 'id', None)]
+        if entry is not None and entry.zone == 'battlefield':
+            self._notify_battlefield(card, False)
+        if self._change_watchers:
+            self.notify_change(item, 'zone')
+
+    # ---- snapshot journal ----
+    def _save(self, obj):
+        key = id(obj)
+        if self._saved.get(key) != self._generation:
+            self._saved[key] = self._generation
+            state = list(obj) if isinstance(obj, ZoneList) else object_state(obj)
+            self._journal.append((obj, state))
+
+    def save_before_write(self, obj):
+        """Journal obj's attributes if a snapshot is live (called by __setattr__ hooks)."""
+        if self._journal is not None:
+            self._save(obj)
+
+    # ---- battlefield watchers ----
+    def watch_battlefield(self, callback: Callable[[object, bool], None]):
+        """
+        Call bound method callback(card, entered) whenever a card enters or
+        leaves the battlefield. Held weakly, so watchers need no unsubscribe.
+        """
+        self._battlefield_watchers.append(weakref.WeakMethod(callback))
+
+    def _notify_battlefield(self, card, entered: bool):
+        if self._battlefield_watchers:
+            self._battlefield_watchers = _call_watchers(self._battlefield_watchers, card, entered)
+
+    # ---- change watchers ----
+    def watch_changes(self, callback: Callable[[object, str], None]):
+        """
+        Call bound method callback(obj, change) when a card changes zone
+        (change 'zone') or a watched attribute of a Permanent or PlayerState
+        is assigned (change is the attribute name). Held weakly.
+        """
+        self._change_watchers.append(weakref.WeakMethod(callback))
+
+    def notify_change(self, obj, change: str):
+        if self._change_watchers:
+            self._change_watchers = _call_watchers(self._change_watchers, obj, change)
+
+    def clear(self):
+        self._by_obj.clear()
+        self._by_card_id.clear()
+        self._lists.clear()
+
+    # ---- queries ----
+    def locate(self, card) -> Optional[ZoneEntry]:
+        """Where this card object (or the card of a Permanent) is, or None."""
+        return self._by_obj.get(id(_card_of(card)))
+
+    def zone_of(self, card) -> Optional[str]:
+        entry = self.locate(card)
+        return entry.zone if entry else None
+
+    def in_zone(self, card, player_id: int, zone: str) -> bool:
+        entry = self.locate(card)
+        return entry is not None and entry.zone == zone and entry.player_id == player_id
+
+    def is_on_battlefield(self, card) -> bool:
+        entry = self.locate(card)
+        return entry is not None and entry.zone == 'battlefield'
+
+    def permanent_for(self, card):
+        """The Permanent wrapping this card object, if it is on the battlefield."""
+        entry = self.locate(card)
+        return entry.item if entry is not None and entry.zone == 'battlefield' else None
+
+    def entries_for_id(self, card_id) -> Iterator[ZoneEntry]:
+        return iter(list(self._by_card_id.get(card_id, {}).values()))
+
+    def find_permanent(self, card_id):
+        """First permanent whose card has this id (ids repeat for duplicate cards)."""
+        for entry in self._by_card_id.get(card_id, {}).values():
+            if entry.zone == 'battlefield':
+                return entry.item
+        return None
+
+    def find_card(self, card_id, zones: Iterable[str] = ZONE_NAMES):
+        """First card with this id, searching the given zones in order."""
+        bucket = self._by_card_id.get(card_id)
+        if not bucket:
+            return None
+        for zone in zones:
+            for entry in bucket.values():
+                if entry.zone == zone:
+                    return entry.card
+        return None
+
+
+def _set_zone_index(item, index: ZoneIndex):
+    try:
+        object.__setattr__(item, '_zone_index', index)
+    except AttributeError:
+        pass    # not a Permanent (or a slotted type without the field)
+
+
+def _slot_names(cls) -> tuple:
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = tuple(name for klass in cls.__mro__
+                      for name in getattr(klass, '__slots__', ())
+                      if name not in ('__dict__', '__weakref__'))
+        _SLOT_NAMES[cls] = names
+    return names
+
+_SLOT_NAMES: Dict[type, tuple] = {}
+
+
+def object_state(obj) -> Dict[str, object]:
+    """A shallow dict of obj's attributes, for __dict__ and __slots__ classes alike."""
+    state = dict(obj.__dict__) if hasattr(obj, '__dict__') else {}
+    for name in _slot_names(type(obj)):
+        try:
+            state[name] = object.__getattribute__(obj, name)
+        except AttributeError:
+            pass
+    return state
+
+
+def set_object_state(obj, state: Dict[str, object]):
+    """Make obj's attributes exactly state (inverse of object_state); bypasses __setattr__."""
+    slots = _slot_names(type(obj))
+    if hasattr(obj, '__dict__'):
+        obj.__dict__.clear()
+        obj.__dict__.update((k, v) for k, v in state.items() if k not in slots)
+    for name in slots:
+        if name in state:
+            object.__setattr__(obj, name, state[name])
+        else:
+            try:
+                object.__delattr__(obj, name)
+            except AttributeError:
+                pass
+
+
+def _call_watchers(watchers: List[weakref.WeakMethod], *args) -> List[weakref.WeakMethod]:
+    """Call every live watcher; returns the list without dead references."""
+    alive = []
+    for ref in watchers:
+        callback = ref()
+        if callback is not None:
+            alive.append(ref)
+            callback(*args)
+    return alive
+
+
+def bind_player_zones(player, index: Optional[ZoneIndex]):
+    """Wrap a PlayerState's zone lists as ZoneLists and (re-)index their contents."""
+    for zone in ZONE_NAMES:
+        current = getattr(player, zone, None)
+        if current is None:
+            continue
+        if not isinstance(current, ZoneList):
+            current = ZoneList(current)
+            object.__setattr__(player, zone, current)
+        current._index = None
+        current._bind(index, player.player_id, zone)
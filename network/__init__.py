@@ -6,7 +6,10 @@ It implements a client-server architecture with reliable message passing and gam
 Components:
 - MessageProtocol: Message serialization and protocol definitions
 - NetworkClient: Client-side networking for connecting to game servers
-- GameServer: Server-side game hosting and coordination
+- AsyncGameServer: asyncio server core (no Qt dependency)
+- GameServer: Qt signal adapter over AsyncGameServer for the GUI
+- state_sync: Versioned, delta-compressed game state synchronization
+- outbound: Bounded per-client send queues with backpressure policies
 - NetworkGameController: Network-aware game controller
 """
 
@@ -22,6 +25,7 @@ CONNECTION_TIMEOUT = 60  # seconds
 MESSAGE_TIMEOUT = 10  # seconds
 RECONNECT_ATTEMPTS = 5
 RECONNECT_DELAY = 2  # seconds
+MAX_FRAME_SIZE = 16 * 1024 * 1024  # bytes; larger frames drop the connection
 
 # Import core networking components
 from .message_protocol import (
@@ -31,6 +35,7 @@ from .message_protocol import (
     serialize_message,
     deserialize_message
 )
+from .server_core import AsyncGameServer, ServerState
 
 # Lazy import to avoid circular dependencies
 def _get_network_client():
@@ -52,9 +57,9 @@ except ImportError:
     NetworkClient, ClientState = None, None
 
 try:
-    from .game_server import GameServer, ServerState
+    from .game_server import GameServer
 except ImportError:
-    GameServer, ServerState = None, None
+    GameServer = None
 
 try:
     from .network_game_controller import NetworkGameController
@@ -69,6 +74,7 @@ __all__ = [
     "deserialize_message",
     "NetworkClient",
     "ClientState",
+    "AsyncGameServer",
     "GameServer", 
     "ServerState",
     "NetworkGameController",
@@ -79,5 +85,6 @@ __all__ = [
     "CONNECTION_TIMEOUT",
     "MESSAGE_TIMEOUT",
     "RECONNECT_ATTEMPTS",
-    "RECONNECT_DELAY"
+    "RECONNECT_DELAY",
+    "MAX_FRAME_SIZE"
 ]
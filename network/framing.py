@@ -0,0 +1,136 @@
+"""MTG Commander Game - Frame Decoder
+
+Splits a byte stream into length-prefixed frames (4-byte big-endian length,
+then the body) without re-copying what has already been received. Client and
+server share it:
+
+    decoder = FrameDecoder()
+    while decoder.recv_into(sock):          # socket.recv_into the free tail
+        for body in decoder.frames():       # memoryview of each complete body
+            handle(decode_message_body(body))
+
+or, as an asyncio.BufferedProtocol, return decoder.get_buffer() from
+get_buffer() and call decoder.buffer_updated(n) from buffer_updated().
+
+Received bytes land directly in one bytearray. A read offset walks over the
+complete frames; the unread tail is moved to the front only when the free
+space runs out, and the buffer grows only for a frame bigger than itself. So
+a large state update costs one copy in from the socket, not one per recv as
+with `buffer += data`. Bodies are yielded as memoryview slices that stay
+valid until the next get_buffer / recv_into / feed.
+"""
+
+import struct
+from typing import Iterator
+
+from . import MAX_FRAME_SIZE
+
+HEADER_SIZE = 4
+_HEADER = struct.Struct('>I')
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+MIN_READ_SIZE = 4096
+
+
+class FrameTooLarge(ValueError):
+    """A peer announced a frame over the decoder's max_frame_size."""
+
+
+class FrameDecoder:
+    """Incremental length-prefixed frame decoder over a reusable receive buffer."""
+
+    __slots__ = ('max_frame_size', '_buffer', '_view', '_start', '_end')
+
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0     # first unread byte
+        self._end = 0       # end of received data
+
+    def __len__(self) -> int:
+        """Bytes received but not yet returned as frames."""
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    # ---- Filling ----
+    def get_buffer(self, sizehint: int = -1) -> memoryview:
+        """Writable free space after the received data (at least sizehint bytes if given)."""
+        wanted = max(sizehint, MIN_READ_SIZE)
+        pending = self._end - self._start
+        if pending >= HEADER_SIZE:
+            # Make room for the whole frame being received, if it is bigger
+            wanted = max(wanted, HEADER_SIZE + self._peek_length() - pending)
+        if len(self._buffer) - self._end < wanted:
+            self._make_room(pending + wanted)
+        return self._view[self._end:]
+
+    def buffer_updated(self, nbytes: int):
+        """Record that nbytes were written into the last get_buffer() view."""
+        self._end += nbytes
+
+    def recv_into(self, sock) -> int:
+        """sock.recv_into the free space; returns bytes read (0 means the peer closed)."""
+        nbytes = sock.recv_into(self.get_buffer())
+        self._end += nbytes
+        return nbytes
+
+    def feed(self, data) -> None:
+        """Append bytes received some other way."""
+        size = len(data)
+        self.get_buffer(size)[:size] = data
+        self._end += size
+
+    # ---- Draining ----
+    def frames(self) -> Iterator[memoryview]:
+        """Yield the body of every complete frame received so far."""
+        view = self._view
+        while self._end - self._start >= HEADER_SIZE:
+            length = self._peek_length()
+            body_start = self._start + HEADER_SIZE
+            body_end = body_start + length
+            if body_end > self._end:
+                break
+            self._start = body_end
+            yield view[body_start:body_end]
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def reset(self):
+        """Drop everything buffered (e.g. after a protocol error)."""
+        self._start = self._end = 0
+
+    # ---- Internals ----
+    def _peek_length(self) -> int:
+        length = _HEADER.unpack_from(self._buffer, self._start)[0]
+        if length > self.max_frame_size:
+            raise FrameTooLarge(f"Frame of {length} bytes exceeds limit of {self.max_frame_size}")
+        return length
+
+    def _make_room(self, needed: int):
+        """Move unread bytes to the front, growing the buffer only if they still don't fit."""
+        pending = self._end - self._start
+        if needed <= len(self._buffer):
+            if self._start:
+                tail = self._view[self._start:self._end]
+                # Overlapping moves go through a temporary copy
+                self._buffer[:pending] = tail if self._start >= pending else bytes(tail)
+        else:
+            size = len(self._buffer)
+            while size < needed:
+                size *= 2
+            # A new buffer rather than a resize: views handed out earlier stay valid to read
+            grown = bytearray(size)
+            grown[:pending] = self._view[self._start:self._end]
+            self._buffer = grown
+            self._view = memoryview(grown)
+        self._start, self._end = 0, pending
+
+
+def encode_frame(body: bytes) -> bytes:
+    """Prefix body with its length header."""
+    return _HEADER.pack(len(body)) + body
@@ -2,13 +2,30 @@
 
 This module defines the message protocol for network communication between
 clients and servers. It handles message serialization, validation, and type definitions.
+
+Frame body layout (after the 4-byte length header):
+
+    [codec << 4 | integrity mode: 1 byte][tag: 0, 4 or 16 bytes][payload]
+
+The payload is produced by a MessageCodec: verbose JSON (the default, handy
+for debugging) or the compact BinaryCodec. Receivers read the codec from the
+frame, so only the sending side has to be negotiated; clients list the
+codecs they speak in JOIN_GAME and the server picks one (negotiate_codec).
+
+The tag is computed once, over the payload bytes actually sent, and checked
+once when the frame is decoded: CRC32 by default, HMAC-SHA256 (truncated)
+when a shared key is configured, or nothing on a trusted LAN link when both
+sides agree during JOIN_GAME (see IntegrityPolicy and negotiate_integrity).
 """
 
 import json
 import hashlib
+import hmac
+import struct
 import time
+import zlib
 from enum import Enum
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Iterable, Optional, Union
 from dataclasses import dataclass, asdict
 
 
@@ -57,6 +74,64 @@ class MessageType(Enum):
     RESYNC_REQUEST = "resync_request"
 
 
+class Integrity(Enum):
+    """How a frame's payload is protected, weakest first."""
+    NONE = "none"        # trusted LAN links only, by agreement
+    CRC32 = "crc32"      # accidental corruption
+    HMAC = "hmac"        # tampering; needs a shared key
+
+
+_INTEGRITY_CODES = {Integrity.NONE: 0, Integrity.CRC32: 1, Integrity.HMAC: 2}
+_INTEGRITY_BY_CODE = {code: mode for mode, code in _INTEGRITY_CODES.items()}
+_TAG_SIZES = {Integrity.NONE: 0, Integrity.CRC32: 4, Integrity.HMAC: 16}
+
+
+@dataclass(frozen=True)
+class IntegrityPolicy:
+    """The integrity mode a connection sends with, and the weakest it accepts."""
+    mode: Integrity = Integrity.CRC32
+    key: Optional[bytes] = None
+
+    def __post_init__(self):
+        if self.mode is Integrity.HMAC and not self.key:
+            raise ValueError("HMAC integrity needs a shared key")
+
+    def tag(self, payload) -> bytes:
+        """Tag for payload under this policy's mode."""
+        return _compute_tag(self.mode, self.key, payload)
+
+    def accepts(self, mode: Integrity) -> bool:
+        return _INTEGRITY_CODES[mode] >= _INTEGRITY_CODES[self.mode]
+
+    def with_mode(self, mode: Integrity) -> 'IntegrityPolicy':
+        return IntegrityPolicy(mode, self.key)
+
+
+DEFAULT_INTEGRITY = IntegrityPolicy()
+
+
+def _compute_tag(mode: Integrity, key: Optional[bytes], payload) -> bytes:
+    if mode is Integrity.CRC32:
+        return zlib.crc32(payload).to_bytes(4, 'big')
+    if mode is Integrity.HMAC:
+        return hmac.new(key, payload, hashlib.sha256).digest()[:16]
+    return b""
+
+
+def negotiate_integrity(requested: Optional[str], server: IntegrityPolicy,
+                        allow_unchecked: bool = False) -> IntegrityPolicy:
+    """
+    Server side of the JOIN_GAME handshake: the policy a connection switches
+    to. HMAC servers stay HMAC; otherwise a client asking for "none" gets it
+    only when the server allows unchecked (trusted LAN) links.
+    """
+    if server.mode is Integrity.HMAC:
+        return server
+    if requested == Integrity.NONE.value and allow_unchecked:
+        return server.with_mode(Integrity.NONE)
+    return server.with_mode(Integrity.CRC32)
+
+
 class NetworkMessage:
     """A network message with metadata and payload."""
     
@@ -67,27 +142,41 @@ class NetworkMessage:
         self.timestamp = timestamp if timestamp is not None else time.time()
         self.sequence = sequence if sequence > 0 else 1
         self.data = data if data is not None else {}
-        self.checksum = checksum
+        # Integrity tag (hex); set when the message is serialized or decoded
+        self._checksum = checksum
+        self._verified = False
         # Generate message_id for test compatibility
         self.message_id = f"msg_{int(self.timestamp * 1000)}_{self.sequence}"
-        if self.checksum is None:
-            self.checksum = self._calculate_checksum()
+    
+    @property
+    def checksum(self) -> str:
+        """Hex integrity tag of the wire payload (CRC32 until the message is sent)."""
+        if self._checksum is None:
+            self._checksum = self._calculate_checksum()
+        return self._checksum
+    
+    @checksum.setter
+    def checksum(self, value):
+        self._checksum = value
+        self._verified = False
     
     def _calculate_checksum(self) -> str:
-        """Calculate SHA-256 checksum of message content."""
-        content = {
-            "type": self.type.value,
-            "player_id": self.player_id,
-            "timestamp": self.timestamp,
-            "sequence": self.sequence,
-            "data": self.data
-        }
-        content_str = json.dumps(content, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(content_str.encode()).hexdigest()[:16]
+        """Calculate the CRC32 of the message's wire payload."""
+        return _compute_tag(Integrity.CRC32, None, self.payload_bytes()).hex()
     
     def is_valid(self) -> bool:
-        """Verify message integrity using checksum."""
-        return self.checksum == self._calculate_checksum()
+        """
+        Verify message integrity. Received frames are checked once, when they
+        are decoded, so only a checksum supplied some other way (from_dict)
+        is compared here.
+        """
+        if self._verified or self._checksum is None:
+            return True
+        return self._checksum == self._calculate_checksum()
+    
+    def payload_bytes(self) -> bytes:
+        """The JSON payload as sent on the wire."""
+        return json.dumps(self.to_wire_dict(), separators=(',', ':')).encode('utf-8')
     
     def to_bytes(self) -> bytes:
         """Convert message to bytes for transmission."""
@@ -98,18 +187,23 @@ class NetworkMessage:
         """Create message from bytes."""
         return deserialize_message(data)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert message to dictionary for serialization."""
+    def to_wire_dict(self) -> Dict[str, Any]:
+        """Fields carried in the payload (the checksum travels in the frame)."""
         return {
             "type": self.type.value,
             "player_id": self.player_id,
             "timestamp": self.timestamp,
             "sequence": self.sequence,
             "data": self.data,
-            "checksum": self.checksum,
             "message_id": self.message_id
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert message to dictionary for serialization."""
+        message_dict = self.to_wire_dict()
+        message_dict["checksum"] = self.checksum
+        return message_dict
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'NetworkMessage':
         """Create message from dictionary."""
@@ -146,12 +240,22 @@ class MessageProtocol:
             data=data
         )
     
-    def create_join_game_message(self, player_name: str, deck_name: str) -> NetworkMessage:
-        """Create a JOIN_GAME message."""
-        return self.create_message(MessageType.JOIN_GAME, {
+    def create_join_game_message(self, player_name: str, deck_name: str,
+                                 integrity: Optional[Integrity] = None,
+                                 codecs: Optional[Iterable[str]] = None) -> NetworkMessage:
+        """
+        Create a JOIN_GAME message, optionally asking for an integrity mode
+        and listing the codecs this client speaks, most preferred first.
+        """
+        data = {
             "player_name": player_name,
             "deck_name": deck_name
-        })
+        }
+        if integrity is not None:
+            data["integrity"] = integrity.value
+        if codecs is not None:
+            data["codecs"] = list(codecs)
+        return self.create_message(MessageType.JOIN_GAME, data)
     
     def create_player_action_message(self, action: str, **kwargs) -> NetworkMessage:
         """Create a PLAYER_ACTION message."""
@@ -184,10 +288,30 @@ class MessageProtocol:
             "active_player": active_player
         })
     
-    def create_game_state_update_message(self, state_data: Dict[str, Any]) -> NetworkMessage:
-        """Create a GAME_STATE_UPDATE message."""
-        return self.create_message(MessageType.GAME_STATE_UPDATE, {
-            "state": state_data
+    def create_game_state_update_message(self, state_data: Dict[str, Any] = None, version: int = None,
+                                         delta: Dict[str, Any] = None, base: int = None) -> NetworkMessage:
+        """
+        Create a GAME_STATE_UPDATE message: a full snapshot (state_data), or
+        the delta from version base (see network.state_sync).
+        """
+        data = {} if version is None else {"version": version}
+        if delta is not None:
+            data["base"] = base
+            data["delta"] = delta
+        else:
+            data["state"] = state_data
+        return self.create_message(MessageType.GAME_STATE_UPDATE, data)
+    
+    def create_state_ack_message(self, version: int) -> NetworkMessage:
+        """Create an ACKNOWLEDGMENT for an applied game state version."""
+        return self.create_message(MessageType.ACKNOWLEDGMENT, {
+            "state_version": version
+        })
+    
+    def create_resync_request_message(self, version: Optional[int] = None) -> NetworkMessage:
+        """Create a RESYNC_REQUEST, asking for a full game state snapshot."""
+        return self.create_message(MessageType.RESYNC_REQUEST, {
+            "state_version": version
         })
     
     def create_error_message(self, error_msg: str, error_code: str) -> NetworkMessage:
@@ -205,23 +329,388 @@ class MessageProtocol:
         })
 
 
-def serialize_message(message: NetworkMessage) -> bytes:
-    """Serialize a network message to bytes for transmission."""
+class MessageCodec:
+    """
+    Turns a message into frame payload bytes and back. Each codec has a
+    name (used in JOIN_GAME negotiation) and a 4-bit code (carried in the
+    frame); add new ones with register_codec.
+    """
+    name = ""
+    code = 0
+
+    def encode(self, message: NetworkMessage) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, payload) -> NetworkMessage:
+        raise NotImplementedError
+
+
+class JsonCodec(MessageCodec):
+    """Verbose JSON with string keys; every peer speaks it, so it is the fallback."""
+    name = "json"
+    code = 0
+
+    def encode(self, message: NetworkMessage) -> bytes:
+        return message.payload_bytes()
+
+    def decode(self, payload) -> NetworkMessage:
+        # Decode straight from the receive buffer
+        return NetworkMessage.from_dict(json.loads(str(payload, 'utf-8')))
+
+
+# Binary wire tags. Both tables are append-only: a tag's meaning never changes
+# between versions, so new message types and strings go at the end.
+_MESSAGE_TYPES = tuple(MessageType)
+_MESSAGE_TYPE_TAGS = {msg_type: tag for tag, msg_type in enumerate(_MESSAGE_TYPES)}
+
+# Keys and values common enough in game traffic to send as a 2-byte index
+_WIRE_STRINGS = (
+    "player_id", "player_name", "deck_name", "card_id", "zone_from", "zone_to",
+    "targets", "mana_cost", "state", "new_phase", "active_player", "message",
+    "error_code", "alive", "timestamp", "success", "action", "integrity", "codecs",
+    "codec", "players", "name", "id", "life", "phase", "turn", "step", "version",
+    "zones", "library", "hand", "battlefield", "graveyard", "exile", "command",
+    "stack", "tapped", "counters", "power", "toughness", "types", "owner",
+    "controller", "commander_damage", "mana_pool", "poison", "W", "U", "B", "R",
+    "G", "C", "untap", "upkeep", "draw", "main1", "combat", "main2", "end",
+    "cleanup", "base", "changes", "moves", "from", "to", "index",
+    "delta", "cards", "removed", "state_version", "has_lost", "damage",
+    "UNTAP", "UPKEEP", "DRAW", "PRECOMBAT_MAIN", "BEGIN_COMBAT", "DECLARE_ATTACKERS",
+    "DECLARE_BLOCKERS", "COMBAT_DAMAGE", "END_COMBAT", "POSTCOMBAT_MAIN", "END", "CLEANUP",
+)
+_WIRE_STRING_INDEX = {text: index for index, text in enumerate(_WIRE_STRINGS)}
+
+# Value tags, msgpack-style: small ints and short strings/lists/dicts keep
+# their size in the tag byte.
+_FIXINT_MAX = 0x7f           # 0x00-0x7f: the int itself
+_FIXSTR = 0x80               # 0x80-0x9f: str of 0-31 bytes
+_FIXLIST = 0xa0              # 0xa0-0xaf: list of 0-15 items
+_FIXDICT = 0xb0              # 0xb0-0xbf: dict of 0-15 items
+_T_NONE = 0xc0
+_T_FALSE = 0xc1
+_T_TRUE = 0xc2
+_T_NEGINT = 0xc3             # varint of -value - 1
+_T_INT = 0xc4                # varint
+_T_FLOAT = 0xc5              # big-endian double
+_T_STR = 0xc6                # varint length + UTF-8
+_T_LIST = 0xc7               # varint count + items
+_T_DICT = 0xc8               # varint count + key/value pairs
+_T_INTERNED = 0xc9           # varint index into _WIRE_STRINGS
+
+_CONSTANTS = {_T_NONE: None, _T_FALSE: False, _T_TRUE: True}
+_DOUBLE = struct.Struct('>d')
+_BASE_TYPES = ((str, str.__str__), (int, int), (float, float), (dict, dict), ((list, tuple), list))
+
+# type tag, flags, timestamp; then varint player_id and sequence
+_BINARY_HEADER = struct.Struct('>BBd')
+_FLAG_MESSAGE_ID = 0x01      # message_id is not the one derived from timestamp/sequence
+
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf: bytes, pos: int):
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    _write_varint(out, value)
+    return bytes(out)
+
+
+# Encoded form of short strings seen so far (keys, zone and card names), so
+# repeated strings cost one dict lookup. Bounded: peers choose player names.
+_STRING_CACHE_LIMIT = 4096
+_encoded_strings: Dict[str, bytes] = {}
+
+
+def _encode_str(value: str) -> bytes:
+    index = _WIRE_STRING_INDEX.get(value)
+    if index is not None:
+        encoded = bytes((_T_INTERNED,)) + _varint(index)
+    else:
+        raw = value.encode('utf-8')
+        if len(raw) < 32:
+            encoded = bytes((_FIXSTR | len(raw),)) + raw
+        else:
+            encoded = bytes((_T_STR,)) + _varint(len(raw)) + raw
+    if len(value) <= 64 and len(_encoded_strings) < _STRING_CACHE_LIMIT:
+        _encoded_strings[value] = encoded
+    return encoded
+
+
+for _text in _WIRE_STRINGS:
+    _encode_str(_text)
+
+
+def _encode_int(out: bytearray, value: int):
+    if 0 <= value <= _FIXINT_MAX:
+        out.append(value)
+    elif value < 0:
+        out.append(_T_NEGINT)
+        _write_varint(out, -value - 1)
+    else:
+        out.append(_T_INT)
+        _write_varint(out, value)
+
+
+def _encode_value(out: bytearray, value):
+    kind = type(value)
+    if kind is str:
+        out += _encoded_strings.get(value) or _encode_str(value)
+    elif kind is int:
+        _encode_int(out, value)
+    elif kind is dict:
+        if len(value) < 16:
+            out.append(_FIXDICT | len(value))
+        else:
+            out.append(_T_DICT)
+            _write_varint(out, len(value))
+        for key, item in value.items():
+            if type(key) is not str:
+                # JSON only has string keys; keep the two codecs interchangeable
+                key = json.dumps(key).strip('"')
+            out += _encoded_strings.get(key) or _encode_str(key)
+            if type(item) is int and 0 <= item <= _FIXINT_MAX:
+                out.append(item)
+            else:
+                _encode_value(out, item)
+    elif kind is list or kind is tuple:
+        if len(value) < 16:
+            out.append(_FIXLIST | len(value))
+        else:
+            out.append(_T_LIST)
+            _write_varint(out, len(value))
+        for item in value:
+            if type(item) is int and 0 <= item <= _FIXINT_MAX:
+                out.append(item)
+            else:
+                _encode_value(out, item)
+    elif value is None:
+        out.append(_T_NONE)
+    elif value is True:
+        out.append(_T_TRUE)
+    elif value is False:
+        out.append(_T_FALSE)
+    elif kind is float:
+        out.append(_T_FLOAT)
+        out += _DOUBLE.pack(value)
+    else:
+        # Subclasses (str/int enums, OrderedDict, ...) go as their base type, like JSON
+        for base, convert in _BASE_TYPES:
+            if isinstance(value, base):
+                _encode_value(out, convert(value))
+                return
+        raise TypeError(f"Object of type {kind.__name__} is not wire serializable")
+
+
+def _decode_value(buf: bytes, pos: int):
+    tag = buf[pos]
+    pos += 1
+    if tag <= _FIXINT_MAX:
+        return tag, pos
+    if tag == _T_INTERNED:
+        if buf[pos] <= _FIXINT_MAX:
+            return _WIRE_STRINGS[buf[pos]], pos + 1
+        index, pos = _read_varint(buf, pos)
+        return _WIRE_STRINGS[index], pos
+    if tag < _FIXLIST:
+        end = pos + (tag & 0x1f)
+        return buf[pos:end].decode('utf-8'), end
+    if tag < _FIXDICT:
+        return _decode_list(buf, pos, tag & 0x0f)
+    if tag < _T_NONE:
+        return _decode_dict(buf, pos, tag & 0x0f)
+    if tag == _T_TRUE:
+        return True, pos
+    if tag == _T_FALSE:
+        return False, pos
+    if tag == _T_NONE:
+        return None, pos
+    if tag == _T_INT:
+        return _read_varint(buf, pos)
+    if tag == _T_NEGINT:
+        value, pos = _read_varint(buf, pos)
+        return -value - 1, pos
+    if tag == _T_FLOAT:
+        return _DOUBLE.unpack_from(buf, pos)[0], pos + 8
+    if tag == _T_STR:
+        length, pos = _read_varint(buf, pos)
+        return buf[pos:pos + length].decode('utf-8'), pos + length
+    if tag == _T_LIST:
+        count, pos = _read_varint(buf, pos)
+        return _decode_list(buf, pos, count)
+    if tag == _T_DICT:
+        count, pos = _read_varint(buf, pos)
+        return _decode_dict(buf, pos, count)
+    raise ValueError(f"unknown value tag 0x{tag:02x}")
+
+
+def _decode_list(buf: bytes, pos: int, count: int):
+    items = []
+    for _ in range(count):
+        tag = buf[pos]
+        if tag <= _FIXINT_MAX:
+            items.append(tag)
+            pos += 1
+        else:
+            item, pos = _decode_value(buf, pos)
+            items.append(item)
+    return items, pos
+
+
+def _decode_dict(buf: bytes, pos: int, count: int):
+    result = {}
+    for _ in range(count):
+        # Keys are nearly always interned strings with a one-byte index
+        if buf[pos] == _T_INTERNED and buf[pos + 1] <= _FIXINT_MAX:
+            key = _WIRE_STRINGS[buf[pos + 1]]
+            pos += 2
+        else:
+            key, pos = _decode_value(buf, pos)
+            if type(key) is not str:
+                raise ValueError("dict key is not a string")
+        tag = buf[pos]
+        if tag <= _FIXINT_MAX:
+            result[key] = tag
+            pos += 1
+        elif tag in _CONSTANTS:
+            result[key] = _CONSTANTS[tag]
+            pos += 1
+        else:
+            result[key], pos = _decode_value(buf, pos)
+    return result, pos
+
+
+class BinaryCodec(MessageCodec):
+    """
+    Compact encoding: a struct-packed header with an integer type tag,
+    varint ids and tagged, length-prefixed values with common strings
+    interned. Carries exactly what JSON carries (decoded messages compare
+    equal), at roughly half the bytes for game state updates.
+    """
+    name = "binary"
+    code = 1
+
+    def encode(self, message: NetworkMessage) -> bytes:
+        sequence = message.sequence
+        derived_id = message.message_id == f"msg_{int(message.timestamp * 1000)}_{sequence}"
+        out = bytearray(_BINARY_HEADER.pack(
+            _MESSAGE_TYPE_TAGS[message.type],
+            0 if derived_id else _FLAG_MESSAGE_ID,
+            message.timestamp
+        ))
+        _write_varint(out, message.player_id)
+        _write_varint(out, sequence)
+        if not derived_id:
+            _encode_value(out, message.message_id)
+        _encode_value(out, message.data)
+        return bytes(out)
+
+    def decode(self, payload) -> NetworkMessage:
+        buf = bytes(payload)
+        type_tag, flags, timestamp = _BINARY_HEADER.unpack_from(buf, 0)
+        player_id, pos = _read_varint(buf, _BINARY_HEADER.size)
+        sequence, pos = _read_varint(buf, pos)
+        message_id = None
+        if flags & _FLAG_MESSAGE_ID:
+            message_id, pos = _decode_value(buf, pos)
+        data, pos = _decode_value(buf, pos)
+        if pos != len(buf):
+            raise ValueError("trailing bytes after message")
+        if type_tag >= len(_MESSAGE_TYPES):
+            raise ValueError(f"unknown message type tag {type_tag}")
+        message = NetworkMessage(
+            type=_MESSAGE_TYPES[type_tag],
+            player_id=player_id,
+            timestamp=timestamp,
+            sequence=sequence,
+            data=data
+        )
+        if message_id is not None:
+            message.message_id = message_id
+        return message
+
+
+JSON_CODEC = JsonCodec()
+BINARY_CODEC = BinaryCodec()
+
+_CODECS_BY_NAME: Dict[str, MessageCodec] = {}
+_CODECS_BY_CODE: Dict[int, MessageCodec] = {}
+
+
+def register_codec(codec: MessageCodec) -> MessageCodec:
+    """Make a codec available for decoding and negotiation."""
+    if not 0 <= codec.code <= 0x0f:
+        raise ValueError(f"Codec code must fit in 4 bits: {codec.code}")
+    existing = _CODECS_BY_CODE.get(codec.code)
+    if existing is not None and existing.name != codec.name:
+        raise ValueError(f"Codec code {codec.code} is already used by {existing.name}")
+    _CODECS_BY_NAME[codec.name] = codec
+    _CODECS_BY_CODE[codec.code] = codec
+    return codec
+
+
+register_codec(JSON_CODEC)
+register_codec(BINARY_CODEC)
+
+
+def get_codec(name: str) -> Optional[MessageCodec]:
+    """The registered codec called name, or None."""
+    return _CODECS_BY_NAME.get(name)
+
+
+def available_codecs() -> list:
+    """Names of all registered codecs, most compact first."""
+    return sorted(_CODECS_BY_NAME, key=lambda name: -_CODECS_BY_NAME[name].code)
+
+
+def negotiate_codec(requested: Optional[Iterable[str]],
+                    supported: Optional[Iterable[str]] = None) -> MessageCodec:
+    """
+    Server side of the JOIN_GAME handshake: the first codec in the client's
+    preference list that this server supports, or JSON for clients that
+    did not ask (or asked only for codecs we do not know).
+    """
+    allowed = set(available_codecs() if supported is None else supported)
+    for name in requested or ():
+        codec = _CODECS_BY_NAME.get(name) if isinstance(name, str) else None
+        if codec is not None and name in allowed:
+            return codec
+    return JSON_CODEC
+
+
+def serialize_message(message: NetworkMessage, integrity: IntegrityPolicy = DEFAULT_INTEGRITY,
+                      codec: MessageCodec = JSON_CODEC) -> bytes:
+    """Serialize a network message to a length-prefixed frame for transmission."""
     try:
-        message_dict = message.to_dict()
-        json_str = json.dumps(message_dict, separators=(',', ':'))
-        
-        # Add message length header (4 bytes)
-        message_bytes = json_str.encode('utf-8')
-        length_bytes = len(message_bytes).to_bytes(4, byteorder='big')
+        payload = codec.encode(message)
+        tag = integrity.tag(payload)
+        message._checksum = tag.hex()
         
-        return length_bytes + message_bytes
+        # Add message length header (4 bytes), then codec/integrity byte and tag
+        length = 1 + len(tag) + len(payload)
+        flags = (codec.code << 4) | _INTEGRITY_CODES[integrity.mode]
+        header = length.to_bytes(4, byteorder='big') + bytes((flags,))
+        return header + tag + payload
         
     except Exception as e:
         raise ValueError(f"Failed to serialize message: {e}")
 
 
-def deserialize_message(data: bytes) -> NetworkMessage:
+def deserialize_message(data: bytes, integrity: IntegrityPolicy = DEFAULT_INTEGRITY) -> NetworkMessage:
     """Deserialize bytes back to a network message."""
     try:
         # Read length header
@@ -233,16 +722,43 @@ def deserialize_message(data: bytes) -> NetworkMessage:
         if len(data) < 4 + length:
             raise ValueError("Invalid message: incomplete data")
         
-        # Extract and decode JSON
-        json_data = data[4:4+length].decode('utf-8')
-        message_dict = json.loads(json_data)
+        return decode_message_body(memoryview(data)[4:4+length], integrity)
         
-        # Create and validate message
-        message = NetworkMessage.from_dict(message_dict)
-        
-        if not message.is_valid():
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Failed to deserialize message: {e}")
+
+
+def decode_message_body(body, integrity: IntegrityPolicy = DEFAULT_INTEGRITY) -> NetworkMessage:
+    """
+    Decode one frame body (bytes or a memoryview from network.framing) to a
+    message, checking its integrity tag. Any registered codec is accepted;
+    frames weaker than integrity.mode are rejected.
+    """
+    try:
+        if len(body) < 1:
+            raise ValueError("Invalid message: empty frame")
+        flags = body[0]
+        codec = _CODECS_BY_CODE.get(flags >> 4)
+        if codec is None:
+            raise ValueError(f"Invalid message: unknown codec {flags >> 4}")
+        mode = _INTEGRITY_BY_CODE.get(flags & 0x0f)
+        if mode is None:
+            raise ValueError(f"Invalid message: unknown integrity mode {flags & 0x0f}")
+        if not integrity.accepts(mode):
+            raise ValueError(f"Invalid message: {mode.value} frame where {integrity.mode.value} is required")
+        tag_end = 1 + _TAG_SIZES[mode]
+        tag = bytes(body[1:tag_end])
+        payload = body[tag_end:]
+        if mode is Integrity.HMAC and not integrity.key:
+            raise ValueError("Invalid message: HMAC frame but no key configured")
+        if not hmac.compare_digest(tag, _compute_tag(mode, integrity.key, payload)):
             raise ValueError("Invalid message: checksum mismatch")
         
+        message = codec.decode(payload)
+        message._checksum = tag.hex()
+        message._verified = True
         return message
         
     except json.JSONDecodeError as e:
@@ -271,10 +787,7 @@ def validate_message(message: NetworkMessage, expected_types: list = None) -> bo
         if expected_types and message.type not in expected_types:
             return False
         
-        # Verify checksum
-        if not message.is_valid():
-            return False
-        
+        # Integrity was checked once, when the frame was decoded
         return True
         
     except Exception:
@@ -285,7 +798,7 @@ def validate_message(message: NetworkMessage, expected_types: list = None) -> bo
 MESSAGE_SCHEMAS = {
     MessageType.JOIN_GAME: {
         "required_fields": ["player_name", "deck_name"],
-        "optional_fields": []
+        "optional_fields": ["integrity", "codecs"]
     },
     MessageType.PLAYER_ACTION: {
         "required_fields": ["action"],
@@ -13,9 +13,10 @@ from typing import Optional, Callable, Dict, Any
 from PySide6.QtCore import QObject, Signal, QTimer
 
 from .message_protocol import (
-    NetworkMessage, MessageType, MessageProtocol,
-    serialize_message, deserialize_message, validate_message
+    NetworkMessage, MessageType, MessageProtocol, Integrity, IntegrityPolicy, DEFAULT_INTEGRITY,
+    JSON_CODEC, available_codecs, get_codec, serialize_message, decode_message_body, validate_message
 )
+from .framing import FrameDecoder
 from . import (
     DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT, CONNECTION_TIMEOUT,
     MESSAGE_TIMEOUT, RECONNECT_ATTEMPTS, RECONNECT_DELAY, HEARTBEAT_INTERVAL
@@ -47,7 +48,9 @@ class NetworkClient(QObject):
     game_started = Signal()
     game_ended = Signal()
     
-    def __init__(self, player_id: int = 0, parent=None):
+    def __init__(self, player_id: int = 0, parent=None,
+                 integrity: IntegrityPolicy = DEFAULT_INTEGRITY, trusted_lan: bool = False,
+                 codecs: Optional[list] = None):
         super().__init__(parent)
         
         # Client configuration
@@ -55,6 +58,13 @@ class NetworkClient(QObject):
         self.server_host = DEFAULT_SERVER_HOST
         self.server_port = DEFAULT_SERVER_PORT
         
+        # Frame integrity; on a trusted LAN ask the server to skip it (JOIN_GAME)
+        self.integrity = integrity
+        self.trusted_lan = trusted_lan
+        # Wire codecs offered at JOIN_GAME, most preferred first; JSON until the server picks
+        self.codecs = list(codecs) if codecs is not None else available_codecs()
+        self.codec = JSON_CODEC
+        
         # Connection state
         self.state = ClientState.DISCONNECTED
         self.socket: Optional[socket.socket] = None
@@ -137,7 +147,8 @@ class NetworkClient(QObject):
             return False
         
         try:
-            message = self.protocol.create_join_game_message(player_name, deck_name)
+            requested = Integrity.NONE if self.trusted_lan else self.integrity.mode
+            message = self.protocol.create_join_game_message(player_name, deck_name, requested, self.codecs)
             return self.send_message(message)
         except Exception as e:
             self.error_occurred.emit(f"Failed to join game: {e}")
@@ -172,33 +183,19 @@ class NetworkClient(QObject):
     
     def _receive_loop(self):
         """Main receive loop running in separate thread."""
-        buffer = b""
+        decoder = FrameDecoder()
         
         while self.running and self.socket:
             try:
-                # Receive data
-                data = self.socket.recv(4096)
-                if not data:
+                # Receive straight into the decoder's buffer
+                if not decoder.recv_into(self.socket):
                     break
                 
-                buffer += data
-                
                 # Process complete messages
-                while len(buffer) >= 4:
-                    # Read message length
-                    length = int.from_bytes(buffer[:4], byteorder='big')
-                    
-                    # Check if we have complete message
-                    if len(buffer) < 4 + length:
-                        break
-                    
-                    # Extract message data
-                    message_data = buffer[:4+length]
-                    buffer = buffer[4+length:]
-                    
+                for body in decoder.frames():
                     # Deserialize and handle message
                     try:
-                        message = deserialize_message(message_data)
+                        message = decode_message_body(body, self.integrity)
                         self._handle_received_message(message)
                     except Exception as e:
                         self.error_occurred.emit(f"Failed to process message: {e}")
@@ -234,7 +231,7 @@ class NetworkClient(QObject):
             return False
         
         try:
-            data = serialize_message(message)
+            data = serialize_message(message, self.integrity, self.codec)
             self.socket.sendall(data)
             return True
         except Exception as e:
@@ -257,6 +254,11 @@ class NetworkClient(QObject):
     
     def _handle_player_joined(self, message: NetworkMessage):
         """Handle PLAYER_JOINED message."""
+        if message.data.get("success"):
+            # The server's answer to our JOIN_GAME: send and check frames this way from now on
+            if "integrity" in message.data:
+                self.integrity = self.integrity.with_mode(Integrity(message.data["integrity"]))
+            self.codec = get_codec(message.data.get("codec")) or JSON_CODEC
         player_id = message.data.get("player_id")
         player_name = message.data.get("player_name")
         if player_id is not None and player_name:
@@ -26,6 +26,7 @@ except ImportError:
             pass
 
 from .message_protocol import MessageType, NetworkMessage
+from .state_sync import StateSyncClient, snapshot_game_state
 
 
 class NetworkGameController(GameController):
@@ -38,6 +39,7 @@ class NetworkGameController(GameController):
     network_game_ended = Signal()
     network_error = Signal(str)
     connection_status_changed = Signal(str)     # status message
+    game_state_synced = Signal(object)          # GAME_STATE_UPDATE data just applied
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -56,6 +58,7 @@ class NetworkGameController(GameController):
         # Synchronization
         self.sync_lock = threading.RLock()
         self.awaiting_server_confirmation = False
+        self.state_sync = StateSyncClient()    # client: server state, kept by deltas
         
         # Message handlers
         self.network_handlers = {
@@ -116,6 +119,8 @@ class NetworkGameController(GameController):
                 self.network_client.disconnected.connect(self._on_client_disconnected)
             if hasattr(self.network_client, 'error_occurred'):
                 self.network_client.error_occurred.connect(self._on_network_error)
+            if hasattr(self.network_client, 'message_received'):
+                self.network_client.message_received.connect(self._on_network_message)
             
             self.is_networked = True
             return self.network_client
@@ -173,6 +178,7 @@ class NetworkGameController(GameController):
             with self.sync_lock:
                 super().advance_phase()
                 self._broadcast_phase_change()
+                self._broadcast_game_state()
         else:
             # Client sends phase advance request
             if self.network_client and hasattr(self.network_client, 'send_player_action'):
@@ -187,6 +193,7 @@ class NetworkGameController(GameController):
             if result and self.is_server:
                 # Broadcast to clients
                 self._broadcast_play_card(player_id, card_id, zone_from, zone_to, **kwargs)
+                self._broadcast_game_state()
             
             return result
         else:
@@ -204,6 +211,7 @@ class NetworkGameController(GameController):
             if self.is_server:
                 # Broadcast to clients
                 self._broadcast_pass_priority(player_id or 0)
+                self._broadcast_game_state()
         else:
             # Client mode - send to server
             if self.network_client and hasattr(self.network_client, 'send_player_action'):
@@ -225,8 +233,7 @@ class NetworkGameController(GameController):
             return  # Server doesn't receive state updates
         
         try:
-            state_data = message.data.get("state", {})
-            self._apply_game_state_update(state_data)
+            self._apply_game_state_update(message.data)
         except Exception as e:
             self.network_error.emit(f"Failed to apply game state update: {e}")
     
@@ -309,14 +316,42 @@ class NetworkGameController(GameController):
             print(f"Error executing cast spell: {e}")
             return False
     
-    def _apply_game_state_update(self, state_data: Dict[str, Any]):
-        """Apply game state update from server."""
-        # This would need to be implemented based on your GameState structure
+    def _apply_game_state_update(self, update: Dict[str, Any]):
+        """
+        Apply GAME_STATE_UPDATE data from the server (a full snapshot or a
+        delta, see network.state_sync) and acknowledge the new version. A
+        delta we cannot apply means we missed a version: ask for a resync.
+        """
+        client = self.network_client
         with self.sync_lock:
-            print(f"Applying game state update: {state_data}")
+            applied = self.state_sync.apply_update(update)
+            version = self.state_sync.version
+        if client is not None and hasattr(client, 'send_message'):
+            if not applied:
+                client.send_message(client.protocol.create_resync_request_message(version))
+            elif version is not None:
+                client.send_message(client.protocol.create_state_ack_message(version))
+        if applied:
+            self.game_state_synced.emit(update)
+    
+    @property
+    def synced_state(self) -> Optional[Dict[str, Any]]:
+        """The latest game state snapshot received from the server (clients only)."""
+        return self.state_sync.state.snapshot if self.state_sync.state is not None else None
     
     # Network broadcasting (server-side)
     
+    def _broadcast_game_state(self):
+        """Publish the current game state; clients are sent only what changed."""
+        if not self.is_server or not self.game_server or getattr(self, 'game', None) is None:
+            return
+        
+        try:
+            if hasattr(self.game_server, 'publish_state'):
+                self.game_server.publish_state(snapshot_game_state(self.game))
+        except Exception as e:
+            print(f"Error broadcasting game state: {e}")
+    
     def _broadcast_phase_change(self):
         """Broadcast phase change to all clients."""
         if not self.is_server or not self.game_server:
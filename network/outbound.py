@@ -0,0 +1,141 @@
+"""MTG Commander Game - Outbound Frame Queues
+
+Bounded per-client queue of encoded frames, drained by that client's own
+writer (see AsyncGameServer._drain), so one slow client never holds up the
+others.
+
+Backpressure, by message kind:
+
+- heartbeats are coalesced (one queued at most) and dropped while the
+  client is backed up; any frame it receives shows the server is alive
+- state updates are coalesced into one slot whose frame is produced when
+  the writer reaches it, so a lagging client gets a single delta from the
+  version it last received to the current one
+- everything else is delivered in order; a client whose queue overflows,
+  or stays backed up for longer than the policy allows, is disconnected
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Union
+
+# A frame, or a callable producing one (or None for nothing) at write time
+FrameSource = Union[bytes, Callable[[], Optional[bytes]]]
+
+
+@dataclass(frozen=True)
+class OutboundPolicy:
+    """Limits for one client's outbound queue."""
+    max_frames: int = 512                   # overflow: disconnect
+    max_bytes: int = 8 * 1024 * 1024        # overflow: disconnect
+    lag_frames: int = 32                    # at or above this the client is backed up
+    lag_timeout: float = 15.0               # backed up this long: disconnect
+
+
+DEFAULT_OUTBOUND_POLICY = OutboundPolicy()
+
+
+class _Slot:
+    """A queued frame; coalescing kinds keep one slot and swap its contents."""
+    __slots__ = ('kind', 'source', 'size')
+
+    def __init__(self, kind: Optional[str], source: FrameSource):
+        self.kind = kind
+        self.source = source
+        self.size = _frame_size(source)
+
+
+def _frame_size(source: FrameSource) -> int:
+    return 0 if callable(source) else len(source)
+
+
+class OutboundQueue:
+    """Bounded FIFO of outgoing frames for one client."""
+
+    # Kinds that keep at most one queued slot, replaced by newer ones
+    COALESCED = frozenset({"heartbeat", "state"})
+    # Kinds dropped outright while the client is backed up
+    DROPPABLE = frozenset({"heartbeat"})
+
+    def __init__(self, policy: OutboundPolicy = DEFAULT_OUTBOUND_POLICY,
+                 on_ready: Optional[Callable[[], None]] = None):
+        self.policy = policy
+        self.on_ready = on_ready            # called after every successful put
+        self._slots: Deque[_Slot] = deque()
+        self._pending: Dict[str, _Slot] = {}
+        self.nbytes = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.lagging_since: Optional[float] = None
+        self.closed = False
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def backed_up(self) -> bool:
+        return len(self._slots) >= self.policy.lag_frames
+
+    def put(self, source: FrameSource, kind: Optional[str] = None) -> bool:
+        """
+        Queue a frame (shared bytes are fine, they are never modified). Returns
+        False when the queue overflowed; the client should be disconnected.
+        """
+        if self.closed:
+            return False
+        if kind in self.DROPPABLE and self.backed_up:
+            self.dropped += 1
+            return True
+        if kind in self.COALESCED:
+            slot = self._pending.get(kind)
+            if slot is not None:
+                size = _frame_size(source)
+                self.nbytes += size - slot.size
+                slot.source = source
+                slot.size = size
+                self.coalesced += 1
+                return True
+        slot = _Slot(kind, source)
+        if len(self._slots) >= self.policy.max_frames or self.nbytes + slot.size > self.policy.max_bytes:
+            return False
+        self._slots.append(slot)
+        self.nbytes += slot.size
+        if kind in self.COALESCED:
+            self._pending[kind] = slot
+        if self.lagging_since is None and self.backed_up:
+            self.lagging_since = time.monotonic()
+        if self.on_ready is not None:
+            self.on_ready()
+        return True
+
+    def pop(self) -> Optional[bytes]:
+        """Next frame to write, or None when the queue is empty."""
+        while self._slots:
+            slot = self._slots.popleft()
+            self.nbytes -= slot.size
+            if slot.kind in self.COALESCED:
+                del self._pending[slot.kind]
+            if not self.backed_up:
+                self.lagging_since = None
+            frame = slot.source() if callable(slot.source) else slot.source
+            if frame is not None:
+                return frame
+        return None
+
+    def lagging_for(self, now: Optional[float] = None) -> float:
+        """Seconds the client has been continuously backed up (0 if it is not)."""
+        if self.lagging_since is None:
+            return 0.0
+        return (time.monotonic() if now is None else now) - self.lagging_since
+
+    def too_slow(self, now: Optional[float] = None) -> bool:
+        """Backed up for longer than the policy allows."""
+        return self.lagging_for(now) > self.policy.lag_timeout
+
+    def close(self):
+        """Drop everything queued; later puts fail."""
+        self.closed = True
+        self._slots.clear()
+        self._pending.clear()
+        self.nbytes = 0
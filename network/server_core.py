@@ -0,0 +1,775 @@
+"""MTG Commander Game - Server Core
+
+The game server proper: an asyncio event loop that accepts clients, reads
+their length-prefixed messages (straight into a network.framing.FrameDecoder
+buffer via asyncio.BufferedProtocol) and dispatches them to the same
+MessageType handlers the server has always had. It has no Qt dependency, so many tables
+can be hosted in one process - each AsyncGameServer is just a listening socket
+and a few tasks on a shared loop:
+
+    server = AsyncGameServer()
+    await server.start("0.0.0.0", 8888)    # inside a running loop
+    ...
+    await server.stop()
+
+or, from synchronous code, on a loop in a background thread:
+
+    server.start_in_thread("0.0.0.0", 8888)
+    server.run_sync(server.start_game)
+    server.stop_in_thread()
+
+All connection state (players, transports, game flags) is touched only on the
+loop, so no locks are needed. Outgoing frames go through a bounded per-client
+queue (network.outbound) drained by that client's own writer task; a
+broadcast is encoded once per wire format and the same bytes are queued for
+every recipient. Other threads go through call_soon / run_sync.
+Events are reported to listeners registered with add_listener; the Qt GUI
+uses network.game_server.GameServer, which turns them into signals.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+from .message_protocol import (
+    NetworkMessage, MessageType, MessageProtocol, IntegrityPolicy, DEFAULT_INTEGRITY,
+    MessageCodec, JSON_CODEC, serialize_message, decode_message_body, validate_message,
+    negotiate_integrity, negotiate_codec
+)
+from .framing import FrameDecoder
+from .state_sync import StateSyncServer
+from .outbound import DEFAULT_OUTBOUND_POLICY, OutboundPolicy, OutboundQueue
+from . import DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT, MAX_PLAYERS, HEARTBEAT_INTERVAL
+
+
+class ServerState(Enum):
+    """Game server states."""
+    STOPPED = "stopped"
+    STARTING = "starting"
+    RUNNING = "running"
+    IN_GAME = "in_game"
+    STOPPING = "stopping"
+    ERROR = "error"
+
+
+@dataclass
+class ConnectedPlayer:
+    """Information about a connected player."""
+    player_id: int
+    transport: Any = None               # asyncio.Transport
+    name: str = "Unknown"
+    deck_name: str = ""
+    connected_at: float = field(default_factory=time.time)
+    last_heartbeat: float = field(default_factory=time.time)
+    authenticated: bool = False
+    ready: bool = False
+    seat: Optional[int] = None          # game player id whose hand this client sees
+    integrity: IntegrityPolicy = DEFAULT_INTEGRITY   # switched at JOIN_GAME
+    codec: MessageCodec = JSON_CODEC                 # for sending; switched at JOIN_GAME
+    outbox: Optional[OutboundQueue] = None           # frames waiting for the writer
+    writer: Any = None                  # asyncio.Task draining outbox
+    writable: Any = None                # asyncio.Event, cleared while the transport is paused
+
+
+# Events passed to listeners, with their arguments
+SERVER_EVENTS = (
+    "server_started",        # ()
+    "server_stopped",        # ()
+    "player_connected",      # (player_id, name)
+    "player_disconnected",   # (player_id, name)
+    "game_started",          # ()
+    "game_ended",            # ()
+    "error_occurred",        # (message,)
+    "state_changed",         # (ServerState,)
+)
+
+
+class AsyncGameServer:
+    """asyncio game server for MTG Commander multiplayer games."""
+
+    def __init__(self, host: str = None, port: int = None, max_players: int = MAX_PLAYERS,
+                 heartbeat_interval: float = HEARTBEAT_INTERVAL,
+                 integrity: IntegrityPolicy = DEFAULT_INTEGRITY, allow_unchecked: bool = False,
+                 codecs: Optional[List[str]] = None,
+                 outbound: OutboundPolicy = DEFAULT_OUTBOUND_POLICY):
+        # Server configuration
+        self.host = host or DEFAULT_SERVER_HOST
+        self.port = port or DEFAULT_SERVER_PORT
+        self.max_players = max_players
+        self.heartbeat_interval = heartbeat_interval
+        # Frame integrity; allow_unchecked lets trusted-LAN clients turn it off
+        self.integrity = integrity
+        self.allow_unchecked = allow_unchecked
+        # Wire codecs clients may pick at JOIN_GAME (None: every registered codec)
+        self.codecs = codecs
+        # Per-client outbound queue limits (backpressure)
+        self.outbound = outbound
+
+        # Server state
+        self.state = ServerState.STOPPED
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # Connected players
+        self.players: Dict[int, ConnectedPlayer] = {}
+        self.next_player_id = 1
+
+        # Game state management
+        self.game_controller = None
+        self.game_active = False
+        self.protocol = MessageProtocol(0)  # Server uses player_id 0
+        self.state_sync = StateSyncServer()  # versioned snapshots, per-client deltas
+        self._state_frames: Dict[tuple, bytes] = {}  # encoded updates for the current version, per seat
+
+        # Event listeners (see SERVER_EVENTS)
+        self.listeners: Dict[str, List[Callable]] = defaultdict(list)
+
+        # Message handlers
+        self.message_handlers = {
+            MessageType.JOIN_GAME: self._handle_join_game,
+            MessageType.DISCONNECT: self._handle_disconnect,
+            MessageType.HEARTBEAT: self._handle_heartbeat,
+            MessageType.PLAYER_ACTION: self._handle_player_action,
+            MessageType.PLAY_CARD: self._handle_play_card,
+            MessageType.CAST_SPELL: self._handle_cast_spell,
+            MessageType.PASS_PRIORITY: self._handle_pass_priority,
+            MessageType.ACKNOWLEDGMENT: self._handle_acknowledgment,
+            MessageType.RESYNC_REQUEST: self._handle_resync_request
+        }
+
+    # ---- Listeners ----
+    def add_listener(self, event: str, callback: Callable):
+        """Call callback(*args) whenever event (one of SERVER_EVENTS) happens."""
+        if event not in SERVER_EVENTS:
+            raise ValueError(f"Unknown server event: {event}")
+        self.listeners[event].append(callback)
+
+    def _emit(self, event: str, *args):
+        for callback in list(self.listeners.get(event, ())):
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"⚠️ Error in server listener for {event}: {e}")
+
+    # ---- Lifecycle (inside the loop) ----
+    async def start(self, host: str = None, port: int = None) -> bool:
+        """Start listening on the running event loop."""
+        if self.state != ServerState.STOPPED:
+            return False
+
+        self.host = host or self.host
+        self.port = self.port if port is None else port
+        self.loop = asyncio.get_running_loop()
+        self._set_state(ServerState.STARTING)
+
+        try:
+            self._server = await self.loop.create_server(
+                lambda: _ClientConnection(self), self.host, self.port,
+                backlog=self.max_players, reuse_address=True)
+        except Exception as e:
+            self._emit("error_occurred", f"Failed to start server: {e}")
+            self._set_state(ServerState.ERROR)
+            return False
+
+        # Port 0 asks the OS for a free port; report the real one
+        sockets = self._server.sockets or ()
+        if sockets:
+            self.port = sockets[0].getsockname()[1]
+
+        # Start heartbeat monitoring
+        self._heartbeat_task = self.loop.create_task(self._heartbeat_loop())
+
+        self._set_state(ServerState.RUNNING)
+        self._emit("server_started")
+        print(f"🎮 MTG Server started on {self.host}:{self.port}")
+        return True
+
+    async def stop(self):
+        """Disconnect everyone and stop listening."""
+        if self.state == ServerState.STOPPED:
+            return
+
+        self._set_state(ServerState.STOPPING)
+
+        # Stop accepting new connections
+        if self._server is not None:
+            self._server.close()
+
+        # Disconnect all players
+        writers = [p.writer for p in self.players.values() if p.writer is not None]
+        for player_id in list(self.players.keys()):
+            self._disconnect_player(player_id)
+        await asyncio.gather(*writers, return_exceptions=True)
+
+        # Stop heartbeat monitoring
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            await asyncio.gather(self._heartbeat_task, return_exceptions=True)
+            self._heartbeat_task = None
+
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+        self._set_state(ServerState.STOPPED)
+        self._emit("server_stopped")
+        print("🛑 MTG Server stopped")
+
+    # ---- Lifecycle (from other threads) ----
+    def start_in_thread(self, host: str = None, port: int = None, timeout: float = 5.0) -> bool:
+        """Run the server on its own event loop in a daemon thread; waits until it is listening."""
+        if self.state != ServerState.STOPPED:
+            return False
+        loop = asyncio.new_event_loop()
+        started: concurrent.futures.Future = concurrent.futures.Future()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            try:
+                ok = loop.run_until_complete(self.start(host, port))
+                started.set_result(ok)
+                if ok:
+                    loop.run_forever()
+            except Exception as e:
+                if not started.done():
+                    started.set_exception(e)
+            finally:
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name="mtg-server", daemon=True)
+        self._thread.start()
+        try:
+            return started.result(timeout)
+        except Exception as e:
+            self._emit("error_occurred", f"Failed to start server: {e}")
+            return False
+
+    def stop_in_thread(self, timeout: float = 5.0):
+        """Stop a server started with start_in_thread and end its loop."""
+        loop = self.loop
+        if loop is None or loop.is_closed() or self._thread is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self.stop(), loop).result(timeout)
+        except Exception as e:
+            print(f"⚠️ Server shutdown error: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def call_soon(self, callback: Callable, *args):
+        """Schedule callback(*args) on the server loop; safe from any thread."""
+        loop = self.loop
+        if loop is None or not loop.is_running() or self._on_loop_thread():
+            callback(*args)
+        else:
+            loop.call_soon_threadsafe(callback, *args)
+
+    def run_sync(self, callback: Callable, *args, timeout: float = 5.0):
+        """Run callback(*args) on the server loop and return its result; safe from any thread."""
+        loop = self.loop
+        if loop is None or not loop.is_running() or self._on_loop_thread():
+            return callback(*args)
+        result: concurrent.futures.Future = concurrent.futures.Future()
+
+        def invoke():
+            try:
+                result.set_result(callback(*args))
+            except Exception as e:
+                result.set_exception(e)
+
+        loop.call_soon_threadsafe(invoke)
+        return result.result(timeout)
+
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    # ---- Game control ----
+    def set_game_controller(self, controller):
+        """Set the game controller for managing game logic."""
+        self.game_controller = controller
+
+    def start_game(self) -> bool:
+        """Start a game with connected players."""
+        if self.state != ServerState.RUNNING or len(self.players) < 2:
+            return False
+
+        # Check if all players are ready
+        ready_players = [p for p in self.players.values() if p.ready]
+        if len(ready_players) != len(self.players):
+            return False
+
+        self.game_active = True
+        self._set_state(ServerState.IN_GAME)
+
+        # Seats follow join order unless the host assigned them
+        taken = {p.seat for p in self.players.values() if p.seat is not None}
+        free = (seat for seat in range(len(self.players)) if seat not in taken)
+        for player in self.players.values():
+            if player.seat is None:
+                self.assign_seat(player.player_id, next(free))
+
+        # Notify all players that game is starting
+        start_message = self.protocol.create_message(MessageType.GAME_START, {
+            "players": [{"id": p.player_id, "name": p.name, "seat": p.seat} for p in self.players.values()]
+        })
+        self._broadcast_message(start_message)
+
+        self._emit("game_started")
+        print(f"🎮 Game started with {len(self.players)} players")
+        return True
+
+    def assign_seat(self, player_id: int, seat: Optional[int]) -> bool:
+        """
+        Seat a client as game player seat; state updates then show it that
+        player's hand and no other (None: spectator, no hands).
+        """
+        player = self.players.get(player_id)
+        if player is None:
+            return False
+        if player.seat != seat:
+            player.seat = seat
+            self.state_sync.set_viewer(player_id, seat)
+            if player.authenticated:
+                self._send_state_update(player)
+        return True
+
+    def end_game(self):
+        """End the current game."""
+        if not self.game_active:
+            return
+
+        self.game_active = False
+        self._set_state(ServerState.RUNNING)
+
+        # Notify all players that game ended
+        end_message = self.protocol.create_message(MessageType.GAME_END, {})
+        self._broadcast_message(end_message)
+
+        # Reset player ready states
+        for player in self.players.values():
+            player.ready = False
+
+        self._emit("game_ended")
+        print("🏁 Game ended")
+
+    def publish_state(self, snapshot: Dict[str, Any]) -> Optional[int]:
+        """
+        Publish a game state snapshot (see network.state_sync); each joined
+        client is sent the delta from the version it holds. Returns the new
+        version, or None if nothing changed.
+        """
+        version = self.state_sync.publish(snapshot)
+        if version is not None:
+            self._state_frames.clear()
+            for player in list(self.players.values()):
+                if player.authenticated:
+                    self._send_state_update(player)
+        return version
+
+    def _send_state_update(self, player: ConnectedPlayer) -> bool:
+        """
+        Bring one client up to the current state version. The frame is built
+        when the client's writer gets to it, so updates queued for a slow
+        client coalesce into one delta.
+        """
+        return self._write(player, lambda: self._state_frame(player), "state")
+
+    def _state_frame(self, player: ConnectedPlayer) -> Optional[bytes]:
+        """Encoded update for player; clients in the same seat at the same base share the bytes."""
+        if player.player_id not in self.players:
+            return None
+        update = self.state_sync.update_for(player.player_id)
+        if update is None:
+            return None
+        key = (player.seat, update.get("base"), player.integrity, player.codec)
+        frame = self._state_frames.get(key)
+        if frame is None:
+            message = self.protocol.create_game_state_update_message(
+                update.get("state"), update["version"], update.get("delta"), update.get("base")
+            )
+            frame = self._state_frames[key] = serialize_message(message, player.integrity, player.codec)
+        return frame
+
+    # ---- Connections ----
+    def _accept(self, transport) -> Optional[ConnectedPlayer]:
+        """Register a new connection; None (after telling the client) if the server is full."""
+        address = transport.get_extra_info("peername")
+        if len(self.players) >= self.max_players or self.state not in (ServerState.RUNNING, ServerState.IN_GAME):
+            # Server full
+            error_msg = self.protocol.create_error_message("SERVER_FULL", "Server is full")
+            transport.write(serialize_message(error_msg))
+            transport.close()
+            return None
+
+        # Create new player
+        player_id = self.next_player_id
+        self.next_player_id += 1
+        player = ConnectedPlayer(player_id=player_id, transport=transport, integrity=self.integrity)
+        self._open_outbox(player)
+        self.players[player_id] = player
+        print(f"👤 Player {player_id} connected from {address}")
+        return player
+
+    def _handle_frame(self, player: ConnectedPlayer, body):
+        """Decode and handle one received frame body."""
+        try:
+            message = decode_message_body(body, player.integrity)
+            self._handle_client_message(player, message)
+        except Exception as e:
+            print(f"⚠️ Failed to process message from player {player.player_id}: {e}")
+
+    def _handle_client_message(self, player: ConnectedPlayer, message: NetworkMessage):
+        """Handle a message from a client."""
+        # Validate message
+        if not validate_message(message):
+            error_msg = self.protocol.create_error_message("INVALID_MESSAGE", "Invalid message format")
+            self._send_message_to_player(player.player_id, error_msg)
+            return
+
+        # Update last activity
+        player.last_heartbeat = time.time()
+
+        # Handle with specific handler
+        if message.type in self.message_handlers:
+            self.message_handlers[message.type](player, message)
+        else:
+            print(f"⚠️ Unhandled message type: {message.type}")
+
+    # ---- Message handlers ----
+    def _handle_join_game(self, player: ConnectedPlayer, message: NetworkMessage):
+        """Handle JOIN_GAME message."""
+        player_name = message.data.get("player_name", f"Player{player.player_id}")
+        deck_name = message.data.get("deck_name", "Unknown Deck")
+
+        player.name = player_name
+        player.deck_name = deck_name
+        player.authenticated = True
+        integrity = negotiate_integrity(message.data.get("integrity"), self.integrity, self.allow_unchecked)
+        codec = negotiate_codec(message.data.get("codecs"), self.codecs)
+
+        # Notify this player they joined successfully, and how frames are sent from now on
+        joined_msg = self.protocol.create_message(MessageType.PLAYER_JOINED, {
+            "player_id": player.player_id,
+            "player_name": player_name,
+            "success": True,
+            "integrity": integrity.mode.value,
+            "codec": codec.name
+        })
+        self._send_message_to_player(player.player_id, joined_msg)
+        player.integrity = integrity
+        player.codec = codec
+        self.state_sync.add_client(player.player_id, player.seat)
+
+        # Notify other players
+        notify_msg = self.protocol.create_message(MessageType.PLAYER_JOINED, {
+            "player_id": player.player_id,
+            "player_name": player_name
+        })
+        self._broadcast_message(notify_msg, exclude_player=player.player_id)
+
+        self._emit("player_connected", player.player_id, player_name)
+        print(f"✅ Player {player.player_id} ({player_name}) joined the game")
+
+        # Late joiners get the current state right away
+        self._send_state_update(player)
+
+    def _handle_disconnect(self, player: ConnectedPlayer, message: NetworkMessage):
+        """Handle DISCONNECT message."""
+        self._disconnect_player(player.player_id)
+
+    def _handle_heartbeat(self, player: ConnectedPlayer, message: NetworkMessage):
+        """Handle HEARTBEAT message."""
+        player.last_heartbeat = time.time()
+
+        # Send heartbeat response
+        response = self.protocol.create_heartbeat_message()
+        self._send_message_to_player(player.player_id, response, kind="heartbeat")
+
+    def _handle_player_action(self, player: ConnectedPlayer, message: NetworkMessage):
+        """Handle PLAYER_ACTION message."""
+        if not self.game_active or not self.game_controller:
+            return
+
+        action = message.data.get("action")
+        if not action:
+            return
+
+        # Forward to game controller and broadcast result
+        try:
+            # For now, just broadcast the action to other players
+            action_msg = self.protocol.create_message(MessageType.PLAYER_ACTION, {
+                "player_id": player.player_id,
+                "action": action,
+                **message.data
+            })
+            self._broadcast_message(action_msg, exclude_player=player.player_id)
+
+        except Exception as e:
+            error_msg = self.protocol.create_error_message("ACTION_FAILED", str(e))
+            self._send_message_to_player(player.player_id, error_msg)
+
+    def _handle_play_card(self, player: ConnectedPlayer, message: NetworkMessage):
+        """Handle PLAY_CARD message."""
+        if not self.game_active:
+            return
+
+        # Broadcast card play to other players
+        play_msg = self.protocol.create_message(MessageType.PLAY_CARD, {
+            "player_id": player.player_id,
+            **message.data
+        })
+        self._broadcast_message(play_msg, exclude_player=player.player_id)
+
+    def _handle_cast_spell(self, player: ConnectedPlayer, message: NetworkMessage):
+        """Handle CAST_SPELL message."""
+        if not self.game_active:
+            return
+
+        # Broadcast spell cast to other players
+        cast_msg = self.protocol.create_message(MessageType.CAST_SPELL, {
+            "player_id": player.player_id,
+            **message.data
+        })
+        self._broadcast_message(cast_msg, exclude_player=player.player_id)
+
+    def _handle_pass_priority(self, player: ConnectedPlayer, message: NetworkMessage):
+        """Handle PASS_PRIORITY message."""
+        if not self.game_active:
+            return
+
+        # Broadcast priority pass
+        priority_msg = self.protocol.create_message(MessageType.PASS_PRIORITY, {
+            "player_id": player.player_id
+        })
+        self._broadcast_message(priority_msg, exclude_player=player.player_id)
+
+    def _handle_acknowledgment(self, player: ConnectedPlayer, message: NetworkMessage):
+        """Handle ACKNOWLEDGMENT; state versions the client has applied."""
+        version = message.data.get("state_version")
+        if version is not None:
+            self.state_sync.acknowledge(player.player_id, version)
+
+    def _handle_resync_request(self, player: ConnectedPlayer, message: NetworkMessage):
+        """Handle RESYNC_REQUEST: the client lost track, send a full snapshot."""
+        self.state_sync.request_resync(player.player_id)
+        self._send_state_update(player)
+
+    # ---- Sending ----
+    def _disconnect_player(self, player_id: int):
+        """Disconnect a player from the server."""
+        player = self.players.pop(player_id, None)
+        if player is None:
+            return
+        self.state_sync.remove_client(player_id)
+        if player.outbox is not None:
+            player.outbox.close()
+        if player.writer is not None:
+            player.writer.cancel()
+
+        # Close the connection
+        if player.transport is not None:
+            try:
+                player.transport.close()
+            except Exception:
+                pass
+
+        # Notify other players
+        if player.authenticated:
+            disconnect_msg = self.protocol.create_message(MessageType.PLAYER_LEFT, {
+                "player_id": player_id,
+                "player_name": player.name
+            })
+            self._broadcast_message(disconnect_msg, exclude_player=player_id)
+
+            self._emit("player_disconnected", player_id, player.name)
+
+        print(f"👋 Player {player_id} ({player.name}) disconnected")
+
+        # End game if no players left
+        if self.game_active and len(self.players) == 0:
+            self.end_game()
+
+    def _send_message_to_player(self, player_id: int, message: NetworkMessage, kind: str = None) -> bool:
+        """Queue a message for a specific player (kind: see network.outbound)."""
+        player = self.players.get(player_id)
+        if player is None:
+            return False
+        return self._write(player, serialize_message(message, player.integrity, player.codec), kind)
+
+    def _write(self, player: ConnectedPlayer, frame, kind: str = None) -> bool:
+        """
+        Queue a frame (or a callable producing one) on the player's outbox;
+        never blocks. Clients that overflow it or stay backed up too long
+        are disconnected.
+        """
+        outbox = player.outbox
+        if outbox is None or outbox.closed:
+            return False
+        if outbox.put(frame, kind) and not outbox.too_slow():
+            return True
+        print(f"🐢 Player {player.player_id} is not keeping up ({len(outbox)} frames queued), disconnecting")
+        outbox.close()
+        self.loop.call_soon(self._disconnect_player, player.player_id)
+        return False
+
+    def _broadcast_message(self, message: NetworkMessage, exclude_player: int = None, kind: str = None):
+        """Broadcast a message to all joined players, encoding it once per wire format."""
+        frames: Dict[tuple, bytes] = {}
+        for player_id, player in list(self.players.items()):
+            if exclude_player and player_id == exclude_player:
+                continue
+            if not player.authenticated:
+                continue
+            key = (player.integrity, player.codec)
+            frame = frames.get(key)
+            if frame is None:
+                frame = frames[key] = serialize_message(message, player.integrity, player.codec)
+            self._write(player, frame, kind)
+
+    def _open_outbox(self, player: ConnectedPlayer):
+        """Give a new connection its outbound queue and writer task."""
+        wake = asyncio.Event()
+        player.writable = asyncio.Event()
+        player.writable.set()
+        player.outbox = OutboundQueue(self.outbound, on_ready=wake.set)
+        player.writer = asyncio.ensure_future(self._drain(player, wake))
+
+    async def _drain(self, player: ConnectedPlayer, wake: asyncio.Event):
+        """Writer for one client: moves frames from its outbox to the transport."""
+        outbox = player.outbox
+        transport = player.transport
+        while not outbox.closed:
+            try:
+                frame = outbox.pop()
+            except Exception as e:
+                print(f"⚠️ Failed to build message for player {player.player_id}: {e}")
+                continue
+            if frame is None:
+                wake.clear()
+                await wake.wait()
+                continue
+            # Transport buffer above its high-water mark: wait for the client to read
+            await player.writable.wait()
+            if transport.is_closing():
+                break
+            transport.write(frame)
+
+    # ---- Heartbeats ----
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            self._check_heartbeats()
+
+    def _check_heartbeats(self):
+        """Check for inactive players and disconnect them."""
+        current_time = time.time()
+        timeout = self.heartbeat_interval * 2  # 2x heartbeat interval
+
+        inactive_players = [player_id for player_id, player in self.players.items()
+                            if current_time - player.last_heartbeat > timeout]
+
+        for player_id in inactive_players:
+            print(f"⏰ Player {player_id} timed out")
+            self._disconnect_player(player_id)
+
+        # Clients whose outbound queue has stayed backed up too long
+        lagging_players = [player_id for player_id, player in self.players.items()
+                           if player.outbox is not None and player.outbox.too_slow()]
+
+        for player_id in lagging_players:
+            print(f"🐢 Player {player_id} is not keeping up, disconnecting")
+            self._disconnect_player(player_id)
+
+    # ---- Status ----
+    def _set_state(self, new_state: ServerState):
+        """Set server state and notify listeners."""
+        if self.state != new_state:
+            self.state = new_state
+            self._emit("state_changed", new_state)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if server is running."""
+        return self.state in [ServerState.RUNNING, ServerState.IN_GAME]
+
+    @property
+    def player_count(self) -> int:
+        """Get number of connected players."""
+        return len(self.players)
+
+    def get_status_info(self) -> Dict[str, Any]:
+        """Get server status information."""
+        return {
+            "state": self.state.value,
+            "running": self.is_running,
+            "address": f"{self.host}:{self.port}",
+            "player_count": self.player_count,
+            "max_players": self.max_players,
+            "game_active": self.game_active,
+            "players": [
+                {
+                    "id": p.player_id,
+                    "name": p.name,
+                    "deck": p.deck_name,
+                    "ready": p.ready,
+                    "connected_at": p.connected_at,
+                    "queued": len(p.outbox) if p.outbox is not None else 0
+                }
+                for p in self.players.values()
+            ]
+        }
+
+
+class _ClientConnection(asyncio.BufferedProtocol):
+    """One client socket: the loop receives straight into the FrameDecoder's buffer."""
+
+    def __init__(self, server: AsyncGameServer):
+        self.server = server
+        self.player: Optional[ConnectedPlayer] = None
+        self.decoder = FrameDecoder()
+
+    def connection_made(self, transport):
+        self.player = self.server._accept(transport)
+
+    def pause_writing(self):
+        if self.player is not None and self.player.writable is not None:
+            self.player.writable.clear()
+
+    def resume_writing(self):
+        if self.player is not None and self.player.writable is not None:
+            self.player.writable.set()
+
+    def get_buffer(self, sizehint: int):
+        return self.decoder.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int):
+        self.decoder.buffer_updated(nbytes)
+        player = self.player
+        if player is None:
+            return
+        try:
+            for body in self.decoder.frames():
+                self.server._handle_frame(player, body)
+                if player.player_id not in self.server.players:
+                    return
+        except ValueError as e:
+            # Oversized frame: the stream can't be resynchronised, drop the client
+            print(f"⚠️ Client {player.player_id} sent a bad frame: {e}")
+            self.server._disconnect_player(player.player_id)
+
+    def connection_lost(self, exc):
+        if self.player is not None:
+            # Client disconnected
+            self.server._disconnect_player(self.player.player_id)
@@ -0,0 +1,435 @@
+"""MTG Commander Game - Game State Synchronization
+
+Versioned, delta-compressed game state sync between the server and clients.
+
+The server reduces the engine's GameState to a plain, JSON-friendly snapshot
+(snapshot_game_state) and numbers every distinct snapshot with a strictly
+increasing version. Each client is sent only the changes since the version
+it already holds (diff_snapshots): zone moves, tapped flags, counters, life,
+turn and phase. Clients apply a delta in O(changes) (SyncedState.apply_delta)
+and acknowledge the version; a delta whose base they do not hold is a
+version gap, answered with RESYNC_REQUEST and a full snapshot.
+
+Snapshot layout (keys are strings so JSON and the binary codec agree):
+
+    {
+      "turn": 3, "phase": "PRECOMBAT_MAIN", "active_player": 0,
+      "players": {"0": {"name", "life", "poison", "library", "hand", "has_lost"}},
+      "zones":   {"0": {"hand": [card ids], "battlefield": [...], ...}},
+      "cards":   {card id: {"name", "owner", "controller", "tapped",
+                            "damage", "counters"}},
+    }
+
+Libraries are sent as card counts; their order is never revealed. Hands
+are private: each client gets view_for(snapshot, its seat), in which other
+players' hand lists are empty (their size is still in players[pid]["hand"])
+and the cards in them are left out of "cards". Versions are shared, but
+views and deltas are worked out per seat.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# Zones whose contents (and order) are synced; the library is only counted
+VISIBLE_ZONES = ("hand", "battlefield", "graveyard", "exile", "command")
+
+_SCALARS = ("turn", "phase", "active_player")
+
+
+# ---------------- Snapshots ----------------
+def snapshot_game_state(game) -> Dict[str, Any]:
+    """
+    Plain snapshot of an engine GameState. Card ids are expected to be
+    unique within a game; repeats get a "#n" suffix so the snapshot still
+    round-trips (deltas for them are just less compact).
+    """
+    players: Dict[str, Dict[str, Any]] = {}
+    zones: Dict[str, Dict[str, List[str]]] = {}
+    cards: Dict[str, Dict[str, Any]] = {}
+    for ps in game.players:
+        pid = str(ps.player_id)
+        players[pid] = {
+            "name": ps.name,
+            "life": ps.life,
+            "poison": getattr(ps, "poison_counters", 0),
+            "library": len(ps.library),
+            "hand": len(ps.hand),
+            "has_lost": ps.has_lost,
+        }
+        player_zones = zones[pid] = {}
+        for zone in VISIBLE_ZONES:
+            ids = player_zones[zone] = []
+            for item in getattr(ps, zone):
+                card_id = _unique_id(cards, str(item.card.id if zone == "battlefield" else item.id))
+                cards[card_id] = _card_entry(item, zone == "battlefield")
+                ids.append(card_id)
+    return {
+        "turn": game.turn,
+        "phase": game.phase,
+        "active_player": game.active_player,
+        "players": players,
+        "zones": zones,
+        "cards": cards,
+    }
+
+
+def view_for(snapshot: Dict[str, Any], viewer: Optional[str]) -> Dict[str, Any]:
+    """
+    The snapshot as the player in seat viewer (a player id string; None for
+    a spectator) may see it: every other hand is emptied and its cards are
+    dropped. Shares unchanged parts with snapshot, so neither may be mutated.
+    """
+    hidden: List[str] = []
+    zones = {}
+    for pid, player_zones in snapshot["zones"].items():
+        hand = player_zones.get("hand")
+        if pid == viewer or not hand:
+            zones[pid] = player_zones
+        else:
+            hidden.extend(hand)
+            zones[pid] = dict(player_zones, hand=[])
+    if not hidden:
+        return snapshot
+    cards = dict(snapshot["cards"])
+    for card_id in hidden:
+        cards.pop(card_id, None)
+    return dict(snapshot, zones=zones, cards=cards)
+
+
+def _seat(viewer) -> Optional[str]:
+    return None if viewer is None else str(viewer)
+
+
+def _unique_id(cards: Dict[str, Any], card_id: str) -> str:
+    if card_id not in cards:
+        return card_id
+    n = 2
+    while f"{card_id}#{n}" in cards:
+        n += 1
+    return f"{card_id}#{n}"
+
+
+def _card_entry(item, on_battlefield: bool) -> Dict[str, Any]:
+    """Synced fields of a card, or of a Permanent on the battlefield."""
+    if not on_battlefield:
+        return {"name": item.name, "owner": item.owner_id, "controller": item.controller_id,
+                "tapped": False, "damage": 0, "counters": {}}
+    card = item.card
+    controller = item.controller_id if item.controller_id is not None else card.controller_id
+    return {"name": card.name, "owner": card.owner_id, "controller": controller,
+            "tapped": item.tapped, "damage": item.damage_marked, "counters": _counters(item)}
+
+
+def _counters(perm) -> Dict[str, int]:
+    counters = dict(getattr(perm, "counters", None) or {})
+    if perm.loyalty:
+        counters["loyalty"] = perm.loyalty
+    layers = getattr(perm.card, "_layers_engine", None)
+    if layers is not None:
+        try:
+            state = layers.get_characteristic_state(perm.card)
+        except Exception:
+            state = None
+        if state is not None:
+            if state.plus_one_counters:
+                counters["+1/+1"] = state.plus_one_counters
+            if state.minus_one_counters:
+                counters["-1/-1"] = state.minus_one_counters
+    return counters
+
+
+def _locations(snapshot: Dict[str, Any]) -> Dict[str, Tuple[str, str]]:
+    """card id -> (player id, zone) for every visible card."""
+    where = {}
+    for pid, player_zones in snapshot["zones"].items():
+        for zone, ids in player_zones.items():
+            for card_id in ids:
+                where[card_id] = (pid, zone)
+    return where
+
+
+# ---------------- Deltas ----------------
+def diff_snapshots(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Changes that turn snapshot old into new; empty when they are equal.
+
+        turn / phase / active_player   present when changed
+        "players": {pid: {field: value}}   changed fields; None drops a player
+        "cards":   {id: {field: value}}    changed fields, every field for new cards
+        "removed": [id]                    cards no longer visible (e.g. shuffled away)
+        "moves":   [[id, pid, zone, index]]  cards that changed zone, by index per zone
+        "zones":   {pid: {zone: [ids]}}    whole zone order, when moves cannot express it
+
+    Cost is O(board) on the server; what is sent, and applied on the
+    client, is O(changes).
+    """
+    delta: Dict[str, Any] = {}
+    for key in _SCALARS:
+        if old.get(key) != new[key]:
+            delta[key] = new[key]
+
+    players = _diff_fields(old["players"], new["players"])
+    for pid in old["players"].keys() - new["players"].keys():
+        players[pid] = None
+    if players:
+        delta["players"] = players
+
+    cards = _diff_fields(old["cards"], new["cards"])
+    if cards:
+        delta["cards"] = cards
+    removed = [card_id for card_id in old["cards"] if card_id not in new["cards"]]
+    if removed:
+        delta["removed"] = removed
+
+    old_where = _locations(old)
+    new_where = None
+    moves: List[list] = []
+    orders: Dict[str, Dict[str, List[str]]] = {}
+    for pid, player_zones in new["zones"].items():
+        old_zones = old["zones"].get(pid, {})
+        for zone, ids in player_zones.items():
+            old_ids = old_zones.get(zone, [])
+            if ids == old_ids:
+                continue
+            if new_where is None:
+                new_where = _locations(new)
+            here = (pid, zone)
+            # What the client gets from removals and in-order inserts alone
+            result = [card_id for card_id in old_ids if new_where.get(card_id) == here]
+            inserts = [(i, card_id) for i, card_id in enumerate(ids) if old_where.get(card_id) != here]
+            for i, card_id in inserts:
+                result.insert(i, card_id)
+            if result == ids:
+                moves.extend([card_id, pid, zone, i] for i, card_id in inserts)
+            else:
+                orders.setdefault(pid, {})[zone] = ids
+    if moves:
+        delta["moves"] = moves
+    if orders:
+        delta["zones"] = orders
+    return delta
+
+
+def _diff_fields(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    changes = {}
+    for key, entry in new.items():
+        before = old.get(key)
+        if before is None:
+            changes[key] = entry
+        elif before != entry:
+            changes[key] = {field: value for field, value in entry.items() if before.get(field) != value}
+    return changes
+
+
+class SyncedState:
+    """A client's copy of the server snapshot, patched in place by deltas."""
+
+    def __init__(self, snapshot: Dict[str, Any], version: int):
+        self.snapshot = snapshot
+        self.version = version
+        self._where = _locations(snapshot)
+
+    def apply_delta(self, delta: Dict[str, Any], version: int):
+        """Apply the changes from diff_snapshots and move to version."""
+        snapshot = self.snapshot
+        for key in _SCALARS:
+            if key in delta:
+                snapshot[key] = delta[key]
+
+        for pid, fields in delta.get("players", {}).items():
+            if fields is None:
+                snapshot["players"].pop(pid, None)
+                snapshot["zones"].pop(pid, None)
+            elif pid in snapshot["players"]:
+                snapshot["players"][pid].update(fields)
+            else:
+                snapshot["players"][pid] = dict(fields)
+                snapshot["zones"].setdefault(pid, {zone: [] for zone in VISIBLE_ZONES})
+
+        cards = snapshot["cards"]
+        for card_id, fields in delta.get("cards", {}).items():
+            if card_id in cards:
+                cards[card_id].update(fields)
+            else:
+                cards[card_id] = dict(fields)
+
+        # Take every leaving or moving card out first, then insert in order
+        for card_id in delta.get("removed", ()):
+            self._take(card_id)
+            cards.pop(card_id, None)
+        moves = delta.get("moves", ())
+        for card_id, _, _, _ in moves:
+            self._take(card_id)
+        orders = delta.get("zones", {})
+        for pid, player_zones in orders.items():
+            for zone, ids in player_zones.items():
+                here = (pid, zone)
+                for card_id in ids:
+                    if self._where.get(card_id) != here:
+                        self._take(card_id)
+        for card_id, pid, zone, index in moves:
+            self._zone(pid, zone).insert(index, card_id)
+            self._where[card_id] = (pid, zone)
+        for pid, player_zones in orders.items():
+            for zone, ids in player_zones.items():
+                here = (pid, zone)
+                for card_id in ids:
+                    self._where[card_id] = here
+                self._zone(pid, zone)[:] = ids
+        self.version = version
+
+    def _zone(self, pid: str, zone: str) -> List[str]:
+        return self.snapshot["zones"].setdefault(pid, {}).setdefault(zone, [])
+
+    def _take(self, card_id: str):
+        location = self._where.pop(card_id, None)
+        if location is not None:
+            ids = self._zone(*location)
+            if card_id in ids:
+                ids.remove(card_id)
+
+
+# ---------------- Versioning ----------------
+class StateSyncServer:
+    """
+    Server side of the sync: versions published snapshots and works out
+    what each client needs, as seen from the seat it plays (see view_for).
+
+    Deltas chain from the last version sent on a connection (TCP delivers
+    them in order); the last acknowledged version shows how far behind a
+    client is. Clients that have been sent nothing yet, asked for a resync
+    or whose base snapshot is gone get the full snapshot.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._snapshots: Dict[int, Dict[str, Any]] = {}
+        self._sent: Dict[int, Optional[int]] = {}
+        self._acked: Dict[int, Optional[int]] = {}
+        self._viewers: Dict[int, Optional[str]] = {}
+        self._views: Dict[Tuple[int, Optional[str]], Dict[str, Any]] = {}
+        self._deltas: Dict[Tuple[Optional[str], int], Dict[str, Any]] = {}   # (seat, base) -> delta to self.version
+
+    @property
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """The latest published snapshot."""
+        return self._snapshots.get(self.version)
+
+    def publish(self, snapshot: Dict[str, Any]) -> Optional[int]:
+        """
+        Record a new snapshot (which must not be mutated afterwards). Returns
+        its version, or None when nothing changed since the last one.
+        """
+        if snapshot == self.snapshot:
+            return None
+        self.version += 1
+        self._snapshots[self.version] = snapshot
+        self._deltas.clear()
+        self._trim()
+        return self.version
+
+    def add_client(self, client_id: int, viewer=None):
+        """Track a client playing seat viewer (None: a spectator, who sees no hands)."""
+        self._sent[client_id] = None
+        self._acked[client_id] = None
+        self._viewers[client_id] = _seat(viewer)
+
+    def remove_client(self, client_id: int):
+        self._sent.pop(client_id, None)
+        self._acked.pop(client_id, None)
+        self._viewers.pop(client_id, None)
+        self._trim()
+
+    def set_viewer(self, client_id: int, viewer):
+        """Move a client to another seat; its next update is a full snapshot."""
+        if client_id in self._sent and self._viewers[client_id] != _seat(viewer):
+            self._viewers[client_id] = _seat(viewer)
+            self.request_resync(client_id)
+
+    def view(self, version: int, viewer) -> Optional[Dict[str, Any]]:
+        """Snapshot version as seen from seat viewer, or None if it is gone."""
+        snapshot = self._snapshots.get(version)
+        if snapshot is None:
+            return None
+        key = (version, _seat(viewer))
+        seen = self._views.get(key)
+        if seen is None:
+            seen = self._views[key] = view_for(snapshot, key[1])
+        return seen
+
+    def acknowledge(self, client_id: int, version: int):
+        """Record that a client has applied version."""
+        if client_id in self._acked and isinstance(version, int) and version <= self.version:
+            if self._acked[client_id] is None or version > self._acked[client_id]:
+                self._acked[client_id] = version
+
+    def request_resync(self, client_id: int):
+        """The client lost track; its next update is a full snapshot."""
+        if client_id in self._sent:
+            self._sent[client_id] = None
+            self._trim()
+
+    def lag(self, client_id: int) -> int:
+        """Versions sent to a client that it has not acknowledged yet."""
+        sent = self._sent.get(client_id)
+        if sent is None:
+            return 0
+        return sent - (self._acked.get(client_id) or 0)
+
+    def update_for(self, client_id: int) -> Optional[Dict[str, Any]]:
+        """
+        GAME_STATE_UPDATE data that brings a client to the current version
+        ({"version", "state"} or {"version", "base", "delta"}), or None if
+        it is already there. Marks the version as sent.
+        """
+        if client_id not in self._sent or not self.version:
+            return None
+        sent = self._sent[client_id]
+        if sent == self.version:
+            return None
+        self._sent[client_id] = self.version
+        viewer = self._viewers[client_id]
+        current = self.view(self.version, viewer)
+        base = self.view(sent, viewer) if sent is not None else None
+        if base is None:
+            update = {"version": self.version, "state": current}
+        else:
+            delta = self._deltas.get((viewer, sent))
+            if delta is None:
+                delta = self._deltas[(viewer, sent)] = diff_snapshots(base, current)
+            update = {"version": self.version, "base": sent, "delta": delta}
+        self._trim()
+        return update
+
+    def _trim(self):
+        # Keep the snapshots that some client's next delta will start from
+        keep = {version for version in self._sent.values() if version is not None}
+        keep.add(self.version)
+        for version in [v for v in self._snapshots if v not in keep]:
+            del self._snapshots[version]
+        for key in [k for k in self._views if k[0] not in keep]:
+            del self._views[key]
+
+
+class StateSyncClient:
+    """Client side of the sync: applies updates in version order."""
+
+    def __init__(self):
+        self.state: Optional[SyncedState] = None
+
+    @property
+    def version(self) -> Optional[int]:
+        return self.state.version if self.state is not None else None
+
+    def apply_update(self, update: Dict[str, Any]) -> bool:
+        """
+        Apply GAME_STATE_UPDATE data. Returns False on a version gap (a delta
+        whose base we do not hold); the caller should send RESYNC_REQUEST.
+        """
+        version = update.get("version")
+        if "state" in update:
+            self.state = SyncedState(update["state"], version)
+            return True
+        if self.state is None or update.get("base") != self.state.version:
+            return False
+        self.state.apply_delta(update["delta"], version)
+        return True
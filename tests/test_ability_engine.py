@@ -526,6 +526,78 @@ class TestAbilityIntegration(unittest.TestCase):
         self.assertEqual(self.player1.life, initial_life)
 
 
+class TestTriggerDispatch(unittest.TestCase):
+    """Test indexed trigger dispatch"""
+    
+    def setUp(self):
+        self.player1 = PlayerState(player_id=0, name="Player 1")
+        self.player2 = PlayerState(player_id=1, name="Player 2")
+        self.game = GameState(players=[self.player1, self.player2])
+        self.ability_engine = AbilityEngine(self.game)
+        set_ability_engine(self.ability_engine)
+    
+    def _register(self, card, trigger="ETB"):
+        ability = TriggeredAbility(kind='triggered', raw_text=card.text, trigger=trigger,
+                                   effect_text="draw a card")
+        self.ability_engine._register_trigger_listener(
+            AbilityInstance(source_card=card, ability_def=ability, controller=0))
+    
+    def _creature(self, cid):
+        return Card(id=cid, name=cid, types=["Creature"], mana_cost=1, power=1, toughness=1,
+                    controller_id=0, text=f"When {cid} enters the battlefield, draw a card.")
+    
+    def test_listeners_dormant_off_battlefield(self):
+        """Listeners are parked until their card is on the battlefield"""
+        card = self._creature("elf")
+        self._register(card)
+        by_key = self.ability_engine.trigger_listeners[TriggerCondition.ENTERS_BATTLEFIELD]
+        self.assertNotIn(('card', 'elf'), by_key)
+        
+        perm = Permanent(card=card)
+        self.player1.battlefield.append(perm)
+        self.assertEqual(len(by_key[('card', 'elf')]), 1)
+        
+        self.player1.battlefield.remove(perm)
+        self.player1.graveyard.append(card)
+        self.assertNotIn(('card', 'elf'), by_key)
+        emit_game_event(TriggerCondition.ENTERS_BATTLEFIELD, affected=card, controller=0)
+        self.assertEqual(len(self.ability_engine.triggered_queue), 0)
+    
+    def test_emit_only_calls_matching_listeners(self):
+        """An ETB only reaches listeners keyed to the entering card"""
+        cards = [self._creature(f"elf{i}") for i in range(20)]
+        for card in cards:
+            self._register(card)
+            self.player1.battlefield.append(Permanent(card=card))
+        
+        calls = []
+        original = self.ability_engine._should_trigger
+        self.ability_engine._should_trigger = lambda inst, evt: calls.append(inst) or original(inst, evt)
+        emit_game_event(TriggerCondition.ENTERS_BATTLEFIELD, affected=cards[3], controller=0)
+        
+        self.assertEqual([inst.source_card for inst in calls], [cards[3]])
+        self.assertEqual(len(self.ability_engine.triggered_queue), 1)
+    
+    def test_upkeep_keyed_by_controller(self):
+        """Upkeep triggers only see their controller's upkeep"""
+        card = self._creature("upkeeper")
+        self._register(card, trigger="UPKEEP")
+        self.player1.battlefield.append(Permanent(card=card))
+        
+        emit_game_event(TriggerCondition.BEGINNING_OF_UPKEEP, controller=1)
+        self.assertEqual(len(self.ability_engine.triggered_queue), 0)
+        emit_game_event(TriggerCondition.BEGINNING_OF_UPKEEP, controller=0)
+        self.assertEqual(len(self.ability_engine.triggered_queue), 1)
+    
+    def test_unregister_card(self):
+        card = self._creature("gone")
+        self._register(card)
+        self.player1.battlefield.append(Permanent(card=card))
+        self.ability_engine.unregister_card(card)
+        emit_game_event(TriggerCondition.ENTERS_BATTLEFIELD, affected=card, controller=0)
+        self.assertEqual(len(self.ability_engine.triggered_queue), 0)
+
+
 if __name__ == '__main__':
     # Create test suite
     loader = unittest.TestLoader()
@@ -536,6 +608,7 @@ if __name__ == '__main__':
     suite.addTests(loader.loadTestsFromTestCase(TestTriggeredAbilities))
     suite.addTests(loader.loadTestsFromTestCase(TestActivatedAbilities))
     suite.addTests(loader.loadTestsFromTestCase(TestAbilityIntegration))
+    suite.addTests(loader.loadTestsFromTestCase(TestTriggerDispatch))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
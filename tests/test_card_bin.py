@@ -0,0 +1,124 @@
+"""
+Test suite for the compiled binary card database.
+"""
+
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import card_bin, card_db
+
+
+CARDS = [
+    {"id": "c1", "name": "Sol Ring", "types": ["Artifact"], "mana_cost": 1},
+    {"id": "c2", "name": "Lightning Bolt", "types": ["Instant"], "mana_cost": 1},
+    {"id": "c3", "name": "Jötun Grunt", "types": ["Creature"], "mana_cost": 2},
+    {"id": "c4", "name": "Llanowar Elves", "types": ["Creature"], "mana_cost": 1},
+    {"name": "Missing Id"},
+]
+
+
+class TestCardBin(unittest.TestCase):
+    """Test compiling and reading the binary card database"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.tmp, 'card_db.json')
+        self.bin_path = os.path.join(self.tmp, 'card_db.bin')
+        with open(self.json_path, 'w', encoding='utf-8') as f:
+            json.dump(CARDS, f)
+        self.count = card_bin.compile_card_db(self.json_path, self.bin_path)
+        self.db = card_bin.CardBinDB(self.bin_path)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_skips_invalid_records(self):
+        self.assertEqual(self.count, 4)
+        self.assertEqual(len(self.db.by_id), 4)
+
+    def test_lookups_match_json_loader(self):
+        by_id, by_name_lower, by_norm, path = self.db.as_tuple()
+        self.assertEqual(path, self.bin_path)
+        self.assertEqual(by_id['c1']['name'], "Sol Ring")
+        self.assertEqual(by_name_lower['lightning bolt']['id'], "c2")
+        self.assertEqual(by_norm['j tun grunt']['id'], "c3")
+        self.assertIn('sol ring', by_name_lower)
+        self.assertNotIn('black lotus', by_name_lower)
+        self.assertIsNone(by_name_lower.get('black lotus'))
+        with self.assertRaises(KeyError):
+            by_id['missing']
+
+    def test_records_are_lazy_and_memoized(self):
+        self.assertEqual(self.db._cache, {})
+        first = self.db.by_id['c1']
+        self.assertEqual(len(self.db._cache), 1)
+        self.assertIs(self.db.by_name_lower['sol ring'], first)
+
+    def test_iteration_and_prefix(self):
+        self.assertEqual(list(self.db.by_name_lower),
+                         sorted(c['name'].lower() for c in CARDS if 'id' in c))
+        names = [k for k, _ in self.db.by_name_lower.prefix_items('l')]
+        self.assertEqual(names, ['lightning bolt', 'llanowar elves'])
+        self.assertEqual(self.db.names(), sorted(c['name'] for c in CARDS if 'id' in c))
+
+    def test_rejects_foreign_file(self):
+        bad = os.path.join(self.tmp, 'bad.bin')
+        with open(bad, 'wb') as f:
+            f.write(b'\0' * 64)
+        with self.assertRaises(ValueError):
+            card_bin.CardBinDB(bad)
+
+
+class TestLoadCardDbPrefersBin(unittest.TestCase):
+    """load_card_db should serve the compiled file when it is current"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cwd = os.getcwd()
+        os.makedirs(os.path.join(self.tmp, 'data', 'cards'))
+        os.chdir(self.tmp)
+        with open(os.path.join('data', 'cards', 'card_db.json'), 'w', encoding='utf-8') as f:
+            json.dump(CARDS, f)
+
+    def tearDown(self):
+        if card_db._BIN_DB is not None:
+            card_db._BIN_DB.close()
+            card_db._BIN_DB = None
+        card_db._CARD_DB_CACHE = None
+        card_db._CARD_NAME_LIST = None
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_json_then_bin(self):
+        by_id, _, _, path = card_db.load_card_db(force=True)
+        self.assertIsInstance(by_id, dict)
+        card_bin.compile_card_db(os.path.join('data', 'cards', 'card_db.json'), card_bin.DEFAULT_BIN_PATH)
+        by_id, by_name_lower, _, path = card_db.load_card_db(force=True)
+        self.assertEqual(path, card_bin.DEFAULT_BIN_PATH)
+        self.assertEqual(by_name_lower['sol ring']['id'], 'c1')
+        self.assertIn('Llanowar Elves', card_db.get_card_name_list())
+
+    def test_forced_reload_keeps_old_views_readable(self):
+        card_bin.compile_card_db(os.path.join('data', 'cards', 'card_db.json'), card_bin.DEFAULT_BIN_PATH)
+        _, old_by_name, _, _ = card_db.load_card_db(force=True)
+        card_db.load_card_db(force=True)
+        self.assertEqual(old_by_name['sol ring']['id'], 'c1')
+
+    def test_truncated_bin_falls_back_to_json(self):
+        with open(card_bin.DEFAULT_BIN_PATH, 'wb') as f:
+            f.write(card_bin.MAGIC[:4])
+        by_id, _, _, path = card_db.load_card_db(force=True)
+        self.assertNotEqual(path, card_bin.DEFAULT_BIN_PATH)
+        self.assertEqual(by_id['c1']['name'], "Sol Ring")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Test suite for shared, interned card definitions.
+"""
+
+import copy
+import importlib.util
+import pickle
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.card_engine import Card, CardDefinition
+from engine.card_validation import validate_card_data
+from engine.game_state import GameState, PlayerState
+from engine.layers import LayersEngine, create_static_buff_effect
+
+
+def _forest(cid, owner=0):
+    return Card(id=cid, name="Forest", types=["Basic", "Land"], mana_cost=0,
+                text="{T}: Add {G}.", color_identity=["G"], owner_id=owner, controller_id=owner)
+
+
+class TestCardDefinition(unittest.TestCase):
+    """Test flyweight CardDefinition sharing behind Card"""
+
+    def test_duplicates_share_one_definition(self):
+        a, b = _forest("f1"), _forest("f2", owner=1)
+        self.assertIs(a.definition, b.definition)
+        self.assertEqual(a.types, ("Basic", "Land"))
+        self.assertEqual(a.color_identity, ("G",))
+        self.assertTrue(a.is_type("Land"))
+        self.assertFalse(hasattr(a.definition, '__dict__'))
+        with self.assertRaises(AttributeError):
+            a.definition.name = "Island"
+
+    def test_assignment_only_changes_that_card(self):
+        a, b = _forest("f1"), _forest("f2")
+        a.types = list(a.types) + ["Snow"]
+        a.power = 3
+        self.assertEqual(a.types, ("Basic", "Land", "Snow"))
+        self.assertEqual(b.types, ("Basic", "Land"))
+        self.assertIsNone(b.power)
+        self.assertIsNot(a.definition, b.definition)
+        a.types, a.power = ("Basic", "Land"), None
+        self.assertIs(a.definition, b.definition)
+
+    def test_equality_copy_and_pickle(self):
+        a = _forest("f1")
+        self.assertEqual(a, _forest("f1"))
+        self.assertNotEqual(a, _forest("f1", owner=1))
+        a.oracle_abilities = ["ability"]
+        clone = copy.copy(a)
+        self.assertIs(clone.definition, a.definition)
+        self.assertEqual(clone.oracle_abilities, ["ability"])
+        restored = pickle.loads(pickle.dumps(a))
+        self.assertIs(restored.definition, a.definition)
+        self.assertEqual(restored, a)
+        self.assertIs(copy.deepcopy(a).definition, a.definition)
+
+    def test_from_definition_and_layers(self):
+        definition = CardDefinition.intern("Grizzly Bears", ["Creature"], 2, 2, 2)
+        bear = Card.from_definition(definition, "bear", owner_id=0, controller_id=0)
+        self.assertEqual((bear.name, bear.power), ("Grizzly Bears", 2))
+        layers = LayersEngine()
+        bear.set_layers_engine(layers)
+        layers.add_effect(create_static_buff_effect("anthem", 1, 1))
+        self.assertEqual(bear.get_current_power_toughness(), (3, 3))
+        bear.power = 4
+        self.assertEqual(bear.get_current_power_toughness(), (5, 3))
+
+
+class TestTupleCharacteristics(unittest.TestCase):
+    """Test that consumers accept a card's tuple types and colors"""
+
+    def test_validation_accepts_card_values(self):
+        forest = _forest("f1")
+        result = validate_card_data({'name': forest.name, 'types': forest.types,
+                                     'mana_cost': forest.mana_cost, 'text': forest.text,
+                                     'color_identity': forest.color_identity})
+        self.assertTrue(result.is_valid, result.errors)
+
+    @unittest.skipUnless(importlib.util.find_spec("PySide6"), "PySide6 not installed")
+    def test_can_play_land_from_hand(self):
+        from ui.game_app_api import GameAppAPI
+        forest = _forest("f1")
+        player = PlayerState(player_id=0, name="Player 1")
+        player.hand.append(forest)
+        game = GameState(players=[player, PlayerState(player_id=1, name="Player 2")])
+        game.active_player = 0
+        api = GameAppAPI(None, game, [1], None, None)
+        self.assertEqual(api.can_play_card(forest), (True, 'Can play land'))
+
+
+if __name__ == '__main__':
+    unittest.main()
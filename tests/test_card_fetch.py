@@ -0,0 +1,76 @@
+"""
+Test suite for batched deck resolution in card_fetch.
+"""
+
+import unittest
+import io
+import os
+import sys
+import contextlib
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import card_fetch
+from engine.card_sql import normalize
+
+
+CARDS = [
+    {"id": "forest", "name": "Forest", "types": ["Land"], "mana_cost": 0, "text": "{T}: Add {G}."},
+    {"id": "elves", "name": "Llanowar Elves", "types": ["Creature"], "mana_cost": 1,
+     "mana_cost_str": "{G}", "power": 1, "toughness": 1, "text": "{T}: Add {G}."},
+    {"id": "lotus", "name": "Lotus Cobra", "types": ["Creature"], "mana_cost": 2,
+     "mana_cost_str": "{1}{G}", "power": 2, "toughness": 1, "text": ""},
+    {"id": "marwyn", "name": "Marwyn, the Nurturer", "types": ["Legendary", "Creature"], "mana_cost": 3,
+     "mana_cost_str": "{2}{G}", "power": 1, "toughness": 1, "text": ""},
+]
+
+
+def _local_db():
+    by_id = {c['id']: c for c in CARDS}
+    by_name_lower = {c['name'].lower(): c for c in CARDS}
+    by_norm = {normalize(c["name"]): c for c in CARDS}
+    return by_id, by_name_lower, by_norm, 'test'
+
+
+class TestBulkDeckResolution(unittest.TestCase):
+    """Test the dedupe / prototype deck building pipeline"""
+
+    def _build(self, entries, commander):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return card_fetch._build_card_objects(entries, commander, _local_db(), owner_id=0)
+
+    def test_duplicates_are_independent_clones(self):
+        library, commander = self._build(["Forest"] * 10 + ["Llanowar Elves"], "Marwyn, the Nurturer")
+        forests = [c for c in library if c.name == "Forest"]
+        self.assertEqual(len(forests), 10)
+        self.assertEqual(len({id(c) for c in forests}), 10)
+        forests[0].types = forests[0].types + ("Snow",)
+        self.assertNotIn("Snow", forests[1].types)
+        self.assertEqual(commander.name, "Marwyn, the Nurturer")
+
+    def test_one_enhancement_engine_per_deck(self):
+        library, commander = self._build(["Forest", "Forest", "Llanowar Elves"], "Marwyn, the Nurturer")
+        engines = {id(c._layers_engine) for c in library + [commander]}
+        self.assertEqual(len(engines), 1)
+
+    def test_commander_excluded_and_unknown_skipped(self):
+        library, commander = self._build(["Marwyn, the Nurturer", "Black Lotus", "Forest"],
+                                         "Marwyn, the Nurturer")
+        self.assertEqual([c.name for c in library], ["Forest"])
+
+    def test_unique_prefix_lookup(self):
+        by_name_lower = _local_db()[1]
+        self.assertEqual(card_fetch._unique_prefix_match("llan", by_name_lower)['id'], "elves")
+        self.assertIsNone(card_fetch._unique_prefix_match("l", by_name_lower))   # ambiguous
+        self.assertIsNone(card_fetch._unique_prefix_match("zz", by_name_lower))
+        library, _ = self._build(["Lotus"], None)
+        self.assertEqual(library[0].name, "Lotus Cobra")
+
+    def test_resolves_each_name_once(self):
+        resolved = card_fetch._resolve_many(["Forest"] * 30 + ["Llanowar Elves"] * 2, _local_db())
+        self.assertEqual(set(resolved), {"Forest", "Llanowar Elves"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Test suite for the pooled SQLite card backend.
+"""
+
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import card_sql
+
+
+CARDS = [
+    {"id": "c1", "name": "Sol Ring", "types": ["Artifact"]},
+    {"id": "c2", "name": "Lightning Bolt", "types": ["Instant"]},
+    {"id": "c3", "name": "Llanowar Elves", "types": ["Creature"]},
+    {"id": "c4", "name": "Jötun Grunt", "types": ["Creature"]},
+]
+
+
+class TestCardSqlPool(unittest.TestCase):
+    """Test pooled read connections and batch lookups"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.orig_path = card_sql._DB_PATH
+        card_sql._DB_PATH = os.path.join(self.tmp, 'cards.db')
+        json_path = os.path.join(self.tmp, 'card_db.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(CARDS, f)
+        card_sql.load_json_into_sql(json_path)
+
+    def tearDown(self):
+        card_sql.close_pool()
+        card_sql._DB_PATH = self.orig_path
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_single_lookups(self):
+        self.assertEqual(card_sql.fetch_by_id('c1')['name'], 'Sol Ring')
+        self.assertEqual(card_sql.fetch_by_exact('LIGHTNING BOLT')['id'], 'c2')
+        self.assertEqual(card_sql.fetch_by_norm_or_prefix('llanowar')['id'], 'c3')
+        self.assertIsNone(card_sql.fetch_by_exact('Black Lotus'))
+
+    def test_connection_reused_per_thread(self):
+        first = card_sql._read_conn()
+        card_sql.fetch_by_id('c1')
+        self.assertIs(card_sql._read_conn(), first)
+        other = []
+        t = threading.Thread(target=lambda: other.append(card_sql._read_conn()))
+        t.start()
+        t.join()
+        self.assertIsNot(other[0], first)
+
+    def test_read_connection_is_read_only(self):
+        with self.assertRaises(Exception):
+            card_sql._read_conn().execute("DELETE FROM cards")
+
+    def test_fetch_many_by_name(self):
+        names = ['Sol Ring', 'sol ring', 'Lightning  Bolt', 'Jötun Grunt', 'Llanowar', 'Black Lotus']
+        found = card_sql.fetch_many_by_name(names)
+        self.assertEqual(found['Sol Ring']['id'], 'c1')
+        self.assertEqual(found['sol ring']['id'], 'c1')
+        self.assertEqual(found['Lightning  Bolt']['id'], 'c2')   # normalized match
+        self.assertEqual(found['Jötun Grunt']['id'], 'c4')
+        self.assertEqual(found['Llanowar']['id'], 'c3')          # unique-prefix fallback
+        self.assertNotIn('Black Lotus', found)
+
+    def test_fetch_many_chunks_large_batches(self):
+        names = ['Sol Ring'] + [f'Unknown {i}' for i in range(card_sql._BATCH * 2)]
+        self.assertEqual(list(card_sql.fetch_many_by_name(names)), ['Sol Ring'])
+        self.assertEqual(set(card_sql.fetch_many_by_id(['c1', 'c3', 'zz'])), {'c1', 'c3'})
+
+    def test_upsert_visible_to_pooled_reader(self):
+        card_sql.fetch_by_id('c1')
+        card_sql.upsert_card({"id": "c5", "name": "Counterspell"})
+        self.assertEqual(card_sql.fetch_by_exact('counterspell')['id'], 'c5')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Test suite for the deque-backed event and trigger queues.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.events import EventBus
+from engine.game_state import GameState, PlayerState
+from engine.card_engine import Card, Permanent
+from engine.ability_engine import AbilityEngine, AbilityInstance, TriggerCondition
+from engine.keywords import TriggeredAbility
+
+
+class TestEventBusQueue(unittest.TestCase):
+    """Test batched EventBus draining"""
+
+    def setUp(self):
+        self.bus = EventBus(tick_budget=3)
+        self.seen = []
+        self.bus.subscribe("etb", lambda card, **_: self.seen.append(card))
+
+    def test_process_respects_budget(self):
+        self.bus.emit_many(("etb", {"card": i}) for i in range(7))
+        self.assertEqual(self.bus.process(), 3)
+        self.assertEqual(self.seen, [0, 1, 2])
+        self.assertEqual(self.bus.pending, 4)
+        self.assertEqual(self.bus.process(limit=10), 4)
+        self.assertEqual(self.seen, list(range(7)))
+
+    def test_drain(self):
+        for i in range(10):
+            self.bus.emit("etb", card=i)
+        self.assertEqual(self.bus.drain(max_events=5), 5)
+        self.assertEqual(self.bus.drain(), 5)
+        self.assertEqual(self.bus.pending, 0)
+
+    def test_handler_errors_do_not_stop_drain(self):
+        self.bus.subscribe("boom", lambda: 1 / 0)
+        self.bus.emit("boom")
+        self.bus.emit("etb", card="after")
+        self.bus.drain()
+        self.assertEqual(self.seen, ["after"])
+
+
+class TestTriggerQueue(unittest.TestCase):
+    """Test AbilityEngine trigger queue budgets and APNAP ordering"""
+
+    def setUp(self):
+        self.players = [PlayerState(player_id=i, name=f"P{i}") for i in range(3)]
+        self.game = GameState(players=self.players)
+        self.engine = AbilityEngine(self.game)
+        self.resolved = []
+        self.engine._resolve_triggered_ability = self.resolved.append
+
+    def _instance(self, controller, name):
+        card = Card(id=name, name=name, types=["Creature"], mana_cost=1,
+                    owner_id=controller, controller_id=controller, text="")
+        ability = TriggeredAbility(kind='triggered', raw_text="", trigger='DEATH', effect_text="")
+        return AbilityInstance(source_card=card, ability_def=ability, controller=controller)
+
+    def test_budgeted_processing(self):
+        self.engine.triggered_queue.extend(self._instance(0, f"c{i}") for i in range(5))
+        self.assertEqual(self.engine.process_triggered_abilities(budget=2), 2)
+        self.assertTrue(self.engine.has_pending_triggers)
+        self.engine.tick_budget = 10
+        self.assertEqual(self.engine.process_triggered_abilities(), 3)
+        self.assertFalse(self.engine.has_pending_triggers)
+
+    def test_queue_simultaneous_apnap(self):
+        self.game.active_player = 1
+        batch = [self._instance(0, "a"), self._instance(2, "b"), self._instance(1, "c"),
+                 self._instance(0, "d"), self._instance(1, "e")]
+        self.engine.queue_simultaneous(batch)
+        order = [inst.source_card.name for inst in self.engine.triggered_queue]
+        # Active player 1 stacks first, so player 0 (last in turn order) resolves first
+        self.assertEqual(order, ["a", "d", "b", "c", "e"])
+
+    def test_emit_simultaneous_stages_triggers(self):
+        self.game.active_player = 1
+        instances = [self._instance(0, "mine"), self._instance(1, "yours")]
+        for inst in instances:
+            self.engine._register_trigger_listener(inst)
+            self.players[inst.controller].battlefield.append(Permanent(card=inst.source_card))
+        self.engine.emit_simultaneous(
+            (TriggerCondition.DIES, {'affected': inst.source_card, 'controller': inst.controller})
+            for inst in instances)
+        order = [inst.source_card.name for inst in self.engine.triggered_queue]
+        self.assertEqual(order, ["mine", "yours"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Test suite for the length-prefixed frame decoder.
+"""
+
+import socket
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.framing import FrameDecoder, FrameTooLarge, encode_frame
+from network.message_protocol import MessageProtocol, decode_message_body, serialize_message
+
+
+class TestFrameDecoder(unittest.TestCase):
+    """Test framing over partial and coalesced reads"""
+
+    def test_partial_frames_byte_by_byte(self):
+        decoder = FrameDecoder()
+        stream = encode_frame(b"hello") + encode_frame(b"") + encode_frame(b"world!")
+        bodies = []
+        for i in range(len(stream)):
+            decoder.feed(stream[i:i + 1])
+            bodies.extend(bytes(body) for body in decoder.frames())
+        self.assertEqual(bodies, [b"hello", b"", b"world!"])
+        self.assertEqual(len(decoder), 0)
+
+    def test_compacts_instead_of_growing(self):
+        decoder = FrameDecoder(buffer_size=8192)
+        chunk = encode_frame(b"x" * 1000)
+        for _ in range(100):
+            decoder.feed(chunk[:600])
+            self.assertEqual(list(decoder.frames()), [])
+            decoder.feed(chunk[600:])
+            self.assertEqual([len(b) for b in decoder.frames()], [1000])
+        self.assertEqual(decoder.capacity, 8192)
+
+    def test_grows_for_large_frame(self):
+        decoder = FrameDecoder(buffer_size=4096)
+        body = bytes(range(256)) * 1000
+        frame = encode_frame(body)
+        for i in range(0, len(frame), 7000):
+            decoder.feed(frame[i:i + 7000])
+        self.assertEqual([bytes(b) for b in decoder.frames()], [body])
+        self.assertGreaterEqual(decoder.capacity, len(frame))
+
+    def test_max_frame_size_guard(self):
+        decoder = FrameDecoder(max_frame_size=1024)
+        decoder.feed((4096).to_bytes(4, 'big') + b"abc")
+        with self.assertRaises(FrameTooLarge):
+            list(decoder.frames())
+
+    def test_recv_into_socket(self):
+        left, right = socket.socketpair()
+        try:
+            message = MessageProtocol(1).create_play_card_message("c1", "hand", "battlefield")
+            left.sendall(serialize_message(message) * 3)
+            left.shutdown(socket.SHUT_WR)
+            decoder = FrameDecoder()
+            received = []
+            while decoder.recv_into(right):
+                received.extend(decode_message_body(body) for body in decoder.frames())
+            self.assertEqual([m.data["card_id"] for m in received], ["c1"] * 3)
+        finally:
+            left.close()
+            right.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Test suite for the single-pass keyword scanner in KeywordProcessor.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.enhanced_keywords import KeywordProcessor, MTG_KEYWORDS, attach_keywords, has_keyword
+from engine.card_engine import Card
+
+
+def _per_pattern(processor, text):
+    """Reference result: one regex search per keyword (the old extraction)."""
+    found = {}
+    for keyword, pattern in processor.keyword_patterns.items():
+        matches = pattern.findall(text)
+        if matches:
+            found[keyword] = matches[0] if MTG_KEYWORDS[keyword].parameter_type else None
+    return found
+
+
+class TestKeywordScanner(unittest.TestCase):
+    """Test keyword extraction and cached keyword sets"""
+
+    def setUp(self):
+        self.kp = KeywordProcessor()
+
+    def test_matches_per_pattern_extraction(self):
+        texts = [
+            "Flying, first strike",
+            "Protection from red and from blue, flying\nWard {2}",
+            "Flashback {2}{R}",
+            "Flash\nDouble strike; lifelink",
+            "Scry 2. Mill 3. Annihilator 2",
+            "When this enters, scry 1 then scry 2",
+            "Kicker {1}{G}\nMegamorph {3}",
+            "Ward\nward 2",
+            "Jötun Grunt has cumulative upkeep. Trample",
+            "",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(self.kp.extract_keywords(text), _per_pattern(self.kp, text))
+
+    def test_parameters(self):
+        kws = self.kp.extract_keywords("Ward {2}\nScry 3\nProtection from black")
+        self.assertEqual(kws['ward'], '{2}')
+        self.assertEqual(kws['scry'], '3')
+        self.assertEqual(kws['protection'], 'black')
+
+    def test_word_boundaries(self):
+        self.assertEqual(self.kp.extract_keywords("Flashback {1}{U}"), {'flashback': '{1}'})   # first symbol, as before
+        self.assertNotIn('reach', self.kp.extract_keywords("Creatures can't reachable"))
+
+    def test_keyword_set_is_cached_frozenset(self):
+        card = Card(id="c1", name="Serra Angel", types=["Creature"], mana_cost=5,
+                    text="Flying, vigilance")
+        attach_keywords(card, self.kp.extract_keywords(card.text))
+        self.assertEqual(card.keyword_set, frozenset({'flying', 'vigilance'}))
+        self.assertTrue(has_keyword(card, "Flying"))
+        self.assertFalse(has_keyword(card, "reach"))
+
+    def test_keyword_set_follows_reassignment(self):
+        card = Card(id="c2", name="Test", types=["Creature"], mana_cost=1, text="")
+        card.keywords = {'haste': None}
+        self.assertTrue(self.kp.has_keyword(card, 'haste'))
+        card.keywords = {'reach': None}
+        self.assertFalse(self.kp.has_keyword(card, 'haste'))
+        self.assertTrue(self.kp.has_keyword(card, 'reach'))
+
+    def test_text_fallback_without_keywords(self):
+        card = Card(id="c3", name="Test", types=["Creature"], mana_cost=1, text="Deathtouch")
+        self.assertTrue(self.kp.has_keyword(card, 'deathtouch'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Test suite for memoized characteristic states in the layers engine.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.card_engine import Card, Permanent
+from engine.game_state import GameState, PlayerState
+from engine.layers import (
+    LayersEngine, create_static_buff_effect, create_set_pt_effect, create_switch_pt_effect,
+    create_ability_grant_effect
+)
+
+
+def _bear(cid="bear", controller=0):
+    return Card(id=cid, name="Grizzly Bears", types=["Creature"], mana_cost=2,
+                power=2, toughness=2, owner_id=controller, controller_id=controller)
+
+
+class TestLayersCache(unittest.TestCase):
+    """Test epoch-based memoization of characteristic states"""
+
+    def setUp(self):
+        self.layers = LayersEngine()
+        self.card = _bear()
+        self.card.set_layers_engine(self.layers)
+
+    def test_state_memoized_until_epoch_changes(self):
+        first = self.layers.get_characteristic_state(self.card)
+        self.assertIs(self.layers.get_characteristic_state(self.card), first)
+        self.layers.add_effect(create_static_buff_effect("anthem", 1, 1))
+        second = self.layers.get_characteristic_state(self.card)
+        self.assertIsNot(second, first)
+        self.assertEqual((second.current_power, second.current_toughness), (3, 3))
+        self.layers.remove_effect("anthem")
+        self.assertEqual(self.card.get_current_power_toughness(), (2, 2))
+
+    def test_base_change_recomputes(self):
+        self.layers.add_effect(create_static_buff_effect("anthem", 1, 1))
+        self.assertEqual(self.card.get_current_power_toughness(), (3, 3))
+        self.card.power = 4
+        self.assertEqual(self.card.get_current_power_toughness(), (5, 3))
+
+    def test_sublayer_order_independent_of_add_order(self):
+        # 7c modify added before 7b set: set applies first, then +1/+1
+        self.layers.add_effect(create_static_buff_effect("anthem", 1, 1))
+        self.layers.add_effect(create_set_pt_effect("humility", 1, 1))
+        self.assertEqual(self.card.get_current_power_toughness(), (2, 2))
+        self.layers.add_effect(create_switch_pt_effect("twist"))
+        self.card.toughness = 5
+        self.assertEqual(self.card.get_current_power_toughness(), (2, 2))
+
+    def test_affects_card_and_invalidate(self):
+        other = _bear("other", controller=1)
+        self.layers.add_effect(create_static_buff_effect(
+            "lord", 2, 0, affects_card_func=lambda c: c.controller_id == 0))
+        self.assertEqual(self.layers.get_characteristic_state(self.card).current_power, 4)
+        self.assertEqual(self.layers.get_characteristic_state(other).current_power, 2)
+        other.controller_id = 0   # control change is part of the card signature
+        self.assertEqual(self.layers.get_characteristic_state(other).current_power, 4)
+
+    def test_counters_bump_epoch(self):
+        epoch = self.layers.epoch
+        self.layers.update_counters(self.card.id, plus_one_delta=1)
+        self.assertGreater(self.layers.epoch, epoch)
+
+    def test_counters_keep_ability_version(self):
+        self.layers.add_effect(create_ability_grant_effect("wings", ["flying"]))
+        version = self.layers.ability_version
+        self.layers.update_counters(self.card.id, plus_one_delta=1)
+        self.layers.invalidate()
+        self.assertEqual(self.layers.ability_version, version)
+        self.layers.remove_effect("wings")
+        self.assertGreater(self.layers.ability_version, version)
+
+    def test_zone_moves_invalidate(self):
+        game = GameState(players=[PlayerState(player_id=0, name="A"),
+                                  PlayerState(player_id=1, name="B")])
+        game.layers_engine = self.layers
+        self.layers.watch_zones(game.zones)
+        self.layers.add_effect(create_ability_grant_effect(
+            "wings", ["flying"], affects_card_func=lambda c: c.controller_id == 0))
+        game.players[0].hand.append(self.card)
+        epoch, version = self.layers.epoch, self.layers.ability_version
+        game.move_card(self.card, 'battlefield')
+        self.assertGreater(self.layers.epoch, epoch)
+        self.assertGreater(self.layers.ability_version, version)
+        epoch = self.layers.epoch
+        game.eliminate_player(0)
+        self.assertGreater(self.layers.epoch, epoch)
+
+    def test_zone_list_moves_recompute(self):
+        game = GameState(players=[PlayerState(player_id=0, name="A"),
+                                  PlayerState(player_id=1, name="B")])
+        self.layers.watch_zones(game.zones)
+        self.layers.add_effect(create_static_buff_effect(
+            "anthem", 1, 1, affects_card_func=game.zones.is_on_battlefield))
+        hand, battlefield = game.players[0].hand, game.players[0].battlefield
+        hand.append(self.card)
+        self.assertEqual(self.card.get_current_power_toughness(), (2, 2))
+        hand.remove(self.card)
+        battlefield.append(Permanent(card=self.card))
+        self.assertEqual(self.card.get_current_power_toughness(), (3, 3))
+        battlefield.pop()
+        game.players[0].graveyard.append(self.card)
+        self.assertEqual(self.card.get_current_power_toughness(), (2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Test suite for the mana source index and payment solver.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.card_engine import Card, Permanent
+from engine.mana import (
+    ManaPool, GENERIC_KEY, CostVector, card_cost, cost_vector, land_colors, parse_mana_cost, solve_payment
+)
+from engine.zones import ZoneList
+
+
+def _land(name, text="", types=("Land",)):
+    return Permanent(Card(id=name.lower(), name=name, types=list(types), mana_cost=0, text=text))
+
+
+class TestManaSolver(unittest.TestCase):
+    """Test matching-based autotap"""
+
+    def setUp(self):
+        self.forest = _land("Forest", types=("Basic", "Land"))
+        self.plains = _land("Plains", "({T}: Add {W}.)", types=("Basic", "Land"))
+        self.dual = _land("Savannah", "{T}: Add {G} or {W}.")
+        self.wastes = _land("Wastes", "{T}: Add {C}.")
+        self.battlefield = ZoneList([self.dual, self.forest, self.plains, self.wastes])
+        self.pool = ManaPool()
+
+    def test_land_colors(self):
+        self.assertEqual(land_colors(self.forest.card), frozenset("G"))
+        self.assertEqual(land_colors(self.dual.card), frozenset("GW"))
+        self.assertEqual(land_colors(self.wastes.card), frozenset(GENERIC_KEY))
+        prism = _land("Prism", "{T}: Add one mana of any color.")
+        self.assertEqual(land_colors(prism.card), frozenset("WUBRG"))
+
+    def test_dual_not_stranded_on_generic(self):
+        # The greedy scan tapped the dual first and then could not make {W}
+        plan = self.pool.payment_plan(self.battlefield, {'G': 1, 'W': 1, GENERIC_KEY: 1})
+        tapped = {perm.card.name for perm, _ in plan}
+        self.assertEqual(tapped, {"Forest", "Plains", "Wastes"})
+        self.assertTrue(self.pool.autotap_for_cost(self.battlefield, {'W': 1, GENERIC_KEY: 2}))
+        self.assertFalse(self.dual.tapped)
+        self.assertTrue(self.pool.pay({'W': 1, GENERIC_KEY: 2}))
+
+    def test_matching_uses_dual_for_second_pip(self):
+        plan = solve_payment([(self.dual, land_colors(self.dual.card)),
+                              (self.forest, land_colors(self.forest.card))], {'G': 1, 'W': 1})
+        self.assertEqual(sorted(symbol for _, symbol in plan), ['G', 'W'])
+
+    def test_queries_do_not_mutate(self):
+        self.assertTrue(self.pool.can_pay_with_lands(self.battlefield, {'G': 2, 'W': 1}))
+        self.assertFalse(self.pool.can_pay_with_lands(self.battlefield, {'G': 2, 'W': 2}))
+        self.assertFalse(any(perm.tapped for perm in self.battlefield))
+        self.assertFalse(self.pool.autotap_for_cost(self.battlefield, {'U': 1}))
+        self.assertFalse(any(perm.tapped for perm in self.battlefield))
+
+    def test_pool_mana_counts_and_index_tracks_battlefield(self):
+        self.pool.add('W', 2)
+        plan = self.pool.payment_plan(self.battlefield, {'W': 1, 'G': 1, GENERIC_KEY: 1})
+        self.assertEqual([perm.card.name for perm, _ in plan], ["Forest"])
+        index = self.pool.source_index(self.battlefield)
+        self.forest.tapped = True
+        self.assertIs(self.pool.source_index(self.battlefield), index)
+        self.battlefield.remove(self.wastes)
+        self.assertIsNot(self.pool.source_index(self.battlefield), index)
+        self.assertEqual(len(self.pool.source_index(self.battlefield).untapped()), 2)
+
+
+class TestCostVector(unittest.TestCase):
+    """Test cached cost vectors"""
+
+    def test_vector_matches_dict_parse(self):
+        vector = cost_vector("{2}{G}{G}")
+        self.assertEqual(vector, CostVector(G=2, C=2))
+        self.assertEqual(vector.mana_value, 4)
+        self.assertEqual(parse_mana_cost("{2}{G}{G}"), {'G': 2, GENERIC_KEY: 2})
+        self.assertIs(cost_vector("{2}{G}{G}"), vector)
+        hybrid = cost_vector("{X}{R}{U/P}")
+        self.assertEqual((hybrid.R, hybrid.get(GENERIC_KEY), hybrid.hybrid, hybrid.x), (1, 1, 1, 1))
+
+    def test_card_cost_shared_per_definition(self):
+        bears = [Card(id=f"b{i}", name="Grizzly Bears", types=["Creature"], mana_cost=2,
+                      mana_cost_str="{1}{G}") for i in range(3)]
+        self.assertIs(card_cost(bears[0]), card_cost(bears[2]))
+        self.assertEqual(bears[0].cost.with_generic(2).as_dict(), {'G': 1, GENERIC_KEY: 3})
+        no_string = Card(id="x", name="Relic", types=["Artifact"], mana_cost=3)
+        self.assertEqual(card_cost(no_string), CostVector(C=3))
+
+    def test_pool_pays_vector(self):
+        pool = ManaPool()
+        pool.add('G', 1)
+        pool.add('R', 1)
+        self.assertTrue(pool.can_pay(cost_vector("{1}{G}")))
+        self.assertTrue(pool.pay(cost_vector("{1}{G}")))
+        self.assertFalse(pool.can_pay(cost_vector("{G}")))
+
+
+if __name__ == '__main__':
+    unittest.main()
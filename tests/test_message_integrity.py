@@ -0,0 +1,70 @@
+"""
+Test suite for per-frame integrity tags.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.message_protocol import (
+    Integrity, IntegrityPolicy, MessageProtocol, deserialize_message, negotiate_integrity,
+    serialize_message, validate_message
+)
+
+
+class TestMessageIntegrity(unittest.TestCase):
+    """Test tagging once on send and verifying once on decode"""
+
+    def setUp(self):
+        self.message = MessageProtocol(1).create_play_card_message("c1", "hand", "battlefield")
+
+    def _corrupt(self, frame):
+        data = bytearray(frame)
+        data[-3] ^= 0x01
+        return bytes(data)
+
+    def test_crc32_round_trip_and_corruption(self):
+        frame = serialize_message(self.message)
+        decoded = deserialize_message(frame)
+        self.assertEqual(decoded.data, self.message.data)
+        self.assertEqual(decoded.checksum, self.message.checksum)
+        self.assertTrue(decoded.is_valid())
+        self.assertTrue(validate_message(decoded))
+        with self.assertRaises(ValueError):
+            deserialize_message(self._corrupt(frame))
+
+    def test_hmac_requires_key(self):
+        policy = IntegrityPolicy(Integrity.HMAC, b"table-secret")
+        frame = serialize_message(self.message, policy)
+        self.assertEqual(deserialize_message(frame, policy).data["card_id"], "c1")
+        with self.assertRaises(ValueError):
+            deserialize_message(frame, IntegrityPolicy(Integrity.HMAC, b"other-secret"))
+        with self.assertRaises(ValueError):
+            deserialize_message(self._corrupt(frame), policy)
+        with self.assertRaises(ValueError):
+            IntegrityPolicy(Integrity.HMAC)
+
+    def test_weaker_frames_rejected(self):
+        unchecked = serialize_message(self.message, IntegrityPolicy(Integrity.NONE))
+        with self.assertRaises(ValueError):
+            deserialize_message(unchecked)
+        none_policy = IntegrityPolicy(Integrity.NONE)
+        self.assertEqual(deserialize_message(unchecked, none_policy).data["card_id"], "c1")
+        # Stronger frames are still accepted after switching to NONE
+        self.assertEqual(deserialize_message(serialize_message(self.message), none_policy).sequence,
+                         self.message.sequence)
+
+    def test_negotiation(self):
+        crc = IntegrityPolicy()
+        self.assertEqual(negotiate_integrity("none", crc).mode, Integrity.CRC32)
+        self.assertEqual(negotiate_integrity("none", crc, allow_unchecked=True).mode, Integrity.NONE)
+        self.assertEqual(negotiate_integrity(None, crc, allow_unchecked=True).mode, Integrity.CRC32)
+        keyed = IntegrityPolicy(Integrity.HMAC, b"k")
+        self.assertIs(negotiate_integrity("none", keyed, allow_unchecked=True), keyed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,10 +14,38 @@ from queue import Queue, Empty
 # Import network components
 from network.network_client import NetworkClient, ClientState
 from network.game_server import GameServer, ConnectedPlayer, ServerState
-from network.message_protocol import MessageType, NetworkMessage, MessageProtocol
+from network.message_protocol import (
+    MessageType, NetworkMessage, MessageProtocol, serialize_message, deserialize_message
+)
+from network.server_core import AsyncGameServer
 from network.network_game_controller import NetworkGameController
 
 
+def _read_frame(client):
+    """Read one framed message from a blocking client socket."""
+    header = _recv_exactly(client, 4)
+    body = _recv_exactly(client, int.from_bytes(header, 'big'))
+    return deserialize_message(header + body)
+
+
+def _recv_exactly(client, size):
+    data = b""
+    while len(data) < size:
+        chunk = client.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        data += chunk
+    return data
+
+
+def _read_until_closed(client):
+    """Drain a client socket; returns b"" once the server has closed it."""
+    while True:
+        chunk = client.recv(65536)
+        if not chunk:
+            return chunk
+
+
 class TestNetworkClient(unittest.TestCase):
     """Test the NetworkClient component."""
     
@@ -198,159 +226,144 @@ class TestNetworkClient(unittest.TestCase):
 
 
 class TestGameServer(unittest.TestCase):
-    """Test the GameServer component."""
+    """Test the GameServer component over real loopback sockets."""
     
     def setUp(self):
         """Set up test fixtures."""
-        self.server = GameServer()
-        self.mock_controller = Mock()
+        self.server = GameServer(core=AsyncGameServer(host="127.0.0.1", max_players=4))
+        self.clients = []
         
     def tearDown(self):
         """Clean up after tests."""
+        for client in self.clients:
+            client.close()
         if self.server.is_running:
             self.server.stop_server()
     
+    def _start(self):
+        """Start the server on a free port."""
+        self.assertTrue(self.server.start_server("127.0.0.1", 0))
+    
+    def _join(self, name, deck_name="Deck"):
+        """Connect a client socket and join the game; returns (socket, player_id)."""
+        client = socket.create_connection(("127.0.0.1", self.server.port), timeout=2)
+        self.clients.append(client)
+        protocol = MessageProtocol(len(self.clients))
+        client.sendall(serialize_message(protocol.create_join_game_message(name, deck_name)))
+        reply = _read_frame(client)
+        self.assertEqual(reply.type, MessageType.PLAYER_JOINED)
+        return client, reply.data["player_id"]
+    
+    def _wait_for(self, condition, timeout=2.0):
+        """Poll condition until it holds or timeout expires."""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return condition()
+    
     def test_server_initialization(self):
         """Test GameServer initialization."""
         self.assertEqual(self.server.state, ServerState.STOPPED)
-        self.assertIsNone(self.server.socket)
-        self.assertEqual(len(self.server.connected_players), 0)
+        self.assertEqual(len(self.server.players), 0)
         self.assertFalse(self.server.is_running)
         self.assertIsInstance(self.server.protocol, MessageProtocol)
     
     def test_connected_player_creation(self):
         """Test ConnectedPlayer data structure."""
-        mock_socket = Mock()
+        mock_transport = Mock()
         player = ConnectedPlayer(
             player_id=1,
-            socket=mock_socket,
-            address=("192.168.1.100", 12345),
+            transport=mock_transport,
             name="TestPlayer",
             deck_name="TestDeck"
         )
         
         self.assertEqual(player.player_id, 1)
-        self.assertEqual(player.socket, mock_socket)
-        self.assertEqual(player.address, ("192.168.1.100", 12345))
+        self.assertEqual(player.transport, mock_transport)
         self.assertEqual(player.name, "TestPlayer")
         self.assertEqual(player.deck_name, "TestDeck")
         self.assertIsInstance(player.last_heartbeat, float)
-        self.assertTrue(player.is_active)
+        self.assertFalse(player.authenticated)
     
-    @patch('socket.socket')
-    def test_server_startup(self, mock_socket_class):
+    def test_server_startup(self):
         """Test server startup process."""
-        # Mock socket
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
-        mock_socket.bind.return_value = None
-        mock_socket.listen.return_value = None
+        started = []
+        self.server.server_started.connect(lambda: started.append(True))
         
-        # Start server
-        with patch('threading.Thread') as mock_thread:
-            result = self.server.start_server("localhost", 8888)
+        self._start()
         
-        # Verify startup
-        self.assertTrue(result)
-        mock_socket.bind.assert_called_once_with(("localhost", 8888))
-        mock_socket.listen.assert_called_once()
         self.assertEqual(self.server.state, ServerState.RUNNING)
         self.assertTrue(self.server.is_running)
-        
-        # Verify thread creation for accepting connections
-        mock_thread.assert_called()
+        self.assertNotEqual(self.server.port, 0)  # the port the OS picked
+        self.assertEqual(started, [True])
     
-    @patch('socket.socket')
-    def test_server_startup_failure(self, mock_socket_class):
+    def test_server_startup_failure(self):
         """Test server startup failure."""
-        # Mock socket to raise binding error
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
-        mock_socket.bind.side_effect = OSError("Address already in use")
+        # Hold a listening socket on the port the server will try to bind
+        blocker = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.addCleanup(blocker.close)
+        blocker.bind(("127.0.0.1", 0))
+        blocker.listen()
+        errors = []
+        self.server.error_occurred.connect(errors.append)
         
-        # Attempt to start server
-        result = self.server.start_server("localhost", 8888)
+        result = self.server.start_server("127.0.0.1", blocker.getsockname()[1])
         
-        # Verify startup failed
         self.assertFalse(result)
-        self.assertEqual(self.server.state, ServerState.STOPPED)
         self.assertFalse(self.server.is_running)
+        self.assertEqual(len(errors), 1)
     
     def test_player_connection_management(self):
         """Test player connection and disconnection."""
-        # Mock player socket
-        mock_socket = Mock()
+        connected, disconnected = [], []
+        self.server.player_connected.connect(lambda pid, name: connected.append((pid, name)))
+        self.server.player_disconnected.connect(lambda pid, name: disconnected.append((pid, name)))
+        self._start()
         
-        # Add player
-        player_id = self.server._add_player(
-            socket=mock_socket,
-            address=("192.168.1.100", 12345),
-            name="TestPlayer",
-            deck_name="TestDeck"
-        )
+        client, player_id = self._join("TestPlayer", "TestDeck")
         
-        # Verify player added
-        self.assertEqual(player_id, 0)  # First player gets ID 0
-        self.assertEqual(len(self.server.connected_players), 1)
-        self.assertIn(player_id, self.server.connected_players)
-        
-        player = self.server.connected_players[player_id]
+        self.assertEqual(self.server.player_count, 1)
+        player = self.server.players[player_id]
         self.assertEqual(player.name, "TestPlayer")
         self.assertEqual(player.deck_name, "TestDeck")
+        self.assertEqual(connected, [(player_id, "TestPlayer")])
         
-        # Remove player
-        self.server._remove_player(player_id)
-        
-        # Verify player removed
-        self.assertEqual(len(self.server.connected_players), 0)
-        self.assertNotIn(player_id, self.server.connected_players)
+        # Closing the socket disconnects the player
+        client.close()
+        self.assertTrue(self._wait_for(lambda: self.server.player_count == 0))
+        self.assertEqual(disconnected, [(player_id, "TestPlayer")])
     
     def test_message_broadcasting(self):
         """Test message broadcasting to all connected players."""
-        # Add multiple mock players
-        players = []
-        for i in range(3):
-            mock_socket = Mock()
-            player_id = self.server._add_player(
-                socket=mock_socket,
-                address=(f"192.168.1.{100+i}", 12345),
-                name=f"Player{i}",
-                deck_name=f"Deck{i}"
-            )
-            players.append((player_id, mock_socket))
-        
-        # Create test message
-        test_message = NetworkMessage(MessageType.GAME_STATE_UPDATE, {"test": "data"})
+        self._start()
+        clients = [self._join(f"Player{i}")[0] for i in range(3)]
         
-        # Broadcast message
+        test_message = NetworkMessage(MessageType.GAME_STATE_UPDATE, {"test": "data"})
         self.server._broadcast_message(test_message)
         
-        # Verify all players received the message
-        for player_id, mock_socket in players:
-            mock_socket.send.assert_called()
+        # Every player receives it (after any join notices for later players)
+        for client in clients:
+            message = _read_frame(client)
+            while message.type != MessageType.GAME_STATE_UPDATE:
+                message = _read_frame(client)
+            self.assertEqual(message.data, {"test": "data"})
     
     def test_heartbeat_monitoring(self):
         """Test heartbeat monitoring and timeout handling."""
-        # Add a player
-        mock_socket = Mock()
-        player_id = self.server._add_player(
-            socket=mock_socket,
-            address=("192.168.1.100", 12345),
-            name="TestPlayer",
-            deck_name="TestDeck"
-        )
-        
-        player = self.server.connected_players[player_id]
+        self._start()
+        client, player_id = self._join("TestPlayer")
         
         # Simulate old heartbeat (player should timeout)
-        player.last_heartbeat = time.time() - 100  # 100 seconds ago
+        def expire():
+            self.server.players[player_id].last_heartbeat = time.time() - 100
+            self.server.core._check_heartbeats()
+        self.server.core.run_sync(expire)
         
-        # Check for timeouts
-        self.server._check_player_timeouts()
-        
-        # Player should be removed due to timeout
-        self.assertNotIn(player_id, self.server.connected_players)
-        mock_socket.close.assert_called()
+        # Player is removed and the connection closed
+        self.assertNotIn(player_id, self.server.players)
+        self.assertEqual(_read_until_closed(client), b"")
     
     def test_server_status_info(self):
         """Test server status information."""
@@ -361,57 +374,33 @@ class TestGameServer(unittest.TestCase):
         self.assertEqual(info['player_count'], 0)
         
         # Running state with players
-        self.server.state = ServerState.RUNNING
-        self.server.is_running = True
-        
-        # Add mock players
+        self._start()
         for i in range(2):
-            mock_socket = Mock()
-            self.server._add_player(
-                socket=mock_socket,
-                address=(f"192.168.1.{100+i}", 12345),
-                name=f"Player{i}",
-                deck_name=f"Deck{i}"
-            )
+            self._join(f"Player{i}")
         
         info = self.server.get_status_info()
         self.assertEqual(info['state'], ServerState.RUNNING.value)
         self.assertTrue(info['running'])
         self.assertEqual(info['player_count'], 2)
+        self.assertEqual([p['name'] for p in info['players']], ["Player0", "Player1"])
     
     def test_server_shutdown(self):
         """Test server shutdown process."""
-        # Mock running server
-        self.server.socket = Mock()
-        self.server.is_running = True
-        self.server.state = ServerState.RUNNING
+        stopped = []
+        self.server.server_stopped.connect(lambda: stopped.append(True))
+        self._start()
+        clients = [self._join(f"Player{i}")[0] for i in range(2)]
         
-        # Add mock players
-        mock_sockets = []
-        for i in range(2):
-            mock_socket = Mock()
-            mock_sockets.append(mock_socket)
-            self.server._add_player(
-                socket=mock_socket,
-                address=(f"192.168.1.{100+i}", 12345),
-                name=f"Player{i}",
-                deck_name=f"Deck{i}"
-            )
-        
-        # Stop server
         self.server.stop_server()
         
-        # Verify shutdown
         self.assertFalse(self.server.is_running)
         self.assertEqual(self.server.state, ServerState.STOPPED)
-        self.server.socket.close.assert_called_once()
-        
-        # Verify all player connections closed
-        for mock_socket in mock_sockets:
-            mock_socket.close.assert_called()
+        self.assertEqual(len(self.server.players), 0)
+        self.assertEqual(stopped, [True])
         
-        # Verify players list cleared
-        self.assertEqual(len(self.server.connected_players), 0)
+        # All player connections are closed
+        for client in clients:
+            self.assertEqual(_read_until_closed(client), b"")
 
 
 class TestNetworkGameController(unittest.TestCase):
@@ -583,18 +572,16 @@ class TestNetworkIntegration(unittest.TestCase):
         self.assertFalse(client.send_heartbeat())
         self.assertFalse(client.join_game("Player", "Deck"))
         
-        # Test server startup failures
-        server = GameServer()
+        # Test server startup failures: the port is already taken
+        blocker = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.addCleanup(blocker.close)
+        blocker.bind(("127.0.0.1", 0))
+        blocker.listen()
+        server = GameServer(core=AsyncGameServer(host="127.0.0.1"))
         
-        # Mock socket failure
-        with patch('socket.socket') as mock_socket_class:
-            mock_socket = Mock()
-            mock_socket_class.return_value = mock_socket
-            mock_socket.bind.side_effect = OSError("Port in use")
-            
-            result = server.start_server("localhost", 8888)
-            self.assertFalse(result)
-            self.assertEqual(server.state, ServerState.STOPPED)
+        result = server.start_server("127.0.0.1", blocker.getsockname()[1])
+        self.assertFalse(result)
+        self.assertFalse(server.is_running)
     
     def test_concurrent_operations(self):
         """Test concurrent network operations."""
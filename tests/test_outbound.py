@@ -0,0 +1,76 @@
+"""
+Test suite for per-client outbound queues and their backpressure policies.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.outbound import OutboundPolicy, OutboundQueue
+
+
+def _drain(queue):
+    frames = []
+    while True:
+        frame = queue.pop()
+        if frame is None:
+            return frames
+        frames.append(frame)
+
+
+class TestOutboundQueue(unittest.TestCase):
+    """Test ordering, coalescing, dropping and overflow"""
+
+    def test_fifo_and_shared_bytes(self):
+        frame = b"broadcast"
+        queue = OutboundQueue()
+        self.assertTrue(queue.put(b"a"))
+        self.assertTrue(queue.put(frame))
+        self.assertEqual(queue.nbytes, 10)
+        frames = _drain(queue)
+        self.assertEqual(frames, [b"a", frame])
+        self.assertIs(frames[1], frame)
+        self.assertEqual(queue.nbytes, 0)
+
+    def test_heartbeats_coalesce_and_drop_when_backed_up(self):
+        queue = OutboundQueue(OutboundPolicy(lag_frames=3))
+        queue.put(b"hb1", "heartbeat")
+        queue.put(b"x")
+        queue.put(b"hb2", "heartbeat")
+        self.assertEqual(len(queue), 2)
+        queue.put(b"y")
+        self.assertTrue(queue.backed_up)
+        self.assertTrue(queue.put(b"hb3", "heartbeat"))
+        self.assertEqual(queue.dropped, 1)
+        self.assertEqual(_drain(queue), [b"hb2", b"x", b"y"])
+
+    def test_state_built_at_write_time(self):
+        versions = iter([b"v3", None])
+        queue = OutboundQueue()
+        queue.put(lambda: b"stale", "state")
+        queue.put(b"play")
+        queue.put(lambda: next(versions), "state")
+        queue.put(lambda: next(versions), "state")
+        self.assertEqual(queue.coalesced, 2)
+        self.assertEqual(_drain(queue), [b"v3", b"play"])
+        queue.put(lambda: next(versions), "state")   # nothing new to send
+        self.assertEqual(_drain(queue), [])
+
+    def test_overflow_and_lag(self):
+        queue = OutboundQueue(OutboundPolicy(max_frames=4, max_bytes=10, lag_frames=2, lag_timeout=5.0))
+        self.assertTrue(queue.put(b"1234"))
+        self.assertFalse(queue.too_slow())
+        self.assertTrue(queue.put(b"5678"))
+        self.assertFalse(queue.put(b"9abc"))              # max_bytes
+        self.assertTrue(queue.too_slow(queue.lagging_since + 6))
+        queue.pop()
+        self.assertEqual(queue.lagging_for(), 0.0)
+        queue.close()
+        self.assertFalse(queue.put(b"late"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Test suite for the shared oracle-text parse cache.
+"""
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.parse_cache import ParseCache, PARSE_CACHE
+from engine.rules_engine import parse_oracle_text, parse_and_attach
+from engine.card_engine import Card
+from engine.keywords import TriggeredAbility
+
+
+ELF_TEXT = "When Elvish Visionary enters the battlefield, draw a card."
+
+
+class TestParseCache(unittest.TestCase):
+    """Test LRU behaviour and persistence"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_parses_once_per_name_and_text(self):
+        cache = ParseCache()
+        calls = []
+        def parser(text):
+            calls.append(text)
+            return parse_oracle_text(text)
+        first = cache.get_or_parse('oracle', 'Elvish Visionary', ELF_TEXT, parser)
+        second = cache.get_or_parse('oracle', 'Elvish Visionary', ELF_TEXT, parser)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)          # callers get their own list
+        self.assertIs(first[0], second[0])       # ability objects are shared
+        self.assertEqual(cache.stats(), {'entries': 1, 'hits': 1, 'misses': 1})
+
+    def test_bounded_lru(self):
+        cache = ParseCache(maxsize=2)
+        cache.get_or_parse('k', 'a', 'a', str.upper)
+        cache.get_or_parse('k', 'b', 'b', str.upper)
+        cache.get_or_parse('k', 'a', 'a', str.upper)   # refresh a
+        cache.get_or_parse('k', 'c', 'c', str.upper)   # evicts b
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn(('k', 'b', 'b'), cache._entries)
+        self.assertIn(('k', 'a', 'a'), cache._entries)
+
+    def test_save_and_load_round_trip(self):
+        path = os.path.join(self.tmp, 'parse_cache.pkl')
+        cache = ParseCache()
+        cache.get_or_parse('oracle', 'Elvish Visionary', ELF_TEXT, parse_oracle_text)
+        self.assertTrue(cache.save(path))
+        self.assertFalse(cache.dirty)
+
+        restored = ParseCache()
+        self.assertEqual(restored.load(path), 1)
+        abilities = restored.get_or_parse('oracle', 'Elvish Visionary', ELF_TEXT,
+                                          lambda text: self.fail("should not reparse"))
+        self.assertIsInstance(abilities[0], TriggeredAbility)
+        self.assertEqual(abilities[0].trigger, 'ETB')
+
+    def test_load_ignores_missing_or_corrupt_file(self):
+        cache = ParseCache()
+        self.assertEqual(cache.load(os.path.join(self.tmp, 'missing.pkl')), 0)
+        bad = os.path.join(self.tmp, 'bad.pkl')
+        with open(bad, 'wb') as f:
+            f.write(b'not a pickle')
+        self.assertEqual(cache.load(bad), 0)
+
+    def test_parse_and_attach_shares_cache_across_instances(self):
+        before = PARSE_CACHE.stats()['hits']
+        forests = [Card(id=f"f{i}", name="Forest", types=["Land"], mana_cost=0, text="{T}: Add {G}.")
+                   for i in range(5)]
+        for card in forests:
+            parse_and_attach(card)
+        self.assertGreaterEqual(PARSE_CACHE.stats()['hits'] - before, 4)
+        forests[0].oracle_abilities.append("extra")
+        self.assertNotIn("extra", forests[1].oracle_abilities)
+
+
+if __name__ == '__main__':
+    unittest.main()
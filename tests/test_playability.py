@@ -0,0 +1,80 @@
+"""
+Test suite for batched hand playability.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.card_engine import Card, Permanent
+from engine.game_state import PlayerState
+from engine.playability import (
+    CAN_PLAY, CAN_PLAY_LAND, LAND_PLAYED, NO_MANA, SORCERY_SPEED, evaluate_hand
+)
+
+
+def _card(name, types, cost_str="", mana_cost=0, text=""):
+    return Card(id=name.lower(), name=name, types=list(types), mana_cost=mana_cost,
+                mana_cost_str=cost_str, text=text)
+
+
+class _Game:
+    def __init__(self, played=False):
+        self.land_played_this_turn = {0: played}
+
+
+class TestHandPlayability(unittest.TestCase):
+    """Test evaluate_hand masks and reasons"""
+
+    def setUp(self):
+        self.player = PlayerState(player_id=0, name="P0")
+        self.player.battlefield.append(Permanent(_card("Forest", ("Basic", "Land"))))
+        self.player.battlefield.append(Permanent(_card("Plains", ("Basic", "Land"), text="({T}: Add {W}.)")))
+        self.land = _card("Island", ("Basic", "Land"))
+        self.bear = _card("Bear", ("Creature",), "{1}{G}", 2)
+        self.angel = _card("Angel", ("Creature",), "{W}{W}", 2)
+        self.giant = _card("Giant", ("Creature",), "{2}{G}", 3)
+        self.rite = _card("Rite", ("Sorcery",), "{G}", 1)
+        self.player.hand.extend([self.land, self.bear, self.angel, self.giant, self.rite])
+
+    def test_mask_and_reasons(self):
+        result = evaluate_hand(self.player, _Game())
+        self.assertEqual(list(result.mask), [True, True, False, False, True])
+        self.assertEqual(result.reasons, [CAN_PLAY_LAND, CAN_PLAY, NO_MANA, NO_MANA, CAN_PLAY])
+        self.assertEqual(result.playable(), [self.land, self.bear, self.rite])
+        self.assertFalse(any(perm.tapped for perm in self.player.battlefield))
+
+    def test_floating_mana_counts(self):
+        self.player.mana_pool.add('W', 1)
+        result = evaluate_hand(self.player, _Game())
+        self.assertEqual(result.reason_for(self.angel), CAN_PLAY)
+        self.assertEqual(result.reason_for(self.giant), CAN_PLAY)
+
+    def test_land_drop_and_timing(self):
+        result = evaluate_hand(self.player, _Game(played=True), phase='combat')
+        self.assertEqual(result.reason_for(self.land), LAND_PLAYED)
+        self.assertEqual(result.reason_for(self.rite), SORCERY_SPEED)
+        self.assertEqual(result.reason_for(self.bear), CAN_PLAY)
+
+    def test_dual_lands_confirmed_by_solver(self):
+        self.player.battlefield[:] = [
+            Permanent(_card("Savannah", ("Land",), text="{T}: Add {G} or {W}.")),
+            Permanent(_card("Scrubland", ("Land",), text="{T}: Add {W} or {B}.")),
+        ]
+        result = evaluate_hand(self.player, cards=[self.angel, self.bear])
+        self.assertEqual(list(result.mask), [True, True])
+        gg = _card("Twins", ("Creature",), "{G}{G}", 2)
+        self.assertEqual(evaluate_hand(self.player, cards=[gg]).reasons, [NO_MANA])
+
+    def test_find_playable_uses_untapped_lands(self):
+        self.assertEqual(self.player.find_playable(), [self.land, self.bear, self.rite])
+        self.bear.is_commander = True
+        self.player.commander_tracker.note_cast(self.bear.id)
+        self.assertNotIn(self.bear, self.player.find_playable())
+
+
+if __name__ == '__main__':
+    unittest.main()
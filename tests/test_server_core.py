@@ -0,0 +1,185 @@
+"""
+Test suite for the asyncio game server core (no Qt needed).
+"""
+
+import asyncio
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.message_protocol import (
+    BINARY_CODEC, Integrity, IntegrityPolicy, MessageProtocol, MessageType, serialize_message,
+    deserialize_message
+)
+from network.outbound import OutboundPolicy
+from network.server_core import AsyncGameServer, ServerState
+
+
+async def _read(reader):
+    header = await asyncio.wait_for(reader.readexactly(4), 2)
+    body = await reader.readexactly(int.from_bytes(header, 'big'))
+    return deserialize_message(header + body)
+
+
+class TestAsyncGameServer(unittest.IsolatedAsyncioTestCase):
+    """Test the event-loop server with real sockets"""
+
+    async def asyncSetUp(self):
+        self.server = AsyncGameServer(host="127.0.0.1", max_players=2)
+        self.events = []
+        self.server.add_listener("player_connected", lambda *args: self.events.append(args))
+        self.assertTrue(await self.server.start(port=0))
+        self.clients = []
+
+    async def asyncTearDown(self):
+        for _, writer in self.clients:
+            writer.close()
+        await self.server.stop()
+        self.assertEqual(self.server.state, ServerState.STOPPED)
+
+    async def _join(self, name):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        self.clients.append((reader, writer))
+        protocol = MessageProtocol(len(self.clients))
+        writer.write(serialize_message(protocol.create_join_game_message(name, "Deck")))
+        reply = await _read(reader)
+        self.assertEqual(reply.type, MessageType.PLAYER_JOINED)
+        return reader, writer, protocol, reply.data["player_id"]
+
+    async def test_join_and_heartbeat(self):
+        reader, writer, protocol, pid = await self._join("Alice")
+        self.assertEqual(self.events, [(pid, "Alice")])
+        writer.write(serialize_message(protocol.create_heartbeat_message()))
+        self.assertEqual((await _read(reader)).type, MessageType.HEARTBEAT)
+
+    async def test_trusted_lan_turns_off_integrity(self):
+        self.server.allow_unchecked = True
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        self.clients.append((reader, writer))
+        protocol = MessageProtocol(1)
+        writer.write(serialize_message(protocol.create_join_game_message("Alice", "Deck", Integrity.NONE)))
+        reply = await _read(reader)
+        self.assertEqual(reply.data["integrity"], "none")
+        unchecked = IntegrityPolicy(Integrity.NONE)
+        writer.write(serialize_message(protocol.create_heartbeat_message(), unchecked))
+        header = await asyncio.wait_for(reader.readexactly(4), 2)
+        body = await reader.readexactly(int.from_bytes(header, 'big'))
+        self.assertEqual(body[0], 0)      # integrity mode byte: none
+        self.assertEqual(deserialize_message(header + body, unchecked).type, MessageType.HEARTBEAT)
+
+    async def test_binary_codec_negotiated(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        self.clients.append((reader, writer))
+        protocol = MessageProtocol(1)
+        writer.write(serialize_message(protocol.create_join_game_message("Alice", "Deck", codecs=["binary"])))
+        reply = await _read(reader)
+        self.assertEqual(reply.data["codec"], "binary")
+        writer.write(serialize_message(protocol.create_heartbeat_message(), codec=BINARY_CODEC))
+        header = await asyncio.wait_for(reader.readexactly(4), 2)
+        body = await reader.readexactly(int.from_bytes(header, 'big'))
+        self.assertEqual(body[0] >> 4, BINARY_CODEC.code)
+        self.assertEqual(deserialize_message(header + body).type, MessageType.HEARTBEAT)
+
+    async def test_broadcast_excludes_sender(self):
+        r1, w1, p1, _ = await self._join("Alice")
+        r2, _, _, _ = await self._join("Bob")
+        self.assertEqual((await _read(r1)).data["player_name"], "Bob")
+        for player in self.server.players.values():
+            player.ready = True
+        self.assertTrue(self.server.start_game())
+        self.assertEqual((await _read(r1)).type, MessageType.GAME_START)
+        self.assertEqual((await _read(r2)).type, MessageType.GAME_START)
+
+        w1.write(serialize_message(p1.create_play_card_message("c1", "hand", "battlefield")))
+        played = await _read(r2)
+        self.assertEqual(played.type, MessageType.PLAY_CARD)
+        self.assertEqual(played.data["card_id"], "c1")
+
+    async def test_state_updates_are_deltas(self):
+        reader, writer, protocol, pid = await self._join("Alice")
+        state = {"turn": 1, "phase": "UPKEEP", "active_player": 0, "players": {"0": {"life": 40}},
+                 "zones": {"0": {"hand": []}}, "cards": {}}
+        self.assertEqual(self.server.publish_state(state), 1)
+        full = await _read(reader)
+        self.assertEqual(full.type, MessageType.GAME_STATE_UPDATE)
+        self.assertEqual(full.data["state"], state)
+
+        writer.write(serialize_message(protocol.create_state_ack_message(1)))
+        self.server.publish_state(dict(state, turn=2))
+        delta = await _read(reader)
+        self.assertEqual((delta.data["base"], delta.data["delta"]), (1, {"turn": 2}))
+
+        writer.write(serialize_message(protocol.create_resync_request_message(None)))
+        resync = await _read(reader)
+        self.assertEqual((resync.data["version"], resync.data["state"]["turn"]), (2, 2))
+        self.assertEqual(self.server.state_sync.lag(pid), 1)     # acked 1, sent 2
+
+    async def test_state_updates_hide_other_hands(self):
+        r1, _, _, alice = await self._join("Alice")
+        r2, _, _, bob = await self._join("Bob")
+        await _read(r1)                                   # Bob joined
+        self.server.assign_seat(alice, 0)
+        self.server.assign_seat(bob, 1)
+        card = {"owner": 0, "controller": 0, "tapped": False, "damage": 0, "counters": {}}
+        state = {"turn": 1, "phase": "UPKEEP", "active_player": 0,
+                 "players": {"0": {"hand": 1}, "1": {"hand": 1}},
+                 "zones": {"0": {"hand": ["a1"]}, "1": {"hand": ["b1"]}},
+                 "cards": {"a1": dict(card, name="Sol Ring"), "b1": dict(card, name="Counterspell", owner=1)}}
+        self.server.publish_state(state)
+        seen_by_bob = (await _read(r2)).data["state"]
+        self.assertEqual(seen_by_bob["zones"], {"0": {"hand": []}, "1": {"hand": ["b1"]}})
+        self.assertEqual(list(seen_by_bob["cards"]), ["b1"])
+        self.assertEqual(list((await _read(r1)).data["state"]["cards"]), ["a1"])
+
+    async def test_broadcast_encoded_once(self):
+        r1, _, _, _ = await self._join("Alice")
+        r2, _, _, _ = await self._join("Bob")
+        await _read(r1)                                   # Bob joined
+        message = self.server.protocol.create_phase_change_message("combat", 1)
+        self.server._broadcast_message(message)
+        alice, bob = self.server.players.values()
+        self.assertIs(alice.outbox._slots[-1].source, bob.outbox._slots[-1].source)
+        self.assertEqual((await _read(r1)).data["new_phase"], "combat")
+        self.assertEqual((await _read(r2)).data["new_phase"], "combat")
+
+    async def test_overflowing_client_disconnected(self):
+        self.server.outbound = OutboundPolicy(max_frames=4)
+        _, _, _, pid = await self._join("Alice")
+        for turn in range(10):                            # faster than the writer can run
+            self.server._broadcast_message(self.server.protocol.create_phase_change_message("draw", turn))
+        await asyncio.sleep(0)
+        self.assertNotIn(pid, self.server.players)
+
+    async def test_server_full_and_disconnect(self):
+        await self._join("Alice")
+        _, w2, _, pid2 = await self._join("Bob")
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        self.clients.append((reader, writer))
+        self.assertEqual((await _read(reader)).type, MessageType.ERROR)
+
+        w2.close()
+        for _ in range(50):
+            if pid2 not in self.server.players:
+                break
+            await asyncio.sleep(0.01)
+        self.assertNotIn(pid2, self.server.players)
+
+
+class TestServerThread(unittest.TestCase):
+    """Test running the core on a background loop for synchronous callers"""
+
+    def test_start_and_stop_in_thread(self):
+        server = AsyncGameServer(host="127.0.0.1")
+        self.assertTrue(server.start_in_thread(port=0))
+        self.assertTrue(server.is_running)
+        self.assertEqual(server.run_sync(server.get_status_info)["player_count"], 0)
+        self.assertFalse(server.run_sync(server.start_game))
+        server.stop_in_thread()
+        self.assertEqual(server.state, ServerState.STOPPED)
+
+
+if __name__ == '__main__':
+    unittest.main()
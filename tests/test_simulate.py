@@ -0,0 +1,99 @@
+"""
+Test suite for the headless batch simulator.
+
+Games are assembled by hand so the tests do not depend on a card database.
+"""
+
+import unittest
+import os
+import sys
+import random
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.game_state import GameState, PlayerState
+from engine.card_engine import Card
+from engine.rules_engine import init_rules
+from engine.simulate import BatchReport, GameResult, play_game, _pick_winner, _split
+from ai.basic_ai import BasicAI
+
+
+def _library(pid):
+    cards = []
+    for i in range(20):
+        cards.append(Card(id=f"p{pid}_forest{i}", name="Forest", types=["Land"], mana_cost=0,
+                          text="{T}: Add {G}.", owner_id=pid, controller_id=pid))
+    for i in range(20):
+        cards.append(Card(id=f"p{pid}_bear{i}", name="Grizzly Bears", types=["Creature"], mana_cost=2,
+                          power=2, toughness=2, mana_cost_str="{1}{G}",
+                          owner_id=pid, controller_id=pid))
+    return cards
+
+
+def _build_game(seed):
+    random.seed(seed)
+    players = [PlayerState(player_id=pid, name=f"P{pid}", library=_library(pid)) for pid in range(2)]
+    game = GameState(players=players)
+    game.setup()
+    init_rules(game)
+    for p in game.players:
+        p.draw(7)
+    game.ensure_progress()
+    return game, {p.player_id: BasicAI(pid=p.player_id) for p in game.players}
+
+
+class TestPlayGame(unittest.TestCase):
+    """Test the tight headless game loop"""
+
+    def test_game_terminates(self):
+        game, ais = _build_game(1)
+        turns, hit_limit = play_game(game, ais, max_turns=200)
+        self.assertGreater(turns, 1)
+        if not hit_limit:
+            self.assertTrue(game.check_game_over())
+
+    def test_turn_limit(self):
+        game, ais = _build_game(2)
+        turns, hit_limit = play_game(game, ais, max_turns=2)
+        self.assertTrue(hit_limit)
+        self.assertEqual(turns, 2)
+
+    def test_same_seed_is_deterministic(self):
+        game_a, ais_a = _build_game(7)
+        game_b, ais_b = _build_game(7)
+        self.assertEqual(play_game(game_a, ais_a, 50), play_game(game_b, ais_b, 50))
+        self.assertEqual([p.life for p in game_a.players], [p.life for p in game_b.players])
+
+    def test_pick_winner(self):
+        game, _ = _build_game(3)
+        game.players[1].life = 0
+        self.assertEqual(_pick_winner(game), "P0")
+        game.players[0].life = 0
+        self.assertIsNone(_pick_winner(game))
+
+
+class TestBatchReport(unittest.TestCase):
+    """Test aggregation of simulated game results"""
+
+    def test_aggregates_results(self):
+        report = BatchReport()
+        report.add(GameResult(seed=1, winner="A", turns=8))
+        report.add(GameResult(seed=2, winner="A", turns=12))
+        report.add(GameResult(seed=3, winner=None, turns=60, hit_turn_limit=True))
+        report.elapsed = 1.5
+        self.assertEqual(report.games, 3)
+        self.assertEqual(report.wins, {"A": 2})
+        self.assertEqual(report.draws, 1)
+        self.assertEqual(report.turn_limit_hits, 1)
+        self.assertEqual((report.min_turns, report.max_turns), (8, 60))
+        self.assertAlmostEqual(report.games_per_sec, 2.0)
+        self.assertIn("A: 2 wins", report.summary())
+
+    def test_split_covers_all_games(self):
+        self.assertEqual(_split(10, 3), [4, 3, 3])
+        self.assertEqual(sum(_split(7, 4)), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
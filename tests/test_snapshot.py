@@ -0,0 +1,143 @@
+"""
+Test suite for GameState snapshot / restore / fork.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.card_engine import Card, Permanent, ActionResult
+from engine.game_state import GameState, PlayerState
+from engine.stack import StackItem
+
+
+def _card(cid, types=("Creature",), owner=0):
+    return Card(id=cid, name=cid, types=list(types), mana_cost=1, power=2, toughness=2,
+                owner_id=owner, controller_id=owner)
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test undo and lookahead forks"""
+
+    def setUp(self):
+        self.p0 = PlayerState(player_id=0, name="P0")
+        self.p1 = PlayerState(player_id=1, name="P1")
+        self.p0.library = [_card(f"lib{i}") for i in range(10)]
+        self.p0.hand = [_card("forest", types=("Land",))]
+        self.game = GameState(players=[self.p0, self.p1])
+        self.bear = Permanent(card=_card("bear"), summoning_sick=False)
+        self.p0.battlefield.append(self.bear)
+
+    def test_restore_undoes_moves_and_overlays(self):
+        snap = self.game.snapshot()
+        forest = self.p0.hand[0]
+        self.assertEqual(self.game.play_land(0, forest), ActionResult.OK)
+        self.p0.draw(3)
+        self.bear.tapped = True
+        self.bear.damage = 1
+        self.p1.life = 12
+        self.p0.mana_pool.add('G', 2)
+        self.game.turn = 5
+
+        self.game.restore(snap)
+        self.assertEqual([c.name for c in self.p0.hand], ["forest"])
+        self.assertIs(self.p0.hand[0], forest)
+        self.assertEqual(len(self.p0.library), 10)
+        self.assertEqual(self.p0.battlefield, [self.bear])
+        self.assertFalse(self.bear.tapped)
+        self.assertEqual(self.bear.damage, 0)
+        self.assertEqual(self.p1.life, 40)
+        self.assertEqual(self.p0.mana_pool.pool['G'], 0)
+        self.assertEqual(self.game.turn, 1)
+        self.assertFalse(self.game.land_played_this_turn.get(0, False))
+        # the zone index follows the restore
+        self.assertEqual(self.game.zones.zone_of(forest), 'hand')
+        self.assertIs(self.game.zones.permanent_for(self.bear.card), self.bear)
+
+    def test_snapshot_can_be_restored_repeatedly(self):
+        snap = self.game.snapshot()
+        for _ in range(3):
+            self.p0.draw(2)
+            self.game.restore(snap)
+        self.assertEqual(len(self.p0.library), 10)
+
+    def test_fork_is_independent_and_shares_cards(self):
+        self.game.stack.push(StackItem(source=self.bear.card, label="spell", targets=[self.p1]))
+        child = self.game.fork()
+        self.assertIsNot(child.players[0], self.p0)
+        self.assertIs(child.players[0].library[0], self.p0.library[0])      # shared Card
+        child_bear = child.players[0].battlefield[0]
+        self.assertIsNot(child_bear, self.bear)
+        self.assertIs(child_bear.card, self.bear.card)
+
+        child_bear.tapped = True
+        child.players[0].draw(2)
+        child.players[1].life = 1
+        child.stack.items()[0].targets.append("x")
+        self.assertFalse(self.bear.tapped)
+        self.assertEqual(len(self.p0.library), 10)
+        self.assertEqual(self.p1.life, 40)
+        self.assertEqual(self.game.stack.items()[0].targets, [self.p1])
+        self.assertIs(child.stack.game, child)
+        self.assertIsNot(child.zones, self.game.zones)
+        self.assertEqual(child.zones.zone_of(child.players[0].hand[-1]), 'hand')
+        self.assertEqual(self.game.zones.zone_of(child.players[0].hand[-1]), 'library')
+
+    def test_fork_remaps_permanent_references(self):
+        aura = Permanent(card=_card("aura", types=("Enchantment", "Aura")))
+        aura.attached_to = self.bear
+        self.p0.battlefield.append(aura)
+        self.p0.mana_pool.add('G', 1, source=self.bear)
+        child = self.game.fork()
+        child_bear, child_aura = child.players[0].battlefield
+        self.assertIs(child_aura.attached_to, child_bear)
+        self.assertIs(child.players[0].mana_pool.sources['G'][0], child_bear)
+
+    def test_nested_snapshots(self):
+        outer = self.game.snapshot()
+        self.p0.draw(1)
+        self.bear.tapped = True
+        inner = self.game.snapshot()
+        self.p0.draw(2)
+        self.bear.damage = 3
+        self.game.restore(inner)
+        self.assertEqual(len(self.p0.hand), 2)
+        self.assertTrue(self.bear.tapped)
+        self.assertEqual(self.bear.damage, 0)
+        self.game.restore(outer)
+        self.assertEqual(len(self.p0.hand), 1)
+        self.assertFalse(self.bear.tapped)
+        self.assertFalse(inner.live)
+        with self.assertRaises(ValueError):
+            self.game.restore(inner)
+
+    def test_journal_is_copy_on_write(self):
+        snap = self.game.snapshot()
+        self.assertEqual(self.game.zones._journal, [])
+        self.bear.tapped = True
+        self.bear.tapped = False
+        self.bear.damage = 1
+        self.assertEqual(len(self.game.zones._journal), 1)   # first write only
+        self.game.release(snap)
+        self.assertIsNone(self.game.zones._journal)
+        self.assertEqual(self.bear.damage, 1)
+
+    def test_zone_reassignment_is_undone(self):
+        snap = self.game.snapshot()
+        hand = self.p0.hand
+        self.p0.hand = []
+        self.game.restore(snap)
+        self.assertIs(self.p0.hand, hand)
+        self.assertEqual(self.game.zones.zone_of(hand[0]), 'hand')
+
+    def test_restore_rejects_foreign_snapshot(self):
+        other = self.game.fork()
+        with self.assertRaises(ValueError):
+            other.restore(self.game.snapshot())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Test suite for incremental (dirty-set) state-based action checks.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.card_engine import Card, Permanent
+from engine.game_state import GameState, PlayerState
+from engine.layers import LayersEngine, create_static_buff_effect
+from engine.state_based_actions import init_state_based_actions
+
+
+def _creature(name, toughness=2, types=("Creature",)):
+    return Card(id=name, name=name, types=list(types), mana_cost=2,
+                power=2, toughness=toughness, owner_id=0, controller_id=0)
+
+
+def _perm(card):
+    perm = Permanent(card=card, summoning_sick=False)
+    perm.controller_id = 0
+    return perm
+
+
+class TestIncrementalSBA(unittest.TestCase):
+    """Test that only changed objects are re-checked"""
+
+    def setUp(self):
+        self.p0 = PlayerState(player_id=0, name="P0")
+        self.p1 = PlayerState(player_id=1, name="P1")
+        self.game = GameState(players=[self.p0, self.p1])
+        self.sba = init_state_based_actions(self.game, validate=True)
+        self.bears = [_perm(_creature(f"bear{i}")) for i in range(5)]
+        self.p0.battlefield.extend(self.bears)
+        self.game.check_state_based_actions()   # initial full sweep
+
+    def test_only_dirty_objects_are_checked(self):
+        self.assertEqual(self.sba._collect_dirty_actions(), [])
+        self.sba.validate = False   # the validating sweep would run the checks too
+        checked = []
+        original = self.sba._lethal_damage_action
+        self.sba._lethal_damage_action = lambda perm: checked.append(perm) or original(perm)
+        self.bears[2].damage = 2
+        self.assertTrue(self.game.check_state_based_actions())
+        self.assertEqual(checked, [self.bears[2]])
+        self.assertNotIn(self.bears[2], self.p0.battlefield)
+        self.assertIn(self.bears[2].card, self.p0.graveyard)
+
+    def test_life_change_marks_player(self):
+        self.p1.life = 0
+        self.game.check_state_based_actions()
+        self.assertTrue(getattr(self.p1, 'has_lost', False))
+        self.assertFalse(getattr(self.p0, 'has_lost', False))
+
+    def test_legendary_rule_on_entry(self):
+        legend = lambda: _perm(_creature("Isamaru", types=("Legendary", "Creature")))
+        first, second = legend(), legend()
+        self.p0.battlefield.append(first)
+        self.assertFalse(self.game.check_state_based_actions())
+        self.p0.battlefield.append(second)
+        self.assertTrue(self.game.check_state_based_actions())
+        self.assertEqual([p for p in self.p0.battlefield if p.card.name == "Isamaru"], [second])
+
+    def test_aura_falls_off_when_host_leaves(self):
+        aura = _perm(Card(id="aura", name="Pacifism", types=["Enchantment", "Aura"], mana_cost=2))
+        aura.attached_to = self.bears[0]
+        self.p0.battlefield.append(aura)
+        self.assertFalse(self.game.check_state_based_actions())
+        self.p0.battlefield.remove(self.bears[0])     # untracked attribute, tracked zone move
+        self.p0.graveyard.append(self.bears[0].card)
+        self.assertTrue(self.game.check_state_based_actions())
+        self.assertIn(aura.card, self.p0.graveyard)
+        self.assertEqual(self.sba.mismatches, 0)
+
+    def test_full_sweep_fallback(self):
+        self.sba.validate = False
+        object.__setattr__(self.bears[1], 'damage', 5)     # bypasses change tracking
+        self.assertFalse(self.game.check_state_based_actions())
+        self.assertTrue(self.game.check_state_based_actions(full_sweep=True))
+        self.assertNotIn(self.bears[1], self.p0.battlefield)
+
+    def test_validate_catches_untracked_change(self):
+        object.__setattr__(self.bears[3], 'damage', 5)
+        self.assertTrue(self.game.check_state_based_actions())
+        self.assertEqual(self.sba.mismatches, 1)
+
+
+class TestLayersDirtySBA(unittest.TestCase):
+    """Test that counter and effect changes reach incremental checks"""
+
+    def setUp(self):
+        self.p0 = PlayerState(player_id=0, name="P0")
+        self.game = GameState(players=[self.p0, PlayerState(player_id=1, name="P1")])
+        self.layers = LayersEngine()
+        self.layers.watch_zones(self.game.zones)
+        self.sba = init_state_based_actions(self.game)
+        self.bears = [_perm(_creature(f"bear{i}")) for i in range(3)]
+        for perm in self.bears:
+            perm.card.set_layers_engine(self.layers)
+        self.p0.battlefield.extend(self.bears)
+        self.game.check_state_based_actions()   # initial full sweep
+
+    def test_minus_counters_kill_incrementally(self):
+        checked = []
+        original = self.sba._zero_toughness_action
+        self.sba._zero_toughness_action = lambda perm: checked.append(perm) or original(perm)
+        self.layers.update_counters("bear1", minus_one_delta=2)
+        self.assertFalse(self.sba._needs_full_sweep)
+        self.assertTrue(self.game.check_state_based_actions())
+        self.assertEqual(checked, [self.bears[1]])
+        self.assertNotIn(self.bears[1], self.p0.battlefield)
+        self.assertIn(self.bears[1].card, self.p0.graveyard)
+
+    def test_effect_removal_rechecks_battlefield(self):
+        self.layers.add_effect(create_static_buff_effect("anthem", 1, 1))
+        self.layers.update_counters("bear0", minus_one_delta=2)
+        self.assertFalse(self.game.check_state_based_actions())    # 3/3 with two -1/-1
+        self.layers.remove_effect("anthem")
+        self.assertTrue(self.game.check_state_based_actions())
+        self.assertEqual(self.p0.battlefield, self.bears[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Test suite for versioned, delta-compressed game state sync.
+"""
+
+import copy
+import json
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.card_engine import Card
+from engine.game_state import GameState, PlayerState
+from network.state_sync import (
+    StateSyncClient, StateSyncServer, SyncedState, diff_snapshots, snapshot_game_state, view_for
+)
+
+
+def _wire(data):
+    """What the other side sees after a JSON round trip."""
+    return json.loads(json.dumps(data))
+
+
+class TestDeltas(unittest.TestCase):
+    """Test snapshots of a real game and the deltas between them"""
+
+    def setUp(self):
+        self.players = [PlayerState(player_id=i, name=f"P{i}") for i in range(4)]
+        self.game = GameState(players=self.players)
+        for ps in self.players:
+            ps.library = [Card(id=f"{ps.player_id}-{n}", name="Forest", types=["Land"], mana_cost=0,
+                               owner_id=ps.player_id, controller_id=ps.player_id) for n in range(20)]
+            for _ in range(7):
+                ps.hand.append(ps.library.pop())
+        self.before = snapshot_game_state(self.game)
+
+    def _check(self, delta_keys):
+        after = snapshot_game_state(self.game)
+        delta = diff_snapshots(self.before, after)
+        self.assertEqual(set(delta), delta_keys)
+        state = SyncedState(_wire(self.before), 1)
+        state.apply_delta(_wire(delta), 2)
+        self.assertEqual(state.snapshot, after)
+        return delta
+
+    def test_snapshot_hides_library(self):
+        self.assertEqual(self.before["players"]["0"]["library"], 13)
+        self.assertEqual(len(self.before["cards"]), 28)
+        self.assertEqual(diff_snapshots(self.before, snapshot_game_state(self.game)), {})
+
+    def test_play_tap_and_damage(self):
+        self.game.move_card(self.players[0].hand[2], "battlefield")
+        self.players[0].battlefield[0].tapped = True
+        self.players[1].life -= 3
+        delta = self._check({"players", "cards", "moves"})
+        self.assertEqual(delta["moves"], [["0-17", "0", "battlefield", 0]])
+        self.assertEqual(delta["cards"], {"0-17": {"tapped": True}})
+        self.assertEqual(delta["players"], {"0": {"hand": 6}, "1": {"life": 37}})
+
+    def test_draw_and_shuffle_away(self):
+        self.players[2].hand.append(self.players[2].library.pop())
+        self.game.move_card(self.players[3].hand[0], "library")
+        delta = self._check({"players", "cards", "moves", "removed"})
+        self.assertEqual(delta["removed"], ["3-19"])
+
+    def test_reorder_sends_zone(self):
+        self.players[1].hand.reverse()
+        self.game.phase_index = 3
+        delta = self._check({"phase", "zones"})
+        self.assertEqual(delta["phase"], "PRECOMBAT_MAIN")
+
+
+class TestHiddenHands(unittest.TestCase):
+    """Test that each seat is sent its own hand and only the size of the others"""
+
+    def setUp(self):
+        self.players = [PlayerState(player_id=i, name=f"P{i}") for i in range(2)]
+        self.game = GameState(players=self.players)
+        names = ["Sol Ring", "Counterspell"]
+        for ps in self.players:
+            for n in range(3):
+                ps.hand.append(Card(id=f"{ps.player_id}-{n}", name=names[ps.player_id], types=["Instant"],
+                                    mana_cost=2, owner_id=ps.player_id, controller_id=ps.player_id))
+        self.server = StateSyncServer()
+        self.server.add_client(1, viewer=0)
+        self.server.add_client(2, viewer=1)
+        self.server.publish(snapshot_game_state(self.game))
+
+    def test_opponent_hand_is_a_count(self):
+        state = _wire(self.server.update_for(2)["state"])
+        self.assertEqual(state["zones"]["1"]["hand"], ["1-0", "1-1", "1-2"])
+        self.assertEqual(state["zones"]["0"]["hand"], [])
+        self.assertEqual(state["players"]["0"]["hand"], 3)
+        self.assertNotIn("Sol Ring", json.dumps(state))
+        self.assertIn("Sol Ring", json.dumps(self.server.update_for(1)))
+        self.assertEqual(view_for(self.server.snapshot, None)["cards"], {})   # spectators
+
+    def test_deltas_per_seat(self):
+        clients = {cid: StateSyncClient() for cid in (1, 2)}
+        for cid, client in clients.items():
+            client.apply_update(_wire(self.server.update_for(cid)))
+        self.players[0].hand.append(Card(id="0-9", name="Mana Crypt", types=["Artifact"], mana_cost=0,
+                                         owner_id=0, controller_id=0))
+        self.game.move_card(self.players[0].hand[0], "battlefield")
+        after = snapshot_game_state(self.game)
+        self.server.publish(after)
+        update = self.server.update_for(2)
+        self.assertNotIn("Mana Crypt", json.dumps(update))
+        self.assertEqual(update["delta"]["cards"]["0-0"]["name"], "Sol Ring")   # now public
+        for cid, client in clients.items():
+            self.assertTrue(client.apply_update(_wire(update if cid == 2 else self.server.update_for(cid))))
+            self.assertEqual(client.state.snapshot, view_for(after, str(cid - 1)))
+
+
+class TestVersioning(unittest.TestCase):
+    """Test per-client versions, resync and gap detection"""
+
+    def setUp(self):
+        self.snapshots = [{"turn": t, "phase": "UPKEEP", "active_player": 0,
+                           "players": {"0": {"name": "P0", "life": 40 - t}},
+                           "zones": {"0": {"hand": []}}, "cards": {}} for t in range(4)]
+        self.server = StateSyncServer()
+        self.server.add_client(1)
+
+    def _publish(self, index):
+        return self.server.publish(copy.deepcopy(self.snapshots[index]))
+
+    def test_full_then_deltas(self):
+        client = StateSyncClient()
+        self.assertEqual(self._publish(0), 1)
+        self.assertIsNone(self._publish(0))              # unchanged: no new version
+        first = self.server.update_for(1)
+        self.assertIn("state", first)
+        self.assertIsNone(self.server.update_for(1))     # already sent
+        self.assertTrue(client.apply_update(_wire(first)))
+
+        self._publish(1)
+        self._publish(2)
+        update = self.server.update_for(1)
+        self.assertEqual((update["base"], update["version"]), (1, 3))
+        self.assertEqual(update["delta"], {"turn": 2, "players": {"0": {"life": 38}}})
+        self.assertEqual(self.server.lag(1), 3)
+        self.assertTrue(client.apply_update(_wire(update)))
+        self.server.acknowledge(1, client.version)
+        self.assertEqual(self.server.lag(1), 0)
+        self.assertEqual(client.state.snapshot, self.snapshots[2])
+
+    def test_gap_and_resync(self):
+        client = StateSyncClient()
+        self._publish(0)
+        self.server.update_for(1)                         # lost: client never applies it
+        self._publish(1)
+        self.assertFalse(client.apply_update(_wire(self.server.update_for(1))))
+        self.server.request_resync(1)
+        resync = self.server.update_for(1)
+        self.assertEqual(resync["version"], 2)
+        self.assertTrue(client.apply_update(_wire(resync)))
+        self.assertEqual(client.state.snapshot, self.snapshots[1])
+
+    def test_old_snapshots_dropped(self):
+        self.server.add_client(2)
+        for index in range(4):
+            self._publish(index)
+            self.server.update_for(1)
+        self.assertEqual(sorted(self.server._snapshots), [4])
+        self.server.remove_client(1)
+        self.assertIn("state", self.server.update_for(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from engine.game_state import GameState, PlayerState, PHASES
 from engine.card_engine import Card, Permanent
 from engine.combat import CombatManager, attach_combat
-from engine.keywords import card_keywords
+from engine.keywords import card_keywords, KW, has_kw, keyword_mask
+from engine.layers import LayersEngine, create_ability_grant_effect
 
 
 class TestSummoningSickness(unittest.TestCase):
@@ -367,6 +368,39 @@ class TestCombatIntegration(unittest.TestCase):
         self.assertGreater(blocker_perm.damage_marked, initial_blocker_damage)
 
 
+class TestKeywordMask(unittest.TestCase):
+    """Test cached keyword bitmasks used by combat"""
+
+    def _card(self, text=""):
+        return Card(id="kw_card", name="Keyword Card", types=["Creature"],
+                    mana_cost=1, power=1, toughness=1, text=text)
+
+    def test_mask_matches_card_keywords(self):
+        card = self._card("Flying, lifelink")
+        self.assertEqual(keyword_mask(card), KW.FLYING | KW.LIFELINK)
+        self.assertTrue(has_kw(card, KW.FLYING))
+        self.assertTrue(has_kw(card, KW.FLYING | KW.REACH))
+        self.assertFalse(has_kw(card, KW.TRAMPLE))
+        self.assertEqual(card_keywords(card), {'flying', 'lifelink'})
+
+    def test_mask_recomputed_when_text_replaced(self):
+        card = self._card("Haste")
+        self.assertTrue(has_kw(card, KW.HASTE))
+        card.text = "Reach"
+        self.assertFalse(has_kw(card, KW.HASTE))
+        self.assertTrue(has_kw(card, KW.REACH))
+
+    def test_layer_granted_keywords(self):
+        card = self._card()
+        layers = LayersEngine()
+        card.set_layers_engine(layers)
+        self.assertFalse(has_kw(card, KW.FLYING))
+        layers.add_effect(create_ability_grant_effect("aura", ["Flying"]))
+        self.assertTrue(has_kw(card, KW.FLYING))
+        layers.remove_effect("aura")
+        self.assertFalse(has_kw(card, KW.FLYING))
+
+
 if __name__ == '__main__':
     # Create test suite
     loader = unittest.TestLoader()
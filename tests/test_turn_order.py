@@ -0,0 +1,116 @@
+"""
+Test suite for the turn-order ring in multiplayer games.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.card_engine import Card, Permanent
+from engine.combat import attach_combat
+from engine.game_state import GameState, PlayerState
+from engine.priority import PriorityManager, PriorityState
+from engine.turn_order import TurnOrder
+
+
+class TestTurnOrderRing(unittest.TestCase):
+    """Test the precomputed ring itself"""
+
+    def test_next_and_apnap(self):
+        order = TurnOrder.build([0, 1, 2, 3])
+        self.assertEqual([order.next(pid) for pid in range(4)], [1, 2, 3, 0])
+        self.assertEqual(order.apnap(2), (2, 3, 0, 1))
+        self.assertEqual(order.opponents(3), (0, 1, 2))
+        self.assertEqual(order.rank(2, 1), 3)
+
+    def test_without_skips_eliminated(self):
+        order = TurnOrder.build([0, 1, 2, 3]).without(1)
+        self.assertEqual(order.alive, (0, 2, 3))
+        self.assertEqual(order.next(0), 2)
+        self.assertEqual(order.next(1), 2)       # still answers for the eliminated seat
+        self.assertEqual(order.apnap(1), (2, 3, 0))
+        self.assertEqual(order.eliminated, frozenset({1}))
+        self.assertEqual(TurnOrder.build([0, 1]).without(0).next(1), 1)
+
+
+class TestMultiplayerGame(unittest.TestCase):
+    """Test four-player turn order through GameState, priority and combat"""
+
+    def setUp(self):
+        self.players = [PlayerState(player_id=i, name=f"P{i}") for i in range(4)]
+        self.game = GameState(players=self.players)
+
+    def _end_turn(self):
+        turn = self.game.turn
+        while self.game.turn == turn:
+            self.game.next_phase()
+
+    def test_turns_rotate_and_skip_eliminated(self):
+        self._end_turn()
+        self.assertEqual(self.game.active_player, 1)
+        self.game.eliminate_player(2)
+        self._end_turn()
+        self.assertEqual(self.game.active_player, 3)
+        self.assertTrue(self.players[2].has_lost)
+
+    def test_priority_round_visits_remaining_players(self):
+        self.game.eliminate_player(1)
+        priority = PriorityManager(self.game)
+        priority.give_priority(0)
+        seen = [priority.priority_player]
+        for _ in range(2):
+            priority.pass_priority(priority.priority_player)
+            seen.append(priority.priority_player)
+        self.assertEqual(seen, [0, 2, 3])
+        priority.pass_priority(3)
+        self.assertEqual(priority.state, PriorityState.STEP_ENDING)
+
+    def test_attack_hits_next_remaining_player(self):
+        self.game.eliminate_player(1)
+        attacker = Card(id="bear", name="Bear", types=["Creature"], mana_cost=2, power=2,
+                        toughness=2, owner_id=0, controller_id=0)
+        self.players[0].battlefield.append(Permanent(card=attacker, summoning_sick=False))
+        self.game.declare_attackers(0)
+        self.assertEqual(self.players[2].life, 38)
+        self.assertEqual(self.players[1].life, 40)
+
+        combat = attach_combat(self.game)
+        combat.state.attackers.append(Permanent(card=attacker, summoning_sick=False))
+        combat.assign_and_deal_damage()
+        self.assertEqual(self.players[2].life, 36)
+
+    def test_game_over_when_one_player_left(self):
+        self.players[1].life = 0
+        self.assertFalse(self.game.check_game_over())
+        self.game.eliminate_player(2)
+        self.assertFalse(self.game.check_game_over())
+        self.players[3].life = 0
+        self.assertTrue(self.game.check_game_over())
+        self.assertEqual(self.game.turn_order.alive, (0,))
+        self.assertTrue(self.players[1].has_lost)
+
+    def test_three_player_turns_skip_dead_player(self):
+        game = GameState(players=[PlayerState(player_id=i, name=f"P{i}") for i in range(3)])
+        game.players[1].life = 0
+        turn = game.turn
+        while game.turn == turn:
+            game.next_phase()
+        self.assertEqual(game.active_player, 2)
+        self.assertTrue(game.players[1].has_lost)
+        self.assertEqual(game.turn_order.opponents(2), (0,))
+        self.assertFalse(game.check_game_over())
+
+    def test_snapshot_restores_eliminations(self):
+        snap = self.game.snapshot()
+        self.game.eliminate_player(3)
+        self.game.restore(snap)
+        self.assertEqual(self.game.turn_order.alive, (0, 1, 2, 3))
+        self.assertFalse(self.players[3].has_lost)
+        self.assertEqual(self.game.fork().turn_order, self.game.turn_order)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Test suite for the pluggable wire codecs.
+"""
+
+import unittest
+import os
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.message_protocol import (
+    BINARY_CODEC, JSON_CODEC, MessageCodec, MessageProtocol, MessageType, deserialize_message,
+    negotiate_codec, register_codec, serialize_message
+)
+
+
+class TestBinaryCodec(unittest.TestCase):
+    """Test that the binary codec carries exactly what JSON carries"""
+
+    def setUp(self):
+        self.protocol = MessageProtocol(3)
+
+    def _round_trip(self, message):
+        via_json = deserialize_message(serialize_message(message, codec=JSON_CODEC))
+        via_binary = deserialize_message(serialize_message(message, codec=BINARY_CODEC))
+        for field in ("type", "player_id", "timestamp", "sequence", "message_id", "data"):
+            self.assertEqual(getattr(via_binary, field), getattr(via_json, field), field)
+        return via_binary
+
+    def test_value_types(self):
+        state = {
+            "turn": 7, "phase": "combat", "life": [40, -3, 0, 127, 128, 2 ** 70, -2 ** 70],
+            "ratio": 0.25, "tapped": True, "flipped": False, "target": None,
+            "name": "Æther Vial", "text": "x" * 300, "nested": {"hand": list(range(40))},
+            5: "integer key", "many": {f"k{i}": i for i in range(20)}, "pair": (1, 2),
+        }
+        decoded = self._round_trip(self.protocol.create_game_state_update_message(state))
+        self.assertEqual(decoded.data["state"]["5"], "integer key")
+        self.assertEqual(decoded.data["state"]["pair"], [1, 2])
+
+    def test_smaller_than_json(self):
+        message = self.protocol.create_play_card_message("c1", "hand", "battlefield", player_id=3)
+        self._round_trip(message)
+        binary = serialize_message(message, codec=BINARY_CODEC)
+        self.assertLess(len(binary) * 3, len(serialize_message(message, codec=JSON_CODEC)))
+        self.assertEqual(binary[4] >> 4, BINARY_CODEC.code)
+
+    def test_custom_message_id(self):
+        message = self.protocol.create_heartbeat_message()
+        message.message_id = "reply-to-42"
+        self.assertEqual(self._round_trip(message).message_id, "reply-to-42")
+
+    def test_rejects_malformed(self):
+        frame = bytearray(serialize_message(self.protocol.create_heartbeat_message(), codec=BINARY_CODEC))
+        with self.assertRaises(ValueError):
+            deserialize_message(bytes(frame[:-1]))
+        frame[4] = (9 << 4) | (frame[4] & 0x0f)      # unregistered codec
+        with self.assertRaises(ValueError):
+            deserialize_message(bytes(frame))
+
+
+class TestCodecNegotiation(unittest.TestCase):
+    """Test picking a codec at JOIN_GAME"""
+
+    def test_negotiate(self):
+        self.assertIs(negotiate_codec(None), JSON_CODEC)
+        self.assertIs(negotiate_codec(["binary", "json"]), BINARY_CODEC)
+        self.assertIs(negotiate_codec(["msgpack", "binary"]), BINARY_CODEC)
+        self.assertIs(negotiate_codec(["binary"], supported=["json"]), JSON_CODEC)
+
+    def test_join_message_lists_codecs(self):
+        message = MessageProtocol(1).create_join_game_message("Alice", "Deck", codecs=("binary", "json"))
+        self.assertEqual(message.type, MessageType.JOIN_GAME)
+        self.assertEqual(message.data["codecs"], ["binary", "json"])
+
+    def test_register_conflict(self):
+        class Clash(MessageCodec):
+            name = "clash"
+            code = BINARY_CODEC.code
+        with self.assertRaises(ValueError):
+            register_codec(Clash())
+
+
+if __name__ == '__main__':
+    unittest.main()
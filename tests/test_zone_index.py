@@ -0,0 +1,86 @@
+"""
+Test suite for the GameState zone index.
+"""
+
+import unittest
+import copy
+import os
+import random
+import sys
+
+# Add the project root directory to sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.card_engine import Card, Permanent, ActionResult
+from engine.game_state import GameState, PlayerState
+from engine.zones import ZoneList
+
+
+def _forest(i, owner=0):
+    # Clones share an id, as in real decks
+    return Card(id="forest", name="Forest", types=["Land"], mana_cost=0,
+                owner_id=owner, controller_id=owner)
+
+
+class TestZoneIndex(unittest.TestCase):
+    """Test that the zone index follows zone mutations"""
+
+    def setUp(self):
+        self.p0 = PlayerState(player_id=0, name="P0")
+        self.p1 = PlayerState(player_id=1, name="P1")
+        self.p0.library = [_forest(i) for i in range(10)]
+        self.game = GameState(players=[self.p0, self.p1])
+
+    def test_zones_are_indexed_lists(self):
+        self.assertIsInstance(self.p0.hand, ZoneList)
+        card = self.p0.library[3]
+        self.assertEqual(self.game.zones.zone_of(card), 'library')
+        self.p0.draw(10)
+        self.assertEqual(self.game.zones.zone_of(card), 'hand')
+
+    def test_identity_not_equality(self):
+        self.p0.draw(2)
+        first, second = self.p0.hand
+        self.assertEqual(first, second)
+        self.assertEqual(self.game.play_land(0, second), ActionResult.OK)
+        self.assertIs(self.game.zones.permanent_for(second).card, second)
+        self.assertIsNone(self.game.zones.permanent_for(first))
+        self.assertTrue(self.game.zones.in_zone(first, 0, 'hand'))
+
+    def test_find_by_id(self):
+        self.p0.draw(1)
+        self.assertIsNone(self.game.zones.find_permanent("forest"))
+        self.game.play_land(0, self.p0.hand[0])
+        perm = self.game.zones.find_permanent("forest")
+        self.assertIsInstance(perm, Permanent)
+        self.assertIs(self.game.zones.find_card("forest", ('battlefield', 'library')), perm.card)
+
+    def test_shuffle_and_reassignment(self):
+        random.shuffle(self.p0.library)
+        self.assertTrue(all(self.game.zones.zone_of(c) == 'library' for c in self.p0.library))
+        old = list(self.p0.library)
+        self.p0.library = old[:5]
+        self.assertIsNone(self.game.zones.locate(old[7]))
+        self.assertEqual(self.game.zones.zone_of(old[2]), 'library')
+
+    def test_move_card(self):
+        card = self.p0.library[0]
+        perm = self.game.move_card(card, 'battlefield')
+        self.assertNotIn(card, [c for c in self.p0.library if c is card])
+        self.assertIs(self.game.zones.permanent_for(card), perm)
+        self.game.move_card(card, 'graveyard')
+        self.assertEqual(self.p0.battlefield, [])
+        self.assertEqual(self.game.zones.zone_of(card), 'graveyard')
+
+    def test_deepcopy_gets_own_index(self):
+        self.p0.draw(3)
+        clone = copy.deepcopy(self.game)
+        self.assertIsNot(clone.zones, self.game.zones)
+        self.assertTrue(clone.zones.in_zone(clone.players[0].hand[0], 0, 'hand'))
+        self.assertIsNone(clone.zones.locate(self.p0.hand[0]))
+        clone.players[0].hand.pop()
+        self.assertEqual(len(self.p0.hand), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
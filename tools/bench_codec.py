@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Wire Codec Benchmark
+
+Encodes and decodes a four-player game state update (plus the small action
+messages that make up the rest of the traffic) with every registered codec,
+and reports frame size and encode/decode throughput.
+
+    python tools/bench_codec.py [--players 4] [--permanents 25] [--rounds 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.message_protocol import (
+    MessageProtocol, available_codecs, decode_message_body, get_codec, serialize_message
+)
+
+
+def build_state(players: int, permanents: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    phases = ["untap", "upkeep", "draw", "main1", "combat", "main2", "end"]
+    state = {"turn": 12, "phase": rng.choice(phases), "active_player": 0, "version": 431, "players": []}
+    for pid in range(players):
+        battlefield = []
+        for n in range(permanents):
+            card = {"id": pid * 1000 + n, "name": f"Card {rng.randrange(5000)}",
+                    "tapped": rng.random() < 0.3, "owner": pid, "controller": pid}
+            if rng.random() < 0.4:
+                card["power"], card["toughness"] = rng.randrange(7), rng.randrange(1, 7)
+            if rng.random() < 0.1:
+                card["counters"] = {"+1/+1": rng.randrange(1, 4)}
+            battlefield.append(card)
+        state["players"].append({
+            "id": pid, "name": f"Player {pid}", "life": rng.randrange(1, 41),
+            "zones": {
+                "hand": [pid * 1000 + 500 + n for n in range(7)],
+                "battlefield": battlefield,
+                "graveyard": [pid * 1000 + 700 + n for n in range(rng.randrange(15))],
+                "library": 99 - permanents,
+            },
+            "mana_pool": {"W": 0, "U": 1, "B": 0, "R": 2, "G": 0, "C": 0},
+            "commander_damage": {str(other): 0 for other in range(players) if other != pid},
+        })
+    return state
+
+
+def build_messages(players: int, permanents: int) -> dict:
+    protocol = MessageProtocol(1)
+    return {
+        "state": protocol.create_game_state_update_message(build_state(players, permanents)),
+        "play": protocol.create_play_card_message("1042", "hand", "battlefield", player_id=1),
+        "heartbeat": protocol.create_heartbeat_message(),
+        "phase": protocol.create_phase_change_message("combat", 2),
+    }
+
+
+def bench(codec, message, rounds: int):
+    """Frame size and encode/decode rates (messages per second) for one message."""
+    frame = serialize_message(message, codec=codec)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        serialize_message(message, codec=codec)
+    encode = time.perf_counter() - start
+    body = memoryview(frame)[4:]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        decode_message_body(body)
+    decode = time.perf_counter() - start
+    return len(frame), rounds / encode, rounds / decode
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark wire codecs")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--permanents", type=int, default=25)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    messages = build_messages(args.players, args.permanents)
+    print(f"{args.players} players, {args.permanents} permanents each, {args.rounds} rounds")
+    print(f"  {'message':10} {'codec':8} {'bytes':>7} {'encode/s':>10} {'decode/s':>10}")
+    for kind, message in messages.items():
+        for name in available_codecs():
+            size, encode, decode = bench(get_codec(name), message, args.rounds)
+            print(f"  {kind:10} {name:8} {size:7} {encode:10.0f} {decode:10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Frame Decoding Benchmark
+
+Pushes a stream of length-prefixed frames through the receive path in
+4096-byte reads and measures throughput of network.framing.FrameDecoder
+against the old `buffer += data` / `buffer = buffer[4+length:]` loop. Large
+frames (big game state updates) are where the old loop goes quadratic.
+
+    python tools/bench_framing.py [--frame-size 262144] [--frames 40] [--read-size 4096]
+    python tools/bench_framing.py --socket      # real socketpair + recv_into
+"""
+
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from network.framing import FrameDecoder, encode_frame
+
+
+def build_stream(frame_size: int, frames: int) -> bytes:
+    return encode_frame(b"x" * frame_size) * frames
+
+
+def bench_concat(stream: bytes, read_size: int) -> float:
+    """The old receive loop."""
+    start = time.perf_counter()
+    buffer = b""
+    count = 0
+    for offset in range(0, len(stream), read_size):
+        buffer += stream[offset:offset + read_size]
+        while len(buffer) >= 4:
+            length = int.from_bytes(buffer[:4], byteorder='big')
+            if len(buffer) < 4 + length:
+                break
+            message_data = buffer[:4 + length]
+            buffer = buffer[4 + length:]
+            body = message_data[4:4 + length]     # deserialize_message sliced again
+            count += 1
+    return time.perf_counter() - start
+
+
+def bench_decoder(stream: bytes, read_size: int) -> float:
+    """FrameDecoder, filled the way recv_into / BufferedProtocol fill it."""
+    view = memoryview(stream)
+    decoder = FrameDecoder()
+    start = time.perf_counter()
+    count = 0
+    for offset in range(0, len(stream), read_size):
+        chunk = view[offset:offset + read_size]
+        decoder.get_buffer(read_size)[:len(chunk)] = chunk
+        decoder.buffer_updated(len(chunk))
+        for _ in decoder.frames():
+            count += 1
+    return time.perf_counter() - start
+
+
+def bench_socket(stream: bytes) -> float:
+    left, right = socket.socketpair()
+    sender = threading.Thread(target=lambda: (left.sendall(stream), left.shutdown(socket.SHUT_WR)))
+    decoder = FrameDecoder()
+    start = time.perf_counter()
+    sender.start()
+    while decoder.recv_into(right):
+        for _ in decoder.frames():
+            pass
+    elapsed = time.perf_counter() - start
+    sender.join()
+    left.close()
+    right.close()
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark frame decoding")
+    parser.add_argument("--frame-size", type=int, default=256 * 1024)
+    parser.add_argument("--frames", type=int, default=40)
+    parser.add_argument("--read-size", type=int, default=4096)
+    parser.add_argument("--socket", action="store_true", help="also time a real socketpair")
+    args = parser.parse_args(argv)
+
+    stream = build_stream(args.frame_size, args.frames)
+    megabytes = len(stream) / 1e6
+    concat = bench_concat(stream, args.read_size)
+    decoder = bench_decoder(stream, args.read_size)
+
+    print(f"{args.frames} frames of {args.frame_size} bytes ({megabytes:.1f} MB), {args.read_size}-byte reads")
+    print(f"  bytes concat     : {megabytes / concat:8.1f} MB/s")
+    print(f"  FrameDecoder     : {megabytes / decoder:8.1f} MB/s")
+    print(f"  speedup          : {concat / decoder:8.1f}x")
+    if args.socket:
+        print(f"  socket recv_into : {megabytes / bench_socket(stream):8.1f} MB/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Slotted Engine Object Benchmark
+
+Compares the slotted Permanent, StackItem, CombatState, AbilityInstance,
+TriggerEvent and ContinuousEffect with equivalent __dict__-based dataclasses
+(same fields, built on the fly): bytes per instance and attribute read time.
+
+    python tools/bench_slots.py [--count 20000] [--reads 1000000]
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+import tracemalloc
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.ability_engine import AbilityInstance, TriggerCondition, TriggerEvent
+from engine.card_engine import Card, Permanent
+from engine.combat import CombatState
+from engine.layers import ContinuousEffect, Layer
+from engine.stack import StackItem
+
+
+def dict_twin(cls):
+    """A plain (__dict__) dataclass with cls's fields, for comparison."""
+    fields = [(f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory,
+                                                  init=f.init, compare=f.compare))
+              for f in dataclasses.fields(cls)]
+    return dataclasses.make_dataclass(cls.__name__ + 'Dict', fields)
+
+
+def bytes_per_instance(factory, count: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return used / count
+
+
+def read_time(obj, reads: int) -> float:
+    start = time.perf_counter()
+    for _ in range(reads // 4):
+        obj.tapped; obj.damage_marked; obj.summoning_sick; obj.card
+    return (time.perf_counter() - start) / reads * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark slotted engine objects")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--reads", type=int, default=1000000)
+    args = parser.parse_args(argv)
+
+    card = Card(id="bear", name="Grizzly Bears", types=["Creature"], mana_cost=2, power=2, toughness=2)
+    factories = {
+        Permanent: lambda cls: cls(card=card),
+        StackItem: lambda cls: cls(source=card, label="Spell"),
+        CombatState: lambda cls: cls(),
+        AbilityInstance: lambda cls: cls(source_card=card, controller=0),
+        TriggerEvent: lambda cls: cls(condition=TriggerCondition.ENTERS_BATTLEFIELD, affected=card),
+        ContinuousEffect: lambda cls: cls(source_id="anthem", layer=Layer.POWER_TOUGHNESS),
+    }
+
+    print(f"{'class':<18}{'slotted':>10}{'__dict__':>10}  bytes/instance ({args.count} each)")
+    for cls, make in factories.items():
+        twin = dict_twin(cls)
+        slotted = bytes_per_instance(lambda: make(cls), args.count)
+        plain = bytes_per_instance(lambda: make(twin), args.count)
+        print(f"{cls.__name__:<18}{slotted:>10.0f}{plain:>10.0f}")
+
+    slotted = read_time(Permanent(card=card), args.reads)
+    plain = read_time(dict_twin(Permanent)(card=card), args.reads)
+    print(f"Permanent attribute read: {slotted:.1f} ns slotted, {plain:.1f} ns __dict__")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Trigger Dispatch Benchmark
+
+Registers 200 ETB triggers on battlefield creatures and measures how long
+AbilityEngine.emit_event takes per event, compared with calling every
+listener for the condition (the old, unindexed dispatch).
+
+    python tools/bench_triggers.py [--triggers 200] [--events 20000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.ability_engine import AbilityEngine, AbilityInstance, TriggerCondition
+from engine.card_engine import Card, Permanent
+from engine.game_state import GameState, PlayerState
+from engine.keywords import TriggeredAbility
+
+
+def build_board(triggers: int):
+    players = [PlayerState(player_id=0, name="P0"), PlayerState(player_id=1, name="P1")]
+    game = GameState(players=players)
+    engine = AbilityEngine(game)
+    cards = []
+    for i in range(triggers):
+        card = Card(id=f"token{i}", name=f"Token {i}", types=["Creature"], mana_cost=0,
+                    power=1, toughness=1, owner_id=i % 2, controller_id=i % 2)
+        ability = TriggeredAbility(kind='triggered', raw_text="", trigger='ETB', effect_text="")
+        engine._register_trigger_listener(
+            AbilityInstance(source_card=card, ability_def=ability, controller=i % 2))
+        players[i % 2].battlefield.append(Permanent(card=card))
+        cards.append(card)
+    return engine, cards
+
+
+def bench_indexed(engine, cards, events: int) -> float:
+    start = time.perf_counter()
+    for i in range(events):
+        engine.emit_event(TriggerCondition.ENTERS_BATTLEFIELD, affected=cards[i % len(cards)])
+        engine.triggered_queue.clear()
+    return time.perf_counter() - start
+
+
+def bench_fan_out(engine, cards, events: int) -> float:
+    from engine.ability_engine import TriggerEvent
+    listeners = [l for bucket in engine.trigger_listeners[TriggerCondition.ENTERS_BATTLEFIELD].values()
+                 for l in bucket]
+    start = time.perf_counter()
+    for i in range(events):
+        event = TriggerEvent(condition=TriggerCondition.ENTERS_BATTLEFIELD, affected=cards[i % len(cards)])
+        for listener in listeners:
+            listener(event)
+        engine.triggered_queue.clear()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark trigger dispatch")
+    parser.add_argument("--triggers", type=int, default=200)
+    parser.add_argument("--events", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    engine, cards = build_board(args.triggers)
+    indexed = bench_indexed(engine, cards, args.events)
+    fan_out = bench_fan_out(engine, cards, max(1, args.events // 10)) * 10
+
+    per_indexed = indexed / args.events * 1e6
+    per_fan_out = fan_out / args.events * 1e6
+    print(f"{args.triggers} registered triggers, {args.events} ETB events")
+    print(f"  indexed dispatch : {per_indexed:8.2f} us/event")
+    print(f"  call every       : {per_fan_out:8.2f} us/event (extrapolated)")
+    print(f"  speedup          : {per_fan_out / per_indexed:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
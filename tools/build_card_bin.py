@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Build the Binary Card Database
+
+Compiles data/cards/card_db_full.json (or card_db.json) into
+data/cards/card_db.bin. engine.card_db.load_card_db prefers the binary file
+whenever it is at least as new as the JSON source, so re-run this after
+refreshing the card data.
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.card_bin import compile_card_db, DEFAULT_BIN_PATH
+
+
+def main():
+    full = os.path.join('data', 'cards', 'card_db_full.json')
+    base = os.path.join('data', 'cards', 'card_db.json')
+    src = sys.argv[1] if len(sys.argv) > 1 else (full if os.path.exists(full) else base)
+    if not os.path.exists(src):
+        print(f"❌ Card database not found: {src}")
+        return 1
+    count = compile_card_db(src, DEFAULT_BIN_PATH)
+    size_kb = os.path.getsize(DEFAULT_BIN_PATH) / 1024
+    print(f"✅ Compiled {count} cards -> {DEFAULT_BIN_PATH} ({size_kb:.1f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
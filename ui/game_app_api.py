@@ -106,6 +106,14 @@ class GameAppAPI:
         
         return info
         
+    def hand_playability(self, player=None, cards=None):
+        """Evaluate the whole hand in one pass (mask + reasons) for highlighting."""
+        from engine.playability import evaluate_hand
+        if player is None:
+            player = self.get_current_player()
+        current_phase = getattr(self.controller, 'current_phase', 'main1')
+        return evaluate_hand(player, self.game, phase=current_phase, cards=cards)
+
     def can_play_card(self, card):
         """Check if a card can be played from hand."""
         try:
@@ -136,46 +144,9 @@ class GameAppAPI:
             except:
                 pass  # Continue with basic checks if validation fails
             
-            card_types = getattr(card, 'types', [])
-            
-            # Land checks
-            if "Land" in card_types:
-                # Check if we can play a land this turn
-                lands_played = getattr(self.game, 'land_played_this_turn', {}).get(player.player_id, False)
-                if lands_played:
-                    return False, "Already played a land this turn"
-                return True, "Can play land"
-            
-            # Spell checks with enhanced mana validation
-            mana_cost = getattr(card, 'mana_cost', 0)
-            mana_cost_str = getattr(card, 'mana_cost_str', '')
-            
-            # Use enhanced mana cost parsing
-            if hasattr(player, 'mana_pool'):
-                from engine.mana import parse_mana_cost
-                cost_dict = parse_mana_cost(mana_cost_str if mana_cost_str else str(mana_cost))
-                if not player.mana_pool.can_pay(cost_dict):
-                    return False, "Insufficient mana"
-            else:
-                # No mana pool - check total mana
-                total_mana = getattr(player, 'total_mana', 0)
-                if mana_cost > total_mana:
-                    return False, f"Need {mana_cost} mana, have {total_mana}"
-            
-            # Enhanced phase/timing checks with keyword awareness
-            current_phase = getattr(self.controller, 'current_phase', 'main1')
-            
-            # Check for flash
-            try:
-                keywords = getattr(card, 'keywords', {})
-                has_flash = 'flash' in [k.lower() for k in keywords.keys()] if keywords else False
-                if not has_flash and "Sorcery" in card_types and current_phase not in ['main1', 'main2']:
-                    return False, "Sorceries can only be played during main phases"
-            except:
-                if "Sorcery" in card_types and current_phase not in ['main1', 'main2']:
-                    return False, "Sorceries can only be played during main phases"
-            
-            return True, "Card can be played"
+            # Land drop, mana and timing checks share the batched hand evaluation
+            result = self.hand_playability(player, cards=[card])
+            return bool(result.mask[0]), result.reasons[0]
             
         except Exception as e:
             return False, f"Error checking playability: {e}"
@@ -1490,13 +1461,11 @@ class GameAppAPI:
             from engine.mana import ManaPool
             ps.mana_pool = ManaPool()
         pool = ps.mana_pool
-        from engine.mana import parse_mana_cost
-        cost_dict = parse_mana_cost(getattr(card, 'mana_cost_str', None))
-        if not cost_dict:
-            generic_need = card.mana_cost if isinstance(card.mana_cost, int) else 0
-            if generic_need:
-                cost_dict = {'G': generic_need}
-        colored_needs = {c: n for c, n in cost_dict.items() if c in ('W', 'U', 'B', 'R', 'G') and n > 0}
+        from engine.mana import GENERIC_KEY, card_cost
+        cost = card_cost(card)   # cached vector, shared by every copy of the card
+        if not cost.mana_value and isinstance(card.mana_cost, int):
+            cost = cost.with_generic(card.mana_cost)
+        colored_needs = {c: cost.get(c) for c in ('W', 'U', 'B', 'R', 'G') if cost.get(c) > 0}
         def land_color(perm):
             n = perm.card.name.lower()
             for t, c in [('plains', 'W'), ('island', 'U'), ('swamp', 'B'), ('mountain', 'R'), ('forest', 'G')]:
@@ -1514,7 +1483,7 @@ class GameAppAPI:
                 untapped.remove(found)
                 need -= 1
             colored_needs[color] = need
-        remaining = cost_dict.get('G', 0) + sum(rem for rem in colored_needs.values() if rem > 0)
+        remaining = cost.get(GENERIC_KEY) + sum(rem for rem in colored_needs.values() if rem > 0)
         for land in list(untapped):
             if remaining <= 0:
                 break
@@ -1522,9 +1491,9 @@ class GameAppAPI:
             self.game.tap_for_mana(0, land)
             pool.add(sym, 1)
             remaining -= 1
-        if not pool.can_pay(cost_dict):
+        if not pool.can_pay(cost):
             return
-        pool.pay(cost_dict)
+        pool.pay(cost)
         self.game.cast_spell(0, card)
 
     def _find_perm(self, card_id):